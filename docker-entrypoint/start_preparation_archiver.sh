@@ -0,0 +1,3 @@
+#!/bin/sh
+
+python -m preparation_api.entrypoints.preparation_archiver
@@ -1,5 +1,10 @@
 """Inbound adapters package initialization"""
 
 from .payment_closed import PaymentClosedHandler, PaymentClosedListener
+from .preparation_changed import PreparationChangedListener
 
-__all__ = ["PaymentClosedHandler", "PaymentClosedListener"]
+__all__ = [
+    "PaymentClosedHandler",
+    "PaymentClosedListener",
+    "PreparationChangedListener",
+]
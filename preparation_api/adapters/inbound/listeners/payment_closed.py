@@ -1,21 +1,36 @@
 """Listener for payment closed events from SQS"""
 
+import asyncio
 import json
 import logging
-from typing import Callable
+import random
+from typing import Any, Callable
 
 from aioboto3 import Session as AIOBoto3Session
+from botocore.exceptions import BotoCoreError
 from botocore.exceptions import ClientError as BotoCoreClientError
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from preparation_api.application.commands import CreatePreparationFromPaymentCommand
 from preparation_api.application.use_cases import CreatePreparationFromPaymentUseCase
+from preparation_api.domain.exceptions import AlreadyExists
 from preparation_api.infrastructure.config import PaymentClosedListenerSettings
 from preparation_api.infrastructure.orm import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Most entries SQS accepts in a single DeleteMessageBatch or
+# ChangeMessageVisibilityBatch call
+MAX_BATCH_ENTRIES = 10
+
+# Errors of an SQS call, either returned by SQS or raised before getting an
+# answer, such as the endpoint being unreachable
+SQS_ERRORS = (BotoCoreClientError, BotoCoreError)
+
+# Longest visibility timeout SQS accepts, in seconds
+MAX_VISIBILITY_TIMEOUT = 43_200
+
 
 class PaymentClosedMessage(BaseModel):
     """Model for payment closed SQS message"""
@@ -23,6 +38,19 @@ class PaymentClosedMessage(BaseModel):
     payment_id: str = Field(description="Unique identifier for the closed payment")
 
 
+class InvalidPaymentClosedMessage(Exception):
+    """If a payment closed message body cannot be parsed"""
+
+    def __init__(self, message="Invalid payment closed message"):
+        super().__init__(message)
+
+
+# Errors a message fails with every time it is handled, such as a malformed body,
+# so they are not retried. Any other error, such as the Order API or the database
+# being unavailable, or a bug on our side, is retried with backoff.
+PERMANENT_ERRORS: tuple[type[Exception], ...] = (InvalidPaymentClosedMessage,)
+
+
 class PaymentClosedHandler:
     """Handler for processing payment closed messages"""
 
@@ -35,88 +63,494 @@ class PaymentClosedHandler:
         self.use_case_factory = use_case_factory
 
     async def handle(self, message):
-        """Handle the payment closed message"""
+        """Handle the payment closed message
+
+        The message is left for the listener to delete along with the rest of its
+        batch. A payment whose preparation already exists was delivered again, so
+        its message is handled as well.
+
+        :raises InvalidPaymentClosedMessage: If the message body cannot be parsed
+        """
 
         body = await message.body
         message_id = await message.message_id
         logger.info("Received message: %s: %s", message_id, body)
-        async with self.session_manager.session() as db_session:
-            use_case = self.use_case_factory(db_session)
+        try:
             body_dict = json.loads(body)
             payment_message = PaymentClosedMessage.model_validate_json(
                 body_dict["Message"]
             )
+        except (ValueError, KeyError, TypeError) as error:
+            raise InvalidPaymentClosedMessage(
+                f"Invalid payment closed message ID {message_id}: {error}"
+            ) from error
 
-            command = CreatePreparationFromPaymentCommand(
-                payment_id=payment_message.payment_id
-            )
+        command = CreatePreparationFromPaymentCommand(
+            payment_id=payment_message.payment_id
+        )
+
+        async with self.session_manager.session() as db_session:
+            use_case = self.use_case_factory(db_session)
+            try:
+                await use_case.execute(command=command)
+            except AlreadyExists:
+                logger.info(
+                    "Payment ID %s of message ID: %s is already prepared",
+                    command.payment_id,
+                    message_id,
+                )
+                return
+
+            logger.info("Successfully processed message ID: %s", message_id)
 
-            await use_case.execute(command=command)
-            await message.delete()
-            logger.info("Successfully processed and deleted message ID: %s", message_id)
+
+class _ReceivedBatch:
+    """Messages received together, deleted together once all of them are handled"""
+
+    def __init__(self, sequence_count: int, in_flight: dict[str, str]):
+        self.pending_sequences = sequence_count
+        # Receipt handles of the messages the heartbeat keeps in flight
+        self.in_flight = in_flight
+        self.to_delete: list[tuple[str, Any]] = []
+        self.heartbeat: asyncio.Task | None = None
 
 
 class PaymentClosedListener:
-    """Listener for handling payment closed events from SQS"""
+    """Listener for handling payment closed events from SQS
+
+    The listener is a pipeline: RECEIVERS long-poll the queue concurrently and
+    put what they receive on a bounded internal queue, which
+    MAX_CONCURRENT_MESSAGES workers drain, each handling a message at a time in a
+    session of its own. The next batches are thus already being received while
+    the previous ones are handled, and the receivers stop polling while the
+    internal queue is full.
+
+    Messages of the same FIFO message group are queued and handled together, one
+    after the other in the order received, and a message failing does not affect
+    the others. Once every message of a received batch is handled, the batch is
+    deleted from the queue with DeleteMessageBatch calls instead of a call per
+    message. Until then the messages of its groups stay in flight, so SQS does not
+    hand later messages of those groups to another receiver.
+
+    While a batch is queued and handled, a heartbeat extends the visibility
+    timeout of its messages every VISIBILITY_HEARTBEAT_SECONDS, so a slow message
+    is not received again by another replica. The visibility timeout can thus be
+    kept short, for the messages of a crashed replica to be delivered again soon.
+
+    A message failing with a transient error is left in the queue, its visibility
+    timeout set to an exponential backoff with jitter so it is received again
+    later, along with the messages of its group after it to keep their order.
+    The rest of the batch is not held up by the retry. A malformed message, or one
+    failing MAX_RECEIVE_COUNT times, is sent to the dead-letter queue and deleted.
+    A payment delivered again once already prepared is deleted like any other.
+    """
 
     def __init__(
         self,
         session: AIOBoto3Session,
         handler: PaymentClosedHandler,
         settings: PaymentClosedListenerSettings,
+        jitter: Callable[[float, float], float] = random.uniform,
     ):
         self.session = session
         self.handler = handler
         self.queue_name = settings.QUEUE_NAME
         self.wait_time = settings.WAIT_TIME_SECONDS
         self.visibility_timeout = settings.VISIBILITY_TIMEOUT_SECONDS
+        self.visibility_heartbeat = settings.VISIBILITY_HEARTBEAT_SECONDS
         self.max_messages = settings.MAX_NUMBER_OF_MESSAGES_PER_BATCH
+        self.max_concurrent_messages = settings.MAX_CONCURRENT_MESSAGES
+        self.receivers = settings.RECEIVERS
+        self.max_pending_sequences = settings.MAX_PENDING_SEQUENCES
+        self.dead_letter_queue_name = settings.DEAD_LETTER_QUEUE_NAME
+        self.max_receive_count = settings.MAX_RECEIVE_COUNT
+        self.retry_base_delay = settings.RETRY_BASE_DELAY_SECONDS
+        self.retry_max_delay = settings.RETRY_MAX_DELAY_SECONDS
+        self._jitter = jitter
+        self._dead_letter_queue = None
+        self._heartbeats: set[asyncio.Task] = set()
 
     async def listen(self, shutdown_event=None):
-        """Listen for payment closed events and process them"""
+        """Listen for payment closed events and process them
+
+        On shutdown the receivers stop polling and the messages already received
+        are handled and deleted before returning. A receiver or a worker stopping
+        on an error stops the listener, raising the error.
+        """
 
         async with self.session.resource("sqs") as sqs_client:
             logger.info("Listening for messages on queue: %s", self.queue_name)
             queue = await sqs_client.get_queue_by_name(QueueName=self.queue_name)
-            while True:
-                if shutdown_event and shutdown_event.shutdown:
-                    logger.info("Shutdown requested, stopping listener")
-                    break
+            if self.dead_letter_queue_name:
+                self._dead_letter_queue = await sqs_client.get_queue_by_name(
+                    QueueName=self.dead_letter_queue_name
+                )
+            else:
+                logger.warning(
+                    "No dead-letter queue configured, messages failing permanently "
+                    "will be deleted"
+                )
+
+            pending: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_sequences)
+            try:
+                # Any of the tasks failing cancels the others, so a dead worker
+                # does not leave the receivers waiting on a full queue
+                async with asyncio.TaskGroup() as task_group:
+                    workers = [
+                        task_group.create_task(self._work(queue=queue, pending=pending))
+                        for _ in range(self.max_concurrent_messages)
+                    ]
+                    receivers = [
+                        task_group.create_task(
+                            self._receive_until_shutdown(
+                                queue=queue,
+                                pending=pending,
+                                shutdown_event=shutdown_event,
+                            )
+                        )
+                        for _ in range(self.receivers)
+                    ]
+
+                    await asyncio.wait(receivers)
+                    logger.info("Shutdown requested, handling the received messages")
+                    await pending.join()
+                    for worker in workers:
+                        worker.cancel()
+            finally:
+                heartbeats = list(self._heartbeats)
+                for heartbeat in heartbeats:
+                    heartbeat.cancel()
+
+                await asyncio.gather(*heartbeats, return_exceptions=True)
+
+    async def _receive_until_shutdown(
+        self, queue, pending: asyncio.Queue, shutdown_event=None
+    ):
+        while not (shutdown_event and shutdown_event.shutdown):
+            messages = await self._receive(queue=queue, pending=pending)
+            if not messages:
+                logger.debug("No messages received in %d seconds", self.wait_time)
+
+        logger.info("Shutdown requested, stopping receiver")
 
-                messages = await self._consume(queue=queue)
-                if not messages:
-                    logger.debug("No messages received in %d seconds", self.wait_time)
-                    continue
+    async def _receive(self, queue, pending: asyncio.Queue) -> list:
+        """Receive a batch of messages and queue it for the workers
+
+        Waits while the internal queue is full, which keeps the receiver from
+        polling for more messages than the workers keep up with.
+        """
 
-    async def _consume(self, queue):
         try:
             messages = await queue.receive_messages(
                 MessageAttributeNames=["All"],
+                MessageSystemAttributeNames=[
+                    "MessageGroupId",
+                    "ApproximateReceiveCount",
+                ],
                 MaxNumberOfMessages=self.max_messages,
                 WaitTimeSeconds=self.wait_time,
                 VisibilityTimeout=self.visibility_timeout,
             )
 
-        except BotoCoreClientError as error:
+        except SQS_ERRORS as error:
             logger.error(
                 "Couldn't receive messages from queue: %s", queue, exc_info=True
             )
 
             raise error
 
+        if not messages:
+            return messages
+
+        sequences = []
+        groups: dict[str, list] = {}
+        in_flight = {}
         for msg in messages:
-            message_id = await msg.message_id
+            in_flight[await msg.message_id] = await msg.receipt_handle
+            attributes = await msg.attributes
+            group_id = (attributes or {}).get("MessageGroupId")
+            if group_id is None:
+                sequences.append([msg])
+            elif group_id in groups:
+                groups[group_id].append(msg)
+            else:
+                groups[group_id] = [msg]
+                sequences.append(groups[group_id])
+
+        batch = _ReceivedBatch(sequence_count=len(sequences), in_flight=in_flight)
+        batch.heartbeat = asyncio.create_task(
+            self._extend_visibility(queue=queue, batch=batch)
+        )
+        self._heartbeats.add(batch.heartbeat)
+        batch.heartbeat.add_done_callback(self._heartbeats.discard)
+        for sequence in sequences:
+            await pending.put((batch, sequence))
+
+        return messages
+
+    async def _work(self, queue, pending: asyncio.Queue):
+        while True:
+            batch, sequence = await pending.get()
             try:
-                await self.handler.handle(message=msg)
+                await self._handle_sequence(queue, batch, sequence)
             except Exception:  # pylint: disable=W0718
+                logger.error("Failed to settle a received batch", exc_info=True)
+            finally:
+                pending.task_done()
+
+    async def _handle_sequence(self, queue, batch: _ReceivedBatch, sequence: list):
+        """Handle a message sequence, deleting its batch once it is the last one
+
+        A message the sequence failed on before it was settled is left to be
+        received again once its visibility timeout expires.
+        """
+
+        try:
+            await self._process_in_order(queue, batch, sequence)
+        except Exception:  # pylint: disable=W0718
+            logger.error(
+                "Failed to process a sequence of %d messages",
+                len(sequence),
+                exc_info=True,
+            )
+        finally:
+            batch.pending_sequences -= 1
+            if not batch.pending_sequences and batch.heartbeat is not None:
+                batch.heartbeat.cancel()
+
+        if not batch.pending_sequences:
+            await self._delete(queue=queue, messages=batch.to_delete)
+
+    async def _process_in_order(self, queue, batch: _ReceivedBatch, sequence: list):
+        for index, msg in enumerate(sequence):
+            message_id = await msg.message_id
+            if await self._process(msg):
+                batch.to_delete.append((message_id, msg))
+                continue
+
+            # The messages of the group after the failed one are retried with it,
+            # so they are still handled in order
+            retried = sequence[index:]
+            receipt_handles = [
+                (await retried_msg.message_id, await retried_msg.receipt_handle)
+                for retried_msg in retried
+            ]
+            for retried_id, _ in receipt_handles:
+                batch.in_flight.pop(retried_id, None)
+
+            delay = self._retry_delay(await self._receive_count(msg))
+            logger.warning(
+                "Retrying message IDs: %s in %d seconds",
+                ", ".join(retried_id for retried_id, _ in receipt_handles),
+                delay,
+            )
+            await self._change_visibility(queue, receipt_handles, delay)
+            return
+
+    async def _process(self, msg) -> bool:
+        """Handle a message
+
+        :return: Whether the message is done with and can be deleted, either
+            handled or sent to the dead-letter queue, rather than retried
+        :rtype: bool
+        """
+
+        message_id = await msg.message_id
+        try:
+            await self.handler.handle(message=msg)
+        except PERMANENT_ERRORS as error:
+            logger.error(
+                "Failed to process message ID: %s permanently",
+                message_id,
+                exc_info=True,
+            )
+
+            return await self._dead_letter(msg, error)
+        except Exception as error:  # pylint: disable=W0718
+            receive_count = await self._receive_count(msg)
+            if receive_count >= self.max_receive_count:
                 logger.error(
-                    "Failed to process message ID: %s",
+                    "Failed to process message ID: %s after %d attempts",
                     message_id,
+                    receive_count,
                     exc_info=True,
                 )
 
-                await msg.delete()
-                logger.warning("Deleted message ID: %s to avoid retries", message_id)
-                # TODO: Implement a dead-letter queue to handle failed messages
+                return await self._dead_letter(msg, error)
 
-        return messages
+            logger.warning(
+                "Failed to process message ID: %s on attempt %d",
+                message_id,
+                receive_count,
+                exc_info=True,
+            )
+
+            return False
+
+        return True
+
+    async def _receive_count(self, msg) -> int:
+        attributes = await msg.attributes
+        return int((attributes or {}).get("ApproximateReceiveCount", 1))
+
+    def _retry_delay(self, receive_count: int) -> int:
+        """Get the backoff before a message failing transiently is received again
+
+        The delay doubles with every attempt up to the maximum, and half of it is
+        random so the messages failing together are not all retried together.
+        """
+
+        delay = min(
+            self.retry_max_delay, self.retry_base_delay * 2 ** (receive_count - 1)
+        )
+        delay = delay / 2 + self._jitter(0, delay / 2)
+        return min(MAX_VISIBILITY_TIMEOUT, max(1, round(delay)))
+
+    async def _dead_letter(self, msg, error: Exception) -> bool:
+        """Send a message failing for good to the dead-letter queue
+
+        :return: Whether the message can be deleted, which it cannot when sending
+            it failed and it is to be retried instead
+        :rtype: bool
+        """
+
+        message_id = await msg.message_id
+        if self._dead_letter_queue is None:
+            logger.warning("Deleting message ID: %s to avoid retries", message_id)
+            return True
+
+        attributes = await msg.attributes or {}
+        message = {
+            "MessageBody": await msg.body,
+            "MessageAttributes": {
+                "SourceMessageId": {"DataType": "String", "StringValue": message_id},
+                "ErrorType": {
+                    "DataType": "String",
+                    "StringValue": type(error).__name__,
+                },
+                "ErrorMessage": {
+                    "DataType": "String",
+                    # SQS does not accept empty attribute values
+                    "StringValue": str(error)[:1024] or "-",
+                },
+            },
+        }
+
+        if self.dead_letter_queue_name.endswith(".fifo"):
+            message["MessageGroupId"] = attributes.get("MessageGroupId", message_id)
+            message["MessageDeduplicationId"] = message_id
+
+        try:
+            await self._dead_letter_queue.send_message(**message)
+        except SQS_ERRORS:
+            logger.error(
+                "Couldn't send message ID: %s to the dead-letter queue, retrying it",
+                message_id,
+                exc_info=True,
+            )
+            return False
+
+        logger.warning("Sent message ID: %s to the dead-letter queue", message_id)
+        return True
+
+    async def _extend_visibility(self, queue, batch: _ReceivedBatch):
+        """Keep extending the visibility timeout of a batch until cancelled
+
+        A failed extension is logged and tried again at the next heartbeat, the
+        message being received again if its visibility timeout expires before.
+        Messages being retried are left to their backoff.
+        """
+
+        while True:
+            await asyncio.sleep(self.visibility_heartbeat)
+            receipt_handles = list(batch.in_flight.items())
+            await self._change_visibility(
+                queue, receipt_handles, self.visibility_timeout
+            )
+            logger.debug(
+                "Extended the visibility of %d messages to %d seconds",
+                len(receipt_handles),
+                self.visibility_timeout,
+            )
+
+    async def _change_visibility(
+        self, queue, receipt_handles: list[tuple[str, str]], timeout: int
+    ):
+        """Set the visibility timeout of messages in batches
+
+        :param receipt_handles: The message ID and receipt handle of each message
+        :type receipt_handles: list[tuple[str, str]]
+        :param timeout: The seconds before the messages are visible again
+        :type timeout: int
+        """
+
+        for start in range(0, len(receipt_handles), MAX_BATCH_ENTRIES):
+            batch = receipt_handles[start : start + MAX_BATCH_ENTRIES]
+            entries = [
+                {
+                    "Id": str(index),
+                    "ReceiptHandle": receipt_handle,
+                    "VisibilityTimeout": timeout,
+                }
+                for index, (_, receipt_handle) in enumerate(batch)
+            ]
+
+            try:
+                response = await queue.change_message_visibility_batch(Entries=entries)
+            except SQS_ERRORS:
+                logger.warning(
+                    "Couldn't change the visibility of message IDs: %s",
+                    ", ".join(message_id for message_id, _ in batch),
+                    exc_info=True,
+                )
+                continue
+
+            for failure in response.get("Failed", []):
+                message_id, _ = batch[int(failure["Id"])]
+                logger.warning(
+                    "Couldn't change the visibility of message ID: %s code=%s "
+                    "sender_fault=%s %s",
+                    message_id,
+                    failure.get("Code"),
+                    failure.get("SenderFault"),
+                    failure.get("Message", ""),
+                )
+
+    async def _delete(self, queue, messages: list[tuple[str, Any]]):
+        """Delete handled messages from the queue in batches
+
+        A message that could not be deleted is logged and received again once its
+        visibility timeout expires.
+        """
+
+        for start in range(0, len(messages), MAX_BATCH_ENTRIES):
+            batch = messages[start : start + MAX_BATCH_ENTRIES]
+            entries = [
+                {"Id": str(index), "ReceiptHandle": await msg.receipt_handle}
+                for index, (_, msg) in enumerate(batch)
+            ]
+
+            try:
+                response = await queue.delete_messages(Entries=entries)
+            except SQS_ERRORS:
+                logger.error(
+                    "Couldn't delete message IDs: %s",
+                    ", ".join(message_id for message_id, _ in batch),
+                    exc_info=True,
+                )
+                continue
+
+            failed = response.get("Failed", [])
+            for failure in failed:
+                message_id, _ = batch[int(failure["Id"])]
+                logger.error(
+                    "Couldn't delete message ID: %s code=%s sender_fault=%s %s",
+                    message_id,
+                    failure.get("Code"),
+                    failure.get("SenderFault"),
+                    failure.get("Message", ""),
+                )
+
+            logger.info(
+                "Deleted %d of %d messages", len(entries) - len(failed), len(entries)
+            )
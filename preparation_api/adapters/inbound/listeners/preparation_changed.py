@@ -0,0 +1,96 @@
+"""Listener for preparation changed notifications from Postgres"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from preparation_api.domain.ports import WaitingListCache
+from preparation_api.infrastructure.config import PreparationChangedListenerSettings
+from preparation_api.infrastructure.orm.models import PREPARATION_CHANGED_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+class PreparationChangedListener:
+    """Listener invalidating the waiting list cache when preparations change
+
+    A single connection listens to the channel notified by the preparations table
+    trigger, so writes made by any worker or process reach this worker's cache.
+    Notifications sent while the connection is down are lost, so the cache is
+    invalidated every time the connection is lost and established again. The
+    optional on_change callback is called along with every invalidation.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[asyncpg.Connection]],
+        waiting_list_cache: WaitingListCache,
+        settings: PreparationChangedListenerSettings,
+        on_change: Callable[[], None] | None = None,
+    ):
+        self.connect = connect
+        self.waiting_list_cache = waiting_list_cache
+        self.on_change = on_change
+        self.reconnect_delay = settings.RECONNECT_DELAY_SECONDS
+        self.health_check_interval = settings.HEALTH_CHECK_INTERVAL_SECONDS
+
+    async def listen(self):
+        """Listen for preparation changed notifications until cancelled"""
+
+        while True:
+            try:
+                await self._listen_on_connection()
+                logger.warning("Preparation changed listener connection closed")
+            except Exception:  # pylint: disable=W0718
+                logger.error(
+                    "Preparation changed listener connection failed", exc_info=True
+                )
+
+            self._changed()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen_on_connection(self):
+        connection = await self.connect()
+        try:
+            connection_lost = asyncio.Event()
+            connection.add_termination_listener(
+                lambda _connection: connection_lost.set()
+            )
+
+            await connection.add_listener(
+                PREPARATION_CHANGED_CHANNEL, self._on_notification
+            )
+
+            logger.info(
+                "Listening for notifications on channel: %s",
+                PREPARATION_CHANGED_CHANNEL,
+            )
+
+            # Changes committed before listening were not notified
+            self._changed()
+
+            while not connection_lost.is_set():
+                try:
+                    await asyncio.wait_for(
+                        connection_lost.wait(), timeout=self.health_check_interval
+                    )
+                except asyncio.TimeoutError:
+                    # A connection dropped without being closed only shows up
+                    # when it is used
+                    await connection.execute(
+                        "SELECT 1", timeout=self.health_check_interval
+                    )
+        finally:
+            if not connection.is_closed():
+                connection.terminate()
+
+    def _on_notification(self, _connection, _pid, _channel, _payload):
+        logger.debug("Preparations changed, invalidating the cached waiting list")
+        self._changed()
+
+    def _changed(self):
+        self.waiting_list_cache.invalidate()
+        if self.on_change is not None:
+            self.on_change()
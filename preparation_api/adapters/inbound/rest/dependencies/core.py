@@ -6,13 +6,19 @@ from typing import Annotated, AsyncIterator
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from preparation_api.adapters.inbound.rest.v1.compression import ResponseCompressor
+from preparation_api.adapters.inbound.rest.v1.waiting_list_broadcaster import (
+    WaitingListBroadcaster,
+)
 from preparation_api.application.use_cases import (
+    GetPreparationChangesUseCase,
+    GetWaitingListPageUseCase,
     GetWaitingListUseCase,
     MarkPreparationAsCompletedUseCase,
     MarkPreparationAsReadyUseCase,
     StartNextPreparationUseCase,
 )
-from preparation_api.domain.ports import PreparationRepository
+from preparation_api.domain.ports import PreparationRepository, WaitingListCache
 from preparation_api.infrastructure import factory
 
 logger = logging.getLogger(__name__)
@@ -43,47 +49,103 @@ PreparationRepositoryDep = Annotated[
 ]
 
 
+def get_waiting_list_cache(request: Request) -> WaitingListCache:
+    """Dependency that provides the WaitingListCache of this worker"""
+    return request.app.state.waiting_list_cache
+
+
+WaitingListCacheDep = Annotated[WaitingListCache, Depends(get_waiting_list_cache)]
+
+
+def get_waiting_list_broadcaster(request: Request) -> WaitingListBroadcaster:
+    """Dependency that provides the WaitingListBroadcaster of this worker"""
+    return request.app.state.waiting_list_broadcaster
+
+
+WaitingListBroadcasterDep = Annotated[
+    WaitingListBroadcaster, Depends(get_waiting_list_broadcaster)
+]
+
+
+def get_response_compressor(request: Request) -> ResponseCompressor:
+    """Dependency that provides the ResponseCompressor of this worker"""
+    return request.app.state.response_compressor
+
+
+ResponseCompressorDep = Annotated[ResponseCompressor, Depends(get_response_compressor)]
+
+
 def get_get_waiting_list_use_case(
     preparation_repository: PreparationRepositoryDep,
+    waiting_list_cache: WaitingListCacheDep,
 ) -> GetWaitingListUseCase:
     """Dependency that provides a GetWaitingListUseCase instance"""
 
     logger.debug("Providing GetWaitingListUseCase via dependency")
     return factory.get_waiting_list_use_case(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
+
+
+def get_get_waiting_list_page_use_case(
+    preparation_repository: PreparationRepositoryDep,
+) -> GetWaitingListPageUseCase:
+    """Dependency that provides a GetWaitingListPageUseCase instance"""
+
+    logger.debug("Providing GetWaitingListPageUseCase via dependency")
+    return factory.get_waiting_list_page_use_case(
+        preparation_repository=preparation_repository
+    )
+
+
+def get_get_preparation_changes_use_case(
+    preparation_repository: PreparationRepositoryDep,
+) -> GetPreparationChangesUseCase:
+    """Dependency that provides a GetPreparationChangesUseCase instance"""
+
+    logger.debug("Providing GetPreparationChangesUseCase via dependency")
+    return factory.get_preparation_changes_use_case(
         preparation_repository=preparation_repository
     )
 
 
 def get_start_next_preparation_use_case(
     preparation_repository: PreparationRepositoryDep,
+    waiting_list_cache: WaitingListCacheDep,
 ) -> StartNextPreparationUseCase:
     """Dependency that provides a StartNextPreparationUseCase instance"""
 
     logger.debug("Providing StartNextPreparationUseCase via dependency")
     return factory.get_start_next_preparation_use_case(
-        preparation_repository=preparation_repository
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
     )
 
 
 def get_mark_preparation_as_ready_use_case(
     preparation_repository: PreparationRepositoryDep,
+    waiting_list_cache: WaitingListCacheDep,
 ) -> MarkPreparationAsReadyUseCase:
     """Dependency that provides a MarkPreparationAsReadyUseCase instance"""
 
     logger.debug("Providing MarkPreparationAsReadyUseCase via dependency")
     return factory.get_mark_preparation_as_ready_use_case(
-        preparation_repository=preparation_repository
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
     )
 
 
 def get_mark_preparation_as_completed_use_case(
     preparation_repository: PreparationRepositoryDep,
+    waiting_list_cache: WaitingListCacheDep,
 ) -> MarkPreparationAsCompletedUseCase:
     """Dependency that provides a MarkPreparationAsCompletedUseCase instance"""
 
     logger.debug("Providing MarkPreparationAsCompletedUseCase via dependency")
     return factory.get_mark_preparation_as_completed_use_case(
-        preparation_repository=preparation_repository
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
     )
 
 
@@ -91,6 +153,14 @@ GetWaitingListUseCaseDep = Annotated[
     GetWaitingListUseCase, Depends(get_get_waiting_list_use_case)
 ]
 
+GetWaitingListPageUseCaseDep = Annotated[
+    GetWaitingListPageUseCase, Depends(get_get_waiting_list_page_use_case)
+]
+
+GetPreparationChangesUseCaseDep = Annotated[
+    GetPreparationChangesUseCase, Depends(get_get_preparation_changes_use_case)
+]
+
 StartNextPreparationUseCaseDep = Annotated[
     StartNextPreparationUseCase, Depends(get_start_next_preparation_use_case)
 ]
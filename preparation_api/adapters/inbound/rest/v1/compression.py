@@ -0,0 +1,81 @@
+"""Negotiated gzip compression of the REST API v1 responses"""
+
+import gzip
+
+from preparation_api.infrastructure.config import ResponseCompressionSettings
+
+GZIP = "gzip"
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into the quality of each coding"""
+
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding.lower()] = quality
+
+    return qualities
+
+
+class ResponseCompressor:
+    """Compresses response bodies with the best coding the client accepts
+
+    Bodies smaller than the minimum size are sent as they are, since compressing
+    them saves less than it costs.
+    """
+
+    def __init__(self, settings: ResponseCompressionSettings):
+        self.minimum_size = settings.MINIMUM_SIZE
+        self.gzip_level = settings.GZIP_LEVEL
+        # In order of preference when the client accepts several equally
+        self.encodings = (GZIP,)
+
+    def negotiate(self, accept_encoding: str | None, size: int) -> str | None:
+        """Choose the coding of a response body
+
+        :param accept_encoding: The Accept-Encoding header of the request
+        :type accept_encoding: str | None
+        :param size: The size of the uncompressed body in bytes
+        :type size: int
+        :return: The coding to compress the body with, or None to send it as is
+        :rtype: str | None
+        """
+
+        if not accept_encoding or size < self.minimum_size:
+            return None
+
+        qualities = _parse_accept_encoding(accept_encoding)
+        default_quality = qualities.get("*", 0.0)
+        best_encoding, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, default_quality)
+            if quality > best_quality:
+                best_encoding, best_quality = encoding, quality
+
+        return best_encoding
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a response body with a negotiated coding
+
+        :param body: The uncompressed body
+        :type body: bytes
+        :param encoding: The coding returned by negotiate
+        :type encoding: str
+        :return: The compressed body
+        :rtype: bytes
+        """
+
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
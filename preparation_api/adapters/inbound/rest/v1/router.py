@@ -1,28 +1,74 @@
 """V1 Preparation REST API endpoint module"""
 
+import asyncio
+import base64
+import binascii
+import contextlib
 import logging
+from datetime import datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
 from preparation_api.adapters.inbound.rest.dependencies.core import (
+    GetPreparationChangesUseCaseDep,
+    GetWaitingListPageUseCaseDep,
     GetWaitingListUseCaseDep,
     MarkPreparationAsCompletedUseCaseDep,
     MarkPreparationAsReadyUseCaseDep,
+    ResponseCompressorDep,
     StartNextPreparationUseCaseDep,
+    WaitingListBroadcasterDep,
+    WaitingListCacheDep,
 )
+from preparation_api.adapters.inbound.rest.v1.compression import ResponseCompressor
 from preparation_api.adapters.inbound.rest.v1.schemas import (
+    CacheStatsV1,
+    PreparationChangesV1,
     PreparationListV1,
     PreparationV1,
 )
+from preparation_api.adapters.inbound.rest.v1.serialization import (
+    WaitingListRenderer,
+    dump_preparation_changes_json,
+    dump_preparation_list_json,
+)
 from preparation_api.application.commands import (
     MarkPreparationAsCompletedCommand,
     MarkPreparationAsReadyCommand,
 )
+from preparation_api.application.queries import (
+    GetPreparationChangesQuery,
+    GetWaitingListPageQuery,
+)
+from preparation_api.domain.entities import PreparationOut
 from preparation_api.domain.exceptions import PersistenceError
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1/preparation", tags=["preparation"])
 
+DEFAULT_WAITING_LIST_PAGE_SIZE = 50
+MAX_WAITING_LIST_PAGE_SIZE = 200
+
+# Lets a reverse proxy answer the bursts of display polls for a second and keep
+# serving the board while it revalidates it
+WAITING_LIST_CACHE_CONTROL = "public, max-age=1, stale-while-revalidate=5"
+
+# The JSON responses are compressed with the coding negotiated from this header
+VARY = "Accept-Encoding"
+
+DEFAULT_WAITING_LIST_POLL_TIMEOUT_SECONDS = 25.0
+MAX_WAITING_LIST_POLL_TIMEOUT_SECONDS = 55.0
+
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 1000
+
+# Shared by the requests of this worker, so an unchanged board is serialized once
+_waiting_list_renderer = WaitingListRenderer()
+
 
 @router.post("/start-next", response_model=PreparationV1)
 async def start_next(
@@ -115,19 +161,344 @@ async def mark_as_completed(
 @router.get("/waiting-list", response_model=PreparationListV1)
 async def get_waiting_list(
     get_waiting_list_use_case: GetWaitingListUseCaseDep,
+    get_waiting_list_page_use_case: GetWaitingListPageUseCaseDep,
+    response_compressor: ResponseCompressorDep,
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+    status: Annotated[
+        PreparationStatus | None,
+        Query(description="Only list the preparations with this status"),
+    ] = None,
+    limit: Annotated[
+        int | None,
+        Query(
+            ge=1,
+            le=MAX_WAITING_LIST_PAGE_SIZE,
+            description="Maximum number of preparations in the page",
+        ),
+    ] = None,
+    cursor: Annotated[
+        str | None,
+        Query(description="The next_cursor returned with the previous page"),
+    ] = None,
 ):
-    """Get the current waiting list of preparations"""
+    """Get the current waiting list of preparations
+
+    The whole waiting list is returned when no parameter is given, otherwise it is
+    returned one page at a time. The whole waiting list is tagged with an ETag, so
+    polls sending it back in If-None-Match get a 304 while the board is unchanged.
+    Large responses are compressed with gzip when the client accepts it.
+    """
+
+    if status is None and limit is None and cursor is None:
+        try:
+            preparations = await get_waiting_list_use_case.execute()
+        except PersistenceError as e:
+            logger.error(
+                "Persistence error occurred when retrieving waiting list",
+                exc_info=True,
+            )
+
+            raise HTTPException(status_code=500, detail="Internal server error") from e
+
+        body, etag = _waiting_list_renderer.render(preparations)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": WAITING_LIST_CACHE_CONTROL,
+            "Vary": VARY,
+        }
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            logger.info("Waiting list not modified, etag=%s", etag)
+            return Response(status_code=304, headers=headers)
+
+        logger.info("Waiting list retrieved successfully, count=%d", len(preparations))
+        return _waiting_list_response(
+            preparations, body, headers, accept_encoding, response_compressor
+        )
 
     try:
-        preparations = await get_waiting_list_use_case.execute()
+        query = GetWaitingListPageQuery(
+            limit=limit or DEFAULT_WAITING_LIST_PAGE_SIZE,
+            preparation_status=status,
+            after=_decode_cursor(cursor) if cursor is not None else None,
+        )
+
+        preparations, next_cursor = await get_waiting_list_page_use_case.execute(
+            query=query
+        )
+    except ValueError as e:
+        logger.error(
+            "Value error occurred when retrieving waiting list page", exc_info=True
+        )
+
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except PersistenceError as e:
         logger.error(
-            "Persistence error occurred when retrieving waiting list", exc_info=True
+            "Persistence error occurred when retrieving waiting list page",
+            exc_info=True,
         )
 
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
-    logger.info("Waiting list retrieved successfully, count=%d", len(preparations))
-    return PreparationListV1.model_validate(
-        {"items": [preparation.model_dump() for preparation in preparations]}
+    logger.info("Waiting list page retrieved successfully, count=%d", len(preparations))
+
+    return _json_response(
+        dump_preparation_list_json(
+            preparations,
+            next_cursor=(
+                _encode_cursor(next_cursor) if next_cursor is not None else None
+            ),
+        ),
+        accept_encoding,
+        response_compressor,
     )
+
+
+@router.get(
+    "/waiting-list/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_waiting_list(waiting_list_broadcaster: WaitingListBroadcasterDep):
+    """Stream the waiting list as Server-Sent Events
+
+    A snapshot event with the whole waiting list is sent first, followed by a
+    created, started, ready, updated or completed event for every preparation that
+    changes. A client that falls behind is disconnected and gets a new snapshot
+    when it reconnects.
+    """
+
+    subscription = contextlib.AsyncExitStack()
+    try:
+        snapshot, changes = await subscription.enter_async_context(
+            waiting_list_broadcaster.subscribe()
+        )
+    except PersistenceError as e:
+        logger.error(
+            "Persistence error occurred when subscribing to the waiting list",
+            exc_info=True,
+        )
+
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+    heartbeat_seconds = waiting_list_broadcaster.heartbeat_seconds
+
+    async def events():
+        async with subscription:
+            yield snapshot
+            while True:
+                try:
+                    change = await asyncio.wait_for(
+                        changes.get(), timeout=heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream
+                    yield b": keep-alive\n\n"
+                    continue
+
+                if not change:
+                    logger.info("Closing a waiting list stream that fell behind")
+                    return
+
+                yield change
+
+    logger.info("Waiting list stream opened")
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/waiting-list/poll",
+    response_model=PreparationListV1,
+    responses={304: {"description": "The waiting list did not change in time"}},
+)
+async def poll_waiting_list(
+    waiting_list_broadcaster: WaitingListBroadcasterDep,
+    response_compressor: ResponseCompressorDep,
+    version: Annotated[
+        str | None,
+        Query(description="The ETag of the waiting list the client last saw"),
+    ] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+    timeout: Annotated[
+        float,
+        Query(
+            gt=0,
+            le=MAX_WAITING_LIST_POLL_TIMEOUT_SECONDS,
+            description="Seconds to wait for the waiting list to change",
+        ),
+    ] = DEFAULT_WAITING_LIST_POLL_TIMEOUT_SECONDS,
+):
+    """Long poll the waiting list
+
+    The waiting list is returned with its ETag as soon as it differs from the
+    version the client last saw, given in the version parameter or in
+    If-None-Match. A 304 is returned if it did not change before the timeout.
+    """
+
+    last_seen_version = version or if_none_match
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        next_change = waiting_list_broadcaster.next_change()
+        try:
+            # Loaded in a session of its own, so no connection is held while the
+            # request waits
+            preparations = await waiting_list_broadcaster.load_waiting_list()
+        except PersistenceError as e:
+            logger.error(
+                "Persistence error occurred when polling waiting list", exc_info=True
+            )
+
+            raise HTTPException(status_code=500, detail="Internal server error") from e
+
+        body, etag = _waiting_list_renderer.render(preparations)
+        headers = {"ETag": etag, "Cache-Control": "no-store", "Vary": VARY}
+        if last_seen_version is None or not _etag_matches(last_seen_version, etag):
+            break
+
+        remaining = deadline - asyncio.get_running_loop().time()
+        try:
+            await asyncio.wait_for(next_change.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            logger.info("Waiting list poll timed out unchanged, etag=%s", etag)
+            return Response(status_code=304, headers=headers)
+
+    logger.info("Waiting list poll answered, count=%d", len(preparations))
+    return _waiting_list_response(
+        preparations, body, headers, accept_encoding, response_compressor
+    )
+
+
+@router.get("/changes", response_model=PreparationChangesV1)
+async def get_changes(
+    get_preparation_changes_use_case: GetPreparationChangesUseCaseDep,
+    response_compressor: ResponseCompressorDep,
+    since: Annotated[
+        datetime,
+        Query(description="Only preparations changed after this time are listed"),
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=MAX_CHANGES_LIMIT,
+            description="Maximum number of changes, beyond which a resync is asked",
+        ),
+    ] = DEFAULT_CHANGES_LIMIT,
+    accept_encoding: Annotated[str | None, Header()] = None,
+):
+    """Get the preparations changed since a given time
+
+    Completed preparations are listed too, so clients can remove them from the
+    board. Whenever a preparation may have left the queue, every received one is
+    listed with its new position. The next call should pass the returned
+    next_since.
+    """
+
+    try:
+        preparations, next_since, resync = (
+            await get_preparation_changes_use_case.execute(
+                query=GetPreparationChangesQuery(since=since, limit=limit)
+            )
+        )
+    except PersistenceError as e:
+        logger.error(
+            "Persistence error occurred when retrieving preparation changes",
+            exc_info=True,
+        )
+
+        raise HTTPException(status_code=500, detail="Internal server error") from e
+
+    logger.info(
+        "Preparation changes retrieved successfully, count=%d resync=%s",
+        len(preparations),
+        resync,
+    )
+
+    return _json_response(
+        dump_preparation_changes_json(preparations, next_since, resync),
+        accept_encoding,
+        response_compressor,
+    )
+
+
+@router.get("/waiting-list/cache-stats", response_model=CacheStatsV1)
+async def get_waiting_list_cache_stats(waiting_list_cache: WaitingListCacheDep):
+    """Get the counters of the waiting list cache of the worker serving the request"""
+
+    return CacheStatsV1.model_validate(waiting_list_cache.stats().model_dump())
+
+
+def _json_response(
+    body: bytes,
+    accept_encoding: str | None,
+    response_compressor: ResponseCompressor,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Build a JSON response compressed with the coding the client accepts"""
+
+    headers = {**(headers or {}), "Vary": VARY}
+    encoding = response_compressor.negotiate(accept_encoding, len(body))
+    if encoding is not None:
+        body = response_compressor.compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _waiting_list_response(
+    waiting_list: list[PreparationOut],
+    body: bytes,
+    headers: dict[str, str],
+    accept_encoding: str | None,
+    response_compressor: ResponseCompressor,
+) -> Response:
+    """Build the whole waiting list response, compressing each board once"""
+
+    encoding = response_compressor.negotiate(accept_encoding, len(body))
+    if encoding is None:
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    return Response(
+        content=_waiting_list_renderer.render_encoded(
+            waiting_list, encoding, response_compressor.compress
+        ),
+        media_type="application/json",
+        headers={**headers, "Content-Encoding": encoding},
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag with weak comparison"""
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _encode_cursor(cursor: WaitingListCursor) -> str:
+    """Encode a waiting list cursor as an opaque URL safe token"""
+
+    return base64.urlsafe_b64encode(cursor.model_dump_json().encode()).decode()
+
+
+def _decode_cursor(token: str) -> WaitingListCursor:
+    """Decode a waiting list cursor from its opaque token
+
+    :raises ValueError: If the token is not a valid cursor
+    """
+
+    try:
+        return WaitingListCursor.model_validate_json(
+            base64.urlsafe_b64decode(token.encode())
+        )
+    except (binascii.Error, ValidationError) as e:
+        raise ValueError("Invalid cursor") from e
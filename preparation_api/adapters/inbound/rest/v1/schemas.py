@@ -40,3 +40,34 @@ class PreparationListV1(BaseModel):
     """Schema representing a list of preparations"""
 
     items: list[PreparationV1] = Field(..., description="List of preparation records")
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page, absent on the last page"
+    )
+
+
+class PreparationChangesV1(BaseModel):
+    """Schema representing the preparations changed since a given time"""
+
+    items: list[PreparationV1] = Field(
+        ..., description="Preparations changed since the given time, oldest first"
+    )
+
+    next_since: datetime = Field(
+        description="Time to list the next changes since. Recent changes may be "
+        "listed again, as their transactions could still be committing"
+    )
+
+    resync: bool = Field(
+        description="Whether there were too many changes to list, in which case the "
+        "waiting list must be read again before listing the changes since next_since"
+    )
+
+
+class CacheStatsV1(BaseModel):
+    """Schema representing the counters of the waiting list cache of a worker"""
+
+    hits: int = Field(description="Reads served from the cached waiting list")
+    misses: int = Field(description="Reads that loaded the waiting list")
+    coalesced: int = Field(
+        description="Reads that waited for a load already in progress"
+    )
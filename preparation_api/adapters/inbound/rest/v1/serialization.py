@@ -0,0 +1,141 @@
+"""JSON serialization of the preparations for REST API v1
+
+The preparations are written straight from the PreparationOut entities, limited
+to the fields of PreparationV1, instead of being copied into the schema and
+encoded again by the response model.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from preparation_api.adapters.inbound.rest.v1.schemas import PreparationV1
+from preparation_api.domain.entities import PreparationOut
+
+_PREPARATION_V1_FIELDS = set(PreparationV1.model_fields)
+
+_preparation_list_adapter = TypeAdapter(list[PreparationOut])
+
+
+def dump_preparation_json(preparation: PreparationOut) -> bytes:
+    """Serialize a preparation as a PreparationV1 JSON object"""
+
+    return preparation.model_dump_json(include=_PREPARATION_V1_FIELDS).encode()
+
+
+def _dump_items_json(preparations: list[PreparationOut]) -> bytes:
+    return _preparation_list_adapter.dump_json(
+        preparations, include={"__all__": _PREPARATION_V1_FIELDS}
+    )
+
+
+def dump_preparation_list_json(
+    preparations: list[PreparationOut], next_cursor: str | None = None
+) -> bytes:
+    """Serialize preparations as a PreparationListV1 JSON object"""
+
+    cursor = b"null" if next_cursor is None else f'"{next_cursor}"'.encode()
+    return (
+        b'{"items":'
+        + _dump_items_json(preparations)
+        + b',"next_cursor":'
+        + cursor
+        + b"}"
+    )
+
+
+def dump_preparation_changes_json(
+    preparations: list[PreparationOut], next_since: datetime, resync: bool
+) -> bytes:
+    """Serialize changed preparations as a PreparationChangesV1 JSON object"""
+
+    return (
+        b'{"items":'
+        + _dump_items_json(preparations)
+        + f',"next_since":"{next_since.isoformat()}"'.encode()
+        + (b',"resync":true}' if resync else b',"resync":false}')
+    )
+
+
+def waiting_list_etag(preparations: list[PreparationOut]) -> str:
+    """Compute the ETag of the whole waiting list
+
+    Any change to a preparation updates its timestamp and the positions are
+    derived from the order, so these fields are enough to tell boards apart. The
+    tag is weak since the same board may be sent with different encodings.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for preparation in preparations:
+        digest.update(
+            f"{preparation.id}\x1f{preparation.preparation_status.value}"
+            f"\x1f{preparation.preparation_position}"
+            f"\x1f{preparation.timestamp.isoformat()}\x1e".encode()
+        )
+
+    return f'W/"{digest.hexdigest()}"'
+
+
+class WaitingListRenderer:
+    """Renders the whole waiting list response once per board
+
+    The body and the compressed bodies are kept for as long as the rendered lists
+    have the same ETag, so reloading an unchanged board into a new list only costs
+    its hashing. The list last rendered is kept too, skipping even that while the
+    waiting list cache hands out the same list.
+    """
+
+    def __init__(self):
+        self._waiting_list: list[PreparationOut] | None = None
+        self._body = b""
+        self._etag = ""
+        self._encoded_bodies: dict[str, bytes] = {}
+
+    def render(self, waiting_list: list[PreparationOut]) -> tuple[bytes, str]:
+        """Render the body and the ETag of the whole waiting list
+
+        :param waiting_list: The whole waiting list
+        :type waiting_list: list[PreparationOut]
+        :return: The PreparationListV1 JSON body and the ETag
+        :rtype: tuple[bytes, str]
+        """
+
+        if waiting_list is not self._waiting_list:
+            etag = waiting_list_etag(waiting_list)
+            if etag != self._etag:
+                self._body = dump_preparation_list_json(waiting_list)
+                self._etag = etag
+                self._encoded_bodies = {}
+
+            self._waiting_list = waiting_list
+
+        return self._body, self._etag
+
+    def render_encoded(
+        self,
+        waiting_list: list[PreparationOut],
+        encoding: str,
+        compress: Callable[[bytes, str], bytes],
+    ) -> bytes:
+        """Render the body of the whole waiting list compressed with a coding
+
+        :param waiting_list: The whole waiting list
+        :type waiting_list: list[PreparationOut]
+        :param encoding: The coding of the body
+        :type encoding: str
+        :param compress: Compresses a body with the given coding, only called the
+            first time the board is rendered with it
+        :type compress: Callable[[bytes, str], bytes]
+        :return: The compressed PreparationListV1 JSON body
+        :rtype: bytes
+        """
+
+        body, _ = self.render(waiting_list)
+        encoded_body = self._encoded_bodies.get(encoding)
+        if encoded_body is None:
+            encoded_body = compress(body, encoding)
+            self._encoded_bodies[encoding] = encoded_body
+
+        return encoded_body
@@ -0,0 +1,192 @@
+"""Broadcaster of the waiting list changes to the Server-Sent Events streams"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from typing import AsyncIterator, Awaitable, Callable
+
+from preparation_api.adapters.inbound.rest.v1.serialization import (
+    dump_preparation_json,
+    dump_preparation_list_json,
+)
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.infrastructure.config import WaitingListStreamSettings
+
+logger = logging.getLogger(__name__)
+
+# Event sent for a preparation that reached each status of the board
+STATUS_EVENTS = {
+    PreparationStatus.RECEIVED: "created",
+    PreparationStatus.IN_PREPARATION: "started",
+    PreparationStatus.READY: "ready",
+}
+
+# Event sent for a preparation that left the board
+COMPLETED_EVENT = "completed"
+
+# Event sent for a preparation that changed without changing its status, such as
+# a received preparation moving up the queue
+UPDATED_EVENT = "updated"
+
+SNAPSHOT_EVENT = "snapshot"
+
+# Queued in place of the changes a subscriber had no room left for
+_DROPPED = b""
+
+
+def _render_event(event: str, data: bytes) -> bytes:
+    """Render a Server-Sent Event"""
+
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+def _render_snapshot(waiting_list: list[PreparationOut]) -> bytes:
+    return _render_event(SNAPSHOT_EVENT, dump_preparation_list_json(waiting_list))
+
+
+def _render_changes(
+    previous: list[PreparationOut], current: list[PreparationOut]
+) -> bytes:
+    """Render the events turning the previous waiting list into the current one"""
+
+    previous_by_id = {preparation.id: preparation for preparation in previous}
+    current_ids = set()
+    events = []
+    for preparation in current:
+        current_ids.add(preparation.id)
+        before = previous_by_id.get(preparation.id)
+        if before == preparation:
+            continue
+
+        if before is None or before.preparation_status != (
+            preparation.preparation_status
+        ):
+            event = STATUS_EVENTS[preparation.preparation_status]
+        else:
+            event = UPDATED_EVENT
+
+        events.append(_render_event(event, dump_preparation_json(preparation)))
+
+    for preparation in previous:
+        if preparation.id not in current_ids:
+            events.append(
+                _render_event(
+                    COMPLETED_EVENT, json.dumps({"id": preparation.id}).encode()
+                )
+            )
+
+    return b"".join(events)
+
+
+class WaitingListBroadcaster:
+    """Fans the waiting list changes out to the streams of this worker
+
+    The waiting list is loaded once per change however many streams are open,
+    and each change is rendered once and shared by all of them. Every stream has
+    a bounded buffer of changes, and a stream too slow to keep up is dropped
+    instead of buffering without limit.
+    """
+
+    def __init__(
+        self,
+        load_waiting_list: Callable[[], Awaitable[list[PreparationOut]]],
+        settings: WaitingListStreamSettings,
+    ):
+        self.load_waiting_list = load_waiting_list
+        self.max_pending_changes = settings.MAX_PENDING_CHANGES
+        self.heartbeat_seconds = settings.HEARTBEAT_SECONDS
+        self._subscribers: set[asyncio.Queue[bytes]] = set()
+        self._waiting_list: list[PreparationOut] | None = None
+        self._snapshot: bytes | None = None
+        self._changed = asyncio.Event()
+        self._next_change = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of streams currently subscribed"""
+        return len(self._subscribers)
+
+    def notify_changed(self) -> None:
+        """Signal that the preparations changed, so the streams are updated"""
+        self._changed.set()
+        self._next_change.set()
+        self._next_change = asyncio.Event()
+
+    def next_change(self) -> asyncio.Event:
+        """Get an event set by the next change of the preparations
+
+        Taken before loading the waiting list, so a change made while it loads is
+        not missed.
+        """
+        return self._next_change
+
+    async def run(self):
+        """Publish the changes of the waiting list until cancelled"""
+
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            try:
+                await self._publish_changes()
+            except Exception:  # pylint: disable=W0718
+                logger.error(
+                    "Failed to publish the waiting list changes", exc_info=True
+                )
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[tuple[bytes, asyncio.Queue[bytes]]]:
+        """Subscribe a stream to the waiting list changes
+
+        :return: The rendered snapshot of the waiting list and the queue receiving
+            the rendered changes that follow it. An empty change means the stream
+            fell behind and was dropped.
+        :rtype: tuple[bytes, asyncio.Queue[bytes]]
+        :raises PersistenceError: If there is an error loading the waiting list
+        """
+
+        async with self._lock:
+            # The waiting list is not followed while nobody is subscribed
+            if self._waiting_list is None:
+                self._waiting_list = await self.load_waiting_list()
+
+            if self._snapshot is None:
+                self._snapshot = _render_snapshot(self._waiting_list)
+
+            # One slot is kept for the marker of a dropped subscriber
+            queue: asyncio.Queue[bytes] = asyncio.Queue(
+                maxsize=self.max_pending_changes + 1
+            )
+            self._subscribers.add(queue)
+            snapshot = self._snapshot
+
+        try:
+            yield snapshot, queue
+        finally:
+            self._subscribers.discard(queue)
+
+    async def _publish_changes(self):
+        async with self._lock:
+            if not self._subscribers:
+                self._waiting_list = None
+                self._snapshot = None
+                return
+
+            previous = self._waiting_list or []
+            current = await self.load_waiting_list()
+            changes = _render_changes(previous, current)
+            self._waiting_list = current
+            self._snapshot = None
+            if not changes:
+                return
+
+            for queue in list(self._subscribers):
+                if queue.qsize() < self.max_pending_changes:
+                    queue.put_nowait(changes)
+                    continue
+
+                logger.warning("Dropping a waiting list stream that fell behind")
+                queue.put_nowait(_DROPPED)
+                self._subscribers.discard(queue)
@@ -1,6 +1,13 @@
 """Initialization of the out adapters package for the preparation API"""
 
 from .api_order_info_provider import APIOrderInfoProvider
+from .caching_order_info_provider import CachingOrderInfoProvider
+from .in_memory_waiting_list_cache import InMemoryWaitingListCache
 from .sa_preparation_repository import SAPreparationRepository
 
-__all__ = ["APIOrderInfoProvider", "SAPreparationRepository"]
+__all__ = [
+    "APIOrderInfoProvider",
+    "CachingOrderInfoProvider",
+    "InMemoryWaitingListCache",
+    "SAPreparationRepository",
+]
@@ -0,0 +1,104 @@
+"""Caching decorator of the OrderInfoProvider port"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from preparation_api.adapters.out.single_flight import SingleFlight
+from preparation_api.domain.exceptions import OrderInfoNotFound
+from preparation_api.domain.ports import OrderInfoProvider
+from preparation_api.domain.value_objects import CacheStats, OrderInfo
+
+logger = logging.getLogger(__name__)
+
+# An order not found is cached as the error raised for it
+_CachedOrderInfo = OrderInfo | OrderInfoNotFound
+
+
+class CachingOrderInfoProvider(OrderInfoProvider):
+    """A per process cache in front of another OrderInfoProvider
+
+    The preparation time of an order does not change once it is paid, so the
+    orders are kept in a bounded LRU for a long time to live. Orders not found are
+    only remembered for a short time, since a payment may be closed before its
+    order can be fetched. Concurrent reads of the same order share a single fetch.
+    """
+
+    def __init__(
+        self,
+        provider: OrderInfoProvider,
+        max_size: int,
+        ttl_seconds: float,
+        not_found_ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.provider = provider
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.not_found_ttl_seconds = not_found_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, _CachedOrderInfo]] = OrderedDict()
+        self._single_flight: SingleFlight[str, OrderInfo] = SingleFlight()
+        self._hits = 0
+
+    async def get(self, order_id: str) -> OrderInfo:
+        return await self._single_flight.run(
+            order_id,
+            lookup=lambda: self._lookup(order_id),
+            call=lambda: self._fetch(order_id),
+        )
+
+    def stats(self) -> CacheStats:
+        """Get the counters of how the reads of the cache were served
+
+        :return: The cache counters
+        :rtype: CacheStats
+        """
+
+        return CacheStats(
+            hits=self._hits,
+            misses=self._single_flight.calls,
+            coalesced=self._single_flight.coalesced,
+        )
+
+    def _lookup(self, order_id: str) -> OrderInfo | None:
+        cached = self._get_cached(order_id)
+        if cached is None:
+            return None
+
+        self._hits += 1
+        if isinstance(cached, OrderInfoNotFound):
+            raise OrderInfoNotFound(str(cached))
+
+        return cached
+
+    async def _fetch(self, order_id: str) -> OrderInfo:
+        try:
+            order_info = await self.provider.get(order_id=order_id)
+        except OrderInfoNotFound as error:
+            self._store(order_id, error, self.not_found_ttl_seconds)
+            raise
+
+        self._store(order_id, order_info, self.ttl_seconds)
+        return order_info
+
+    def _get_cached(self, order_id: str) -> _CachedOrderInfo | None:
+        entry = self._entries.get(order_id)
+        if entry is None:
+            return None
+
+        expires_at, cached = entry
+        if self._clock() >= expires_at:
+            del self._entries[order_id]
+            return None
+
+        self._entries.move_to_end(order_id)
+        return cached
+
+    def _store(self, order_id: str, cached: _CachedOrderInfo, ttl_seconds: float):
+        self._entries[order_id] = (self._clock() + ttl_seconds, cached)
+        self._entries.move_to_end(order_id)
+        while len(self._entries) > self.max_size:
+            evicted_id, _ = self._entries.popitem(last=False)
+            logger.debug("Evicting cached order info order_id=%s", evicted_id)
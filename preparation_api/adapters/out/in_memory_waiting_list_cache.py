@@ -0,0 +1,70 @@
+"""In memory implementation of the WaitingListCache port"""
+
+import logging
+import time
+from typing import Awaitable, Callable
+
+from preparation_api.adapters.out.single_flight import SingleFlight
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.ports import WaitingListCache
+from preparation_api.domain.value_objects import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryWaitingListCache(WaitingListCache):
+    """A per process implementation of the WaitingListCache port
+
+    The waiting list is kept for a short time to live. Reads that miss while a
+    load is in progress wait for it instead of starting their own.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._waiting_list: list[PreparationOut] | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._single_flight: SingleFlight[None, list[PreparationOut]] = SingleFlight()
+        self._hits = 0
+
+    async def get_or_load(
+        self, loader: Callable[[], Awaitable[list[PreparationOut]]]
+    ) -> list[PreparationOut]:
+        return await self._single_flight.run(
+            None, lookup=self._lookup, call=lambda: self._load(loader)
+        )
+
+    def invalidate(self) -> None:
+        logger.debug("Invalidating the cached waiting list")
+        self._generation += 1
+        self._waiting_list = None
+        self._single_flight.forget(None)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._single_flight.calls,
+            coalesced=self._single_flight.coalesced,
+        )
+
+    def _lookup(self) -> list[PreparationOut] | None:
+        if self._waiting_list is None or self._clock() >= self._expires_at:
+            return None
+
+        self._hits += 1
+        return self._waiting_list
+
+    async def _load(
+        self, loader: Callable[[], Awaitable[list[PreparationOut]]]
+    ) -> list[PreparationOut]:
+        generation = self._generation
+        waiting_list = await loader()
+
+        # A waiting list loaded across an invalidation may miss the change, so it
+        # is returned to the reads that waited for it but not kept
+        if generation == self._generation:
+            self._waiting_list = waiting_list
+            self._expires_at = self._clock() + self.ttl_seconds
+
+        return waiting_list
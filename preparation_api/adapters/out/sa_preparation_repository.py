@@ -1,36 +1,309 @@
 """SQL Alchemy implementation of the PreparationRepository port"""
 
-from datetime import datetime
-
-from sqlalchemy import exists, insert, select, update
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    inspect,
+    literal,
+    or_,
+    select,
+    tuple_,
+    types,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from preparation_api.domain.entities import PreparationIn, PreparationOut
-from preparation_api.domain.exceptions import NotFound, PersistenceError
+from preparation_api.domain.exceptions import (
+    AlreadyExists,
+    NotFound,
+    PersistenceError,
+)
 from preparation_api.domain.ports import PreparationRepository
-from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
 from preparation_api.infrastructure.orm.models import Preparation as PreparationModel
+from preparation_api.infrastructure.orm.models import (
+    PreparationHistory as PreparationHistoryModel,
+)
+from preparation_api.infrastructure.orm.models import (
+    preparation_position_sequence,
+    utcnow,
+)
+
+
+def _has_status(status: PreparationStatus, model=PreparationModel):
+    """Filter preparations by a status rendered inline in the SQL statement
+
+    The partial indexes are only usable when the planner can prove their predicate,
+    which it cannot do against a bound parameter once the prepared statement
+    switches to a generic plan.
+
+    :param status: The status to filter by
+    :type status: PreparationStatus
+    :param model: The preparation entity or alias being filtered
+    :return: The filter expression
+    """
+    return model.preparation_status == literal(
+        status, PreparationModel.preparation_status.type, literal_execute=True
+    )
+
+
+# The waiting list statuses in board order, with the key each one is sorted by.
+# The ID breaks ties, so a page can resume right after any preparation.
+_WAITING_LIST_SORT_KEYS = {
+    PreparationStatus.READY: PreparationModel.timestamp,
+    PreparationStatus.IN_PREPARATION: PreparationModel.estimated_ready_time,
+    PreparationStatus.RECEIVED: PreparationModel.preparation_position,
+}
+
+
+def _preparation_columns(model=PreparationModel, preparation_position=None) -> list:
+    """Select the columns of a preparation labelled after the PreparationOut fields
+
+    :param model: The preparation entity or alias to select from
+    :param preparation_position: An expression replacing the stored position, such
+        as the position of a received preparation derived at read time
+    :return: The labelled columns
+    :rtype: list
+    """
+    expressions = {"preparation_position": preparation_position}
+    return [
+        (
+            expressions[field]
+            if expressions.get(field) is not None
+            else getattr(model, field)
+        ).label(field)
+        for field in PreparationOut.model_fields
+    ]
+
+
+# Built once, as building the validator is far more expensive than running it
+_preparation_list_adapter = TypeAdapter(list[PreparationOut])
+
+
+def _to_preparation_out(row: Row) -> PreparationOut:
+    """Build a PreparationOut from a row selected with the preparation columns
+
+    :param row: The row selected with the preparation columns
+    :type row: Row
+    :return: The preparation entity
+    :rtype: PreparationOut
+    """
+    return PreparationOut.model_validate(row._asdict())
+
+
+def _to_preparation_outs(rows: Sequence[Row]) -> list[PreparationOut]:
+    """Build the PreparationOut list of rows selected with the preparation columns
+
+    The rows are validated in a single call instead of loading ORM instances into
+    the identity map and validating their attributes one at a time.
+
+    :param rows: The rows selected with the preparation columns
+    :type rows: Sequence[Row]
+    :return: The preparation entities
+    :rtype: list[PreparationOut]
+    """
+    return _preparation_list_adapter.validate_python([row._asdict() for row in rows])
 
 
 class SAPreparationRepository(PreparationRepository):
-    """A SQL Alchemy implementation of the PreparationRepository port"""
+    """A SQL Alchemy implementation of the PreparationRepository port
+
+    The ``posicao_preparacao`` column of received preparations stores a monotonic
+    enqueue sequence that is never renumbered. The position exposed to the domain
+    is derived from it at read time, so starting a preparation touches one row.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def save(self, preparation: PreparationIn) -> PreparationOut:
-        if await self.exists_by_id(preparation_id=preparation.id):
-            return await self._update(preparation=preparation)
-        return await self._insert(preparation=preparation)
+        values = preparation.model_dump()
+        columns = inspect(PreparationModel).columns
+        statement = insert(PreparationModel).values(**values)
+        excluded = statement.excluded
+        statement = statement.on_conflict_do_update(
+            index_elements=[PreparationModel.id],
+            set_={
+                **{
+                    columns[key]: excluded[columns[key].name]
+                    for key in values
+                    if key not in ("id", "preparation_position")
+                },
+                # The stored position of a received preparation is its enqueue
+                # sequence, while the one read back is its rank in the queue, so it
+                # is kept until the preparation leaves the queue
+                columns["preparation_position"]: case(
+                    (
+                        excluded.st_preparacao == PreparationStatus.RECEIVED,
+                        PreparationModel.preparation_position,
+                    ),
+                    else_=excluded.posicao_preparacao,
+                ),
+                columns["timestamp"]: utcnow(),
+            },
+        )
+
+        try:
+            result = await self.session.execute(
+                statement.returning(*_preparation_columns())
+            )
+
+            saved_preparation = _to_preparation_out(result.one())
+            await self.session.commit()
+            return saved_preparation
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error saving preparation {preparation.id}: {str(error)}"
+            ) from error
+
+    async def enqueue(self, preparation: PreparationIn) -> PreparationOut:
+        # The position comes from a sequence and a duplicated ID inserts nothing, so
+        # concurrent enqueues never share a position nor need an existence check
+        inserted = (
+            insert(PreparationModel)
+            .values(
+                **preparation.model_dump(exclude={"preparation_position"}),
+                preparation_position=preparation_position_sequence.next_value(),
+            )
+            .on_conflict_do_nothing(index_elements=[PreparationModel.id])
+            .returning(*PreparationModel.__table__.columns)
+            .cte("inserted")
+        )
+
+        inserted_preparation = aliased(PreparationModel, inserted)
+
+        # The inserted row is not visible to the rest of the statement, so its
+        # position is one past the received preparations ahead of it
+        queue_position = (
+            select(func.count() + 1)  # pylint: disable=E1102
+            .where(
+                _has_status(PreparationStatus.RECEIVED),
+                PreparationModel.preparation_position
+                < inserted_preparation.preparation_position,
+            )
+            .scalar_subquery()
+        )
+
+        try:
+            result = await self.session.execute(
+                select(
+                    *_preparation_columns(
+                        inserted_preparation, preparation_position=queue_position
+                    )
+                )
+            )
+
+            row = result.one_or_none()
+            if row is None:
+                raise AlreadyExists(
+                    f"Preparation with ID {preparation.id} already exists"
+                )
+
+            enqueued_preparation = _to_preparation_out(row)
+            await self.session.commit()
+            return enqueued_preparation
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error enqueuing preparation {preparation.id}: {str(error)}"
+            ) from error
+
+    async def save_many(self, preparations: list[PreparationIn]) -> list[str]:
+        if not preparations:
+            return []
+
+        received_count = sum(
+            preparation.preparation_status == PreparationStatus.RECEIVED
+            for preparation in preparations
+        )
+
+        try:
+            # Reserve every position in one round trip and hand them out in the
+            # given order, whatever order the batched inserts evaluate them in
+            result = await self.session.execute(
+                select(preparation_position_sequence.next_value()).select_from(
+                    func.generate_series(1, received_count)
+                )
+            )
+
+            positions = iter(sorted(result.scalars().all()))
+
+            # Sent as an executemany, which SQLAlchemy batches into multi-row
+            # INSERT statements
+            result = await self.session.execute(
+                insert(PreparationModel)
+                .on_conflict_do_nothing(index_elements=[PreparationModel.id])
+                .returning(PreparationModel.id),
+                [
+                    {
+                        **preparation.model_dump(),
+                        "preparation_position": (
+                            next(positions)
+                            if preparation.preparation_status
+                            == PreparationStatus.RECEIVED
+                            else None
+                        ),
+                    }
+                    for preparation in preparations
+                ],
+            )
+
+            inserted_ids = set(result.scalars().all())
+            await self.session.commit()
+            return [
+                preparation.id
+                for preparation in preparations
+                if preparation.id in inserted_ids
+            ]
+
+        except (SQLAlchemyError, OSError) as error:
+            raise PersistenceError(
+                f"Error saving {len(preparations)} preparations: {str(error)}"
+            ) from error
 
     async def find_by_id(self, preparation_id: str) -> PreparationOut:
+        received = aliased(PreparationModel)
+        queue_position = (
+            select(func.count())  # pylint: disable=E1102
+            .select_from(received)
+            .where(
+                _has_status(PreparationStatus.RECEIVED, model=received),
+                received.preparation_position <= PreparationModel.preparation_position,
+            )
+            .scalar_subquery()
+        )
+
         try:
             result = await self.session.execute(
-                select(PreparationModel).where(PreparationModel.id == preparation_id)
+                select(
+                    *_preparation_columns(
+                        preparation_position=case(
+                            (
+                                PreparationModel.preparation_status
+                                == PreparationStatus.RECEIVED,
+                                queue_position,
+                            )
+                        )
+                    )
+                ).where(PreparationModel.id == preparation_id)
             )
 
-            return PreparationOut.model_validate(result.scalars().one())
+            return _to_preparation_out(result.one())
 
         except NoResultFound as error:
             raise NotFound(f"No preparation found with ID: {preparation_id}") from error
@@ -54,166 +327,353 @@ class SAPreparationRepository(PreparationRepository):
                 f"{str(error)}"
             ) from error
 
-    async def find_max_position(self) -> int:
+    async def start_next_received(self) -> PreparationOut:
+        # Rows already claimed by concurrent transactions are skipped instead of
+        # waited for, so parallel calls start different preparations
+        head = (
+            select(PreparationModel.id)
+            .where(_has_status(PreparationStatus.RECEIVED))
+            .order_by(PreparationModel.preparation_position.asc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+
         try:
             result = await self.session.execute(
-                select(PreparationModel.preparation_position)
-                .where(
-                    PreparationModel.preparation_status == PreparationStatus.RECEIVED
+                update(PreparationModel)
+                .where(PreparationModel.id == head)
+                .values(
+                    preparation_position=None,
+                    estimated_ready_time=(
+                        utcnow()
+                        + PreparationModel.preparation_time
+                        * literal(timedelta(minutes=1), types.Interval)
+                    ),
+                    preparation_status=PreparationStatus.IN_PREPARATION,
                 )
-                .order_by(PreparationModel.preparation_position.desc())
-                .limit(1)
+                .returning(*_preparation_columns())
+                .execution_options(synchronize_session=False)
             )
 
-            max_position_preparation = result.scalars().first()
-            return max_position_preparation or 0
+            started_preparation = _to_preparation_out(result.one())
+
+            await self.session.commit()
+            return started_preparation
+
+        except NoResultFound as error:
+            raise NotFound("No received preparation found") from error
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error finding max preparation position: {str(error)}"
+                f"Error starting next received preparation: {str(error)}"
             ) from error
 
-    async def find_received_with_min_position(self) -> PreparationOut:
+    async def archive_completed(self, retention: timedelta, limit: int) -> int:
+        history_columns = inspect(PreparationHistoryModel).columns
+        fields = [
+            field
+            for field in inspect(PreparationModel).columns.keys()
+            if field in history_columns
+        ]
+
+        batch = (
+            select(PreparationModel.id)
+            .where(
+                _has_status(PreparationStatus.COMPLETED),
+                PreparationModel.timestamp
+                < utcnow() - literal(retention, types.Interval),
+            )
+            .order_by(PreparationModel.timestamp.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        # Deleted and copied in a single statement, so a batch can neither be lost
+        # nor archived twice
+        moved = (
+            delete(PreparationModel)
+            .where(PreparationModel.id.in_(batch.scalar_subquery()))
+            .returning(*[getattr(PreparationModel, field) for field in fields])
+            .cte("moved")
+        )
+
         try:
             result = await self.session.execute(
-                select(PreparationModel)
-                .where(
-                    PreparationModel.preparation_status == PreparationStatus.RECEIVED
+                insert(PreparationHistoryModel)
+                .from_select(
+                    [getattr(PreparationHistoryModel, field) for field in fields],
+                    select(*moved.c),
                 )
-                .order_by(PreparationModel.preparation_position.asc())
-                .limit(1)
+                .returning(PreparationHistoryModel.id)
             )
 
-            return PreparationOut.model_validate(result.scalars().one())
-
-        except NoResultFound as error:
-            raise NotFound("No received preparation found") from error
+            archived_count = len(result.scalars().all())
+            await self.session.commit()
+            return archived_count
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error finding received preparation with min position: {str(error)}"
+                f"Error archiving completed preparations: {str(error)}"
             ) from error
 
-    async def decrement_received_positions_greater_than(
-        self, preparation_position: int
-    ) -> None:
-        try:
-            await self.session.execute(
-                update(PreparationModel)
-                .where(
-                    PreparationModel.preparation_status == PreparationStatus.RECEIVED,
-                    PreparationModel.preparation_position > preparation_position,
-                )
-                .values(
-                    preparation_position=PreparationModel.preparation_position - 1,
-                    timestamp=datetime.now(),
+    async def get_waiting_list(self) -> list[PreparationOut]:
+        # One branch per status, each one ordered by its own sort key so it can be
+        # read from its partial index
+        board = union_all(
+            *[
+                select(
+                    PreparationModel,
+                    literal(board_group).label("board_group"),
+                    func.row_number()  # pylint: disable=E1102
+                    .over(order_by=(sort_key.asc(), PreparationModel.id.asc()))
+                    .label("board_order"),
+                ).where(_has_status(status))
+                for board_group, (status, sort_key) in enumerate(
+                    _WAITING_LIST_SORT_KEYS.items()
                 )
+            ]
+        ).subquery("board")
+
+        board_preparation = aliased(PreparationModel, board)
+
+        try:
+            result = await self.session.execute(
+                select(
+                    *_preparation_columns(
+                        board_preparation,
+                        preparation_position=case(
+                            (
+                                board_preparation.preparation_status
+                                == PreparationStatus.RECEIVED,
+                                board.c.board_order,
+                            ),
+                            else_=board_preparation.preparation_position,
+                        ),
+                    )
+                ).order_by(board.c.board_group.asc(), board.c.board_order.asc())
             )
-            await self.session.commit()
+
+            return _to_preparation_outs(result.all())
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error decrementing preparation positions greater than "
-                f"{preparation_position}: {str(error)}"
+                f"Error getting waiting list: {str(error)}"
             ) from error
 
-    async def get_received_waiting_list(self) -> list[PreparationOut]:
+    async def get_waiting_list_page(
+        self,
+        limit: int,
+        preparation_status: PreparationStatus | None = None,
+        after: WaitingListCursor | None = None,
+    ) -> tuple[list[PreparationOut], WaitingListCursor | None]:
+        statuses = (
+            list(_WAITING_LIST_SORT_KEYS)
+            if preparation_status is None
+            else [preparation_status]
+        )
+
+        # Statuses before the one of the cursor were read by the previous pages
+        if after is not None:
+            statuses = statuses[statuses.index(after.preparation_status) :]
+
+        branches = []
+        for board_group, status in enumerate(statuses):
+            sort_key = _WAITING_LIST_SORT_KEYS[status]
+            cursor = (
+                after
+                if after is not None and after.preparation_status == status
+                else None
+            )
+
+            conditions = [_has_status(status)]
+            if cursor is not None:
+                conditions.append(
+                    tuple_(sort_key, PreparationModel.id)
+                    > tuple_(literal(cursor.sort_key), literal(cursor.id))
+                )
+
+            board_order = func.row_number().over(  # pylint: disable=E1102
+                order_by=(sort_key.asc(), PreparationModel.id.asc())
+            )
+
+            queue_position: ColumnElement | None = None
+            if status == PreparationStatus.RECEIVED:
+                queue_position = board_order
+                if cursor is not None:
+                    # Received preparations listed by the previous pages still
+                    # count for the positions of the ones in this page
+                    received = aliased(PreparationModel)
+                    queue_position = board_order + (
+                        select(func.count())  # pylint: disable=E1102
+                        .select_from(received)
+                        .where(
+                            _has_status(PreparationStatus.RECEIVED, model=received),
+                            tuple_(received.preparation_position, received.id)
+                            <= tuple_(literal(cursor.sort_key), literal(cursor.id)),
+                        )
+                        .scalar_subquery()
+                    )
+
+            # Each branch reads at most one row past the page from its index
+            branches.append(
+                select(
+                    *_preparation_columns(preparation_position=queue_position),
+                    PreparationModel.preparation_position.label("queue_key"),
+                    literal(board_group).label("board_group"),
+                    board_order.label("board_order"),
+                )
+                .where(*conditions)
+                .order_by(sort_key.asc(), PreparationModel.id.asc())
+                .limit(limit + 1)
+            )
+
+        page = union_all(*branches).subquery("page")
+
         try:
             result = await self.session.execute(
-                select(PreparationModel)
-                .where(
-                    PreparationModel.preparation_status == PreparationStatus.RECEIVED
-                )
-                .order_by(PreparationModel.preparation_position.asc())
+                select(page)
+                .order_by(page.c.board_group.asc(), page.c.board_order.asc())
+                .limit(limit + 1)
             )
 
-            preparations = result.scalars().all()
-            return [PreparationOut.model_validate(p) for p in preparations]
+            rows = result.all()
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error getting received waiting list: {str(error)}"
+                f"Error getting waiting list page: {str(error)}"
             ) from error
 
-    async def get_in_preparation_waiting_list(self) -> list[PreparationOut]:
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            status = last_row.preparation_status
+            next_cursor = WaitingListCursor(
+                preparation_status=status,
+                sort_key=(
+                    last_row.queue_key
+                    if status == PreparationStatus.RECEIVED
+                    else last_row._mapping[_WAITING_LIST_SORT_KEYS[status].key]
+                ),
+                id=last_row.id,
+            )
+
+        return _to_preparation_outs(rows[:limit]), next_cursor
+
+    async def get_changed_since(
+        self, since: datetime, limit: int
+    ) -> tuple[list[PreparationOut], datetime]:
+        # The position of a changed received preparation counts the received ones
+        # queued up to it, read from the received partial index
+        queued = aliased(PreparationModel)
+        queue_position = (
+            select(func.count())  # pylint: disable=E1102
+            .where(
+                _has_status(PreparationStatus.RECEIVED, queued),
+                tuple_(queued.preparation_position, queued.id)
+                <= tuple_(PreparationModel.preparation_position, PreparationModel.id),
+            )
+            .scalar_subquery()
+        )
+
+        # Starting a preparation renumbers the received ones behind it without
+        # changing their rows. The status history is not kept, so any preparation
+        # changed out of the queue may have left it since, and then the whole queue
+        # is listed with its current positions.
+        changed = aliased(PreparationModel)
+        queue_renumbered = exists().where(
+            changed.timestamp > since,
+            changed.preparation_status != PreparationStatus.RECEIVED,
+        )
+
         try:
+            # Taken first, so every change committed before it is seen by the read
+            read_at = (await self.session.execute(select(utcnow()))).scalar_one()
+
             result = await self.session.execute(
-                select(PreparationModel)
+                select(
+                    *_preparation_columns(
+                        preparation_position=case(
+                            (
+                                PreparationModel.preparation_status
+                                == PreparationStatus.RECEIVED,
+                                queue_position,
+                            ),
+                            else_=PreparationModel.preparation_position,
+                        )
+                    )
+                )
                 .where(
-                    PreparationModel.preparation_status
-                    == PreparationStatus.IN_PREPARATION
+                    or_(
+                        PreparationModel.timestamp > since,
+                        and_(_has_status(PreparationStatus.RECEIVED), queue_renumbered),
+                    )
                 )
-                .order_by(PreparationModel.estimated_ready_time.asc())
+                .order_by(PreparationModel.timestamp.asc(), PreparationModel.id.asc())
+                .limit(limit)
             )
 
-            preparations = result.scalars().all()
-            return [PreparationOut.model_validate(p) for p in preparations]
+            return _to_preparation_outs(result.all()), read_at
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error getting in preparation waiting list: {str(error)}"
+                f"Error getting preparations changed since {since}: {str(error)}"
             ) from error
 
-    async def get_ready_waiting_list(self) -> list[PreparationOut]:
+    async def get_received_waiting_list(self) -> list[PreparationOut]:
+        queue_position = func.row_number().over(  # pylint: disable=E1102
+            order_by=(
+                PreparationModel.preparation_position.asc(),
+                PreparationModel.id.asc(),
+            )
+        )
+
         try:
             result = await self.session.execute(
-                select(PreparationModel)
-                .where(PreparationModel.preparation_status == PreparationStatus.READY)
-                .order_by(PreparationModel.timestamp.asc())
+                select(*_preparation_columns(preparation_position=queue_position))
+                .where(_has_status(PreparationStatus.RECEIVED))
+                .order_by(
+                    PreparationModel.preparation_position.asc(),
+                    PreparationModel.id.asc(),
+                )
             )
 
-            preparations = result.scalars().all()
-            return [PreparationOut.model_validate(p) for p in preparations]
+            return _to_preparation_outs(result.all())
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error getting ready waiting list: {str(error)}"
+                f"Error getting received waiting list: {str(error)}"
             ) from error
 
-    async def _insert(self, preparation: PreparationIn) -> PreparationOut:
-        """Insert a new preparation into the repository
-
-        :param preparation: Preparation to be inserted
-        :type preparation: PreparationIn
-        :return: Inserted Preparation
-        :rtype: PreparationOut
-        """
+    async def get_in_preparation_waiting_list(self) -> list[PreparationOut]:
         try:
             result = await self.session.execute(
-                insert(PreparationModel)
-                .values(**preparation.model_dump())
-                .returning(PreparationModel)
+                select(*_preparation_columns())
+                .where(_has_status(PreparationStatus.IN_PREPARATION))
+                .order_by(
+                    PreparationModel.estimated_ready_time.asc(),
+                    PreparationModel.id.asc(),
+                )
             )
 
-            inserted_preparation = PreparationOut.model_validate(result.scalars().one())
-            await self.session.commit()
-            return inserted_preparation
+            return _to_preparation_outs(result.all())
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error inserting preparation {preparation.id}: {str(error)}"
+                f"Error getting in preparation waiting list: {str(error)}"
             ) from error
 
-    async def _update(self, preparation: PreparationIn) -> PreparationOut:
-        """Update an existing preparation in the repository
-        :param preparation: Preparation to be updated
-        :type preparation: PreparationIn
-        :return: Updated Preparation
-        :rtype: PreparationOut
-        """
+    async def get_ready_waiting_list(self) -> list[PreparationOut]:
         try:
             result = await self.session.execute(
-                update(PreparationModel)
-                .where(PreparationModel.id == preparation.id)
-                .values(**preparation.model_dump())
-                .returning(PreparationModel)
+                select(*_preparation_columns())
+                .where(_has_status(PreparationStatus.READY))
+                .order_by(PreparationModel.timestamp.asc(), PreparationModel.id.asc())
             )
 
-            updated_preparation = PreparationOut.model_validate(result.scalars().one())
-            await self.session.commit()
-            return updated_preparation
+            return _to_preparation_outs(result.all())
 
         except (SQLAlchemyError, OSError) as error:
             raise PersistenceError(
-                f"Error updating preparation {preparation.id}: {str(error)}"
+                f"Error getting ready waiting list: {str(error)}"
             ) from error
@@ -0,0 +1,89 @@
+"""Sharing of a single call between concurrent reads of the same key"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ResultT = TypeVar("_ResultT")
+
+
+class SingleFlight(Generic[_KeyT, _ResultT]):
+    """Shares a call in progress between the concurrent reads of the same key
+
+    A read first looks the key up, so the result can be kept elsewhere once the
+    call completes. When the lookup misses while a call for the key is in
+    progress, the read waits for it instead of starting its own.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[_KeyT, asyncio.Future[_ResultT]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(
+        self,
+        key: _KeyT,
+        lookup: Callable[[], _ResultT | None],
+        call: Callable[[], Awaitable[_ResultT]],
+    ) -> _ResultT:
+        """Get the result of a key from the lookup, a call in flight or a new call
+
+        :param key: The key the reads are shared by
+        :param lookup: Returns the result already kept for the key, or None
+        :param call: Makes the call for the key, keeping its result for the lookup
+        :return: The result of the key
+        :raises Exception: The error raised by the call, to every read waiting
+        """
+
+        while True:
+            result = lookup()
+            if result is not None:
+                return result
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+
+            self.coalesced += 1
+            try:
+                # Shielded so a waiting read being cancelled does not cancel the
+                # call the other reads are waiting for
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # The call was cancelled along with the read that started it, so
+                # the reads still waiting try again
+                current_task = asyncio.current_task()
+                if not in_flight.cancelled() or (
+                    current_task is not None and current_task.cancelling()
+                ):
+                    raise
+
+        self.calls += 1
+        in_flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = in_flight
+        try:
+            result = await call()
+        except Exception as error:
+            in_flight.set_exception(error)
+            # Retrieved so an error nobody else waited for is not logged as lost
+            in_flight.exception()
+            raise
+        except BaseException:
+            in_flight.cancel()
+            raise
+        finally:
+            if self._in_flight.get(key) is in_flight:
+                del self._in_flight[key]
+
+        in_flight.set_result(result)
+        return result
+
+    def forget(self, key: _KeyT) -> None:
+        """Let the next reads of a key start a new call instead of waiting
+
+        The reads already waiting for the call in progress still get its result.
+
+        :param key: The key whose call in progress is forgotten
+        """
+
+        self._in_flight.pop(key, None)
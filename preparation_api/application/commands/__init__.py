@@ -1,11 +1,13 @@
 """Application commands package"""
 
 from .create_preparation_from_payment import CreatePreparationFromPaymentCommand
+from .import_preparations_from_payments import ImportPreparationsFromPaymentsCommand
 from .mark_preparation_as_completed import MarkPreparationAsCompletedCommand
 from .mark_preparation_as_ready import MarkPreparationAsReadyCommand
 
 __all__ = [
     "CreatePreparationFromPaymentCommand",
+    "ImportPreparationsFromPaymentsCommand",
     "MarkPreparationAsCompletedCommand",
     "MarkPreparationAsReadyCommand",
 ]
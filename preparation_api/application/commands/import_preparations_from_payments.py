@@ -0,0 +1,11 @@
+"""Command to import preparations from many payments"""
+
+from pydantic import BaseModel, Field
+
+
+class ImportPreparationsFromPaymentsCommand(BaseModel):
+    """Command to import preparations from many payments"""
+
+    payment_ids: list[str] = Field(
+        ..., description="The unique identifiers of the payments, in queue order"
+    )
@@ -0,0 +1,6 @@
+"""Application queries package"""
+
+from .get_preparation_changes import GetPreparationChangesQuery
+from .get_waiting_list_page import GetWaitingListPageQuery
+
+__all__ = ["GetPreparationChangesQuery", "GetWaitingListPageQuery"]
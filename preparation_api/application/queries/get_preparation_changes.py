@@ -0,0 +1,25 @@
+"""Query to get the preparations changed since a given time"""
+
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class GetPreparationChangesQuery(BaseModel):
+    """Query to get the preparations changed since a given time"""
+
+    since: datetime = Field(
+        ..., description="Only preparations changed after this time are listed"
+    )
+
+    limit: int = Field(..., gt=0, description="Maximum number of preparations")
+
+    @field_validator("since")
+    @classmethod
+    def to_naive_utc(cls, since: datetime) -> datetime:
+        """The preparation timestamps are stored as naive UTC times"""
+
+        if since.tzinfo is None:
+            return since
+
+        return since.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,18 @@
+"""Query to get a page of the waiting list"""
+
+from pydantic import BaseModel, Field
+
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
+
+
+class GetWaitingListPageQuery(BaseModel):
+    """Query to get a page of the waiting list"""
+
+    limit: int = Field(..., gt=0, description="Maximum number of preparations")
+    preparation_status: PreparationStatus | None = Field(
+        None, description="Only list the preparations with this status"
+    )
+
+    after: WaitingListCursor | None = Field(
+        None, description="Cursor returned with the previous page"
+    )
@@ -1,14 +1,22 @@
 """Use cases package initialization"""
 
+from .archive_completed_preparations import ArchiveCompletedPreparationsUseCase
 from .create_preparation_from_payment import CreatePreparationFromPaymentUseCase
+from .get_preparation_changes import GetPreparationChangesUseCase
 from .get_waiting_list import GetWaitingListUseCase
+from .get_waiting_list_page import GetWaitingListPageUseCase
+from .import_preparations_from_payments import ImportPreparationsFromPaymentsUseCase
 from .mark_preparation_as_completed import MarkPreparationAsCompletedUseCase
 from .mark_preparation_as_ready import MarkPreparationAsReadyUseCase
 from .start_next_preparation import StartNextPreparationUseCase
 
 __all__ = [
+    "ArchiveCompletedPreparationsUseCase",
     "CreatePreparationFromPaymentUseCase",
+    "GetPreparationChangesUseCase",
     "GetWaitingListUseCase",
+    "GetWaitingListPageUseCase",
+    "ImportPreparationsFromPaymentsUseCase",
     "StartNextPreparationUseCase",
     "MarkPreparationAsReadyUseCase",
     "MarkPreparationAsCompletedUseCase",
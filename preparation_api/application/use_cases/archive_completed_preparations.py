@@ -0,0 +1,55 @@
+"""Use case to archive the completed preparations past the retention window"""
+
+import logging
+from datetime import timedelta
+
+from preparation_api.domain.ports import PreparationRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveCompletedPreparationsUseCase:
+    """Use case to archive the completed preparations past the retention window"""
+
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        retention: timedelta,
+        batch_size: int,
+    ):
+        self.preparation_repository = preparation_repository
+        self.retention = retention
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        """Execute the use case to archive the completed preparations past the
+        retention window
+
+        :return: The number of archived preparations
+        :rtype: int
+        :raises PersistenceError: If there is an error archiving the preparations
+        """
+
+        logger.info(
+            "Called the use case to archive preparations completed more than %s ago",
+            self.retention,
+        )
+
+        # Archive in small batches, each one in its own short transaction, until a
+        # batch comes back short. The retention is counted back from the clock of
+        # the repository, the one the preparations are timestamped with
+        archived_count = 0
+        while True:
+            batch_count = await self.preparation_repository.archive_completed(
+                retention=self.retention, limit=self.batch_size
+            )
+
+            archived_count += batch_count
+            logger.debug("Archived a batch of %d preparations", batch_count)
+            if batch_count < self.batch_size:
+                break
+
+        logger.info("Archived %d completed preparations", archived_count)
+
+        # Return the number of archived preparations
+        return archived_count
@@ -4,7 +4,12 @@ import logging
 
 from preparation_api.application.commands import CreatePreparationFromPaymentCommand
 from preparation_api.domain.entities import PreparationIn, PreparationOut
-from preparation_api.domain.ports import OrderInfoProvider, PreparationRepository
+from preparation_api.domain.exceptions import AlreadyExists
+from preparation_api.domain.ports import (
+    OrderInfoProvider,
+    PreparationRepository,
+    WaitingListCache,
+)
 from preparation_api.domain.value_objects import PreparationStatus
 
 logger = logging.getLogger(__name__)
@@ -17,9 +22,11 @@ class CreatePreparationFromPaymentUseCase:
         self,
         preparation_repository: PreparationRepository,
         order_info_provider: OrderInfoProvider,
+        waiting_list_cache: WaitingListCache | None = None,
     ):
         self.preparation_repository = preparation_repository
         self.order_info_provider = order_info_provider
+        self.waiting_list_cache = waiting_list_cache
 
     async def execute(
         self, command: CreatePreparationFromPaymentCommand
@@ -32,6 +39,7 @@ class CreatePreparationFromPaymentUseCase:
         :rtype: PreparationOut
         :raises OrderInfoProviderError: If there is an error fetching order information
         :raises PersistenceError: If there is an error saving the preparation
+        :raises AlreadyExists: If the preparation of the payment already exists
         :raises ValueError: If there is a validation error
         """
 
@@ -40,30 +48,30 @@ class CreatePreparationFromPaymentUseCase:
             command.payment_id,
         )
 
-        # Validate
-        if await self.preparation_repository.exists_by_id(command.payment_id):
-            raise ValueError(
-                f"Preparation for payment ID {command.payment_id} already exists"
-            )
-
         # Get order info from the OrderInfoProvider
         order_info = await self.order_info_provider.get(order_id=command.payment_id)
 
-        # Find the next preparation position
-        preparation_position = await self.preparation_repository.find_max_position() + 1
-
-        # Create the PreparationIn entity
+        # Create the PreparationIn entity, its position is allocated when enqueued
         preparation_in = PreparationIn(
             id=order_info.order_id,
-            preparation_position=preparation_position,
             preparation_time=order_info.preparation_time,
             preparation_status=PreparationStatus.RECEIVED,
         )
 
-        # Save the preparation using the repository
-        preparation_out = await self.preparation_repository.save(
-            preparation=preparation_in
-        )
+        # Enqueue the preparation using the repository, which also detects
+        # duplicated payments without a separate existence check
+        try:
+            preparation_out = await self.preparation_repository.enqueue(
+                preparation=preparation_in
+            )
+        except AlreadyExists as error:
+            raise AlreadyExists(
+                f"Preparation for payment ID {command.payment_id} already exists"
+            ) from error
+
+        # The waiting list changed, so the cached one is stale
+        if self.waiting_list_cache is not None:
+            self.waiting_list_cache.invalidate()
 
         # Return the created PreparationOut entity
         return preparation_out
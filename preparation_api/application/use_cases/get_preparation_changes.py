@@ -0,0 +1,61 @@
+"""Use case to get the preparations changed since a given time"""
+
+import logging
+from datetime import datetime, timedelta
+
+from preparation_api.application.queries import GetPreparationChangesQuery
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.ports import PreparationRepository
+
+logger = logging.getLogger(__name__)
+
+# A change is stamped with the start of its transaction but only seen once it
+# commits, so changes newer than this are listed again by the next call in case an
+# older one commits after them
+DEFAULT_SETTLE_TIME = timedelta(seconds=5)
+
+
+class GetPreparationChangesUseCase:
+    """Use case to get the preparations changed since a given time"""
+
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        settle_time: timedelta = DEFAULT_SETTLE_TIME,
+    ):
+        self.preparation_repository = preparation_repository
+        self.settle_time = settle_time
+
+    async def execute(
+        self, query: GetPreparationChangesQuery
+    ) -> tuple[list[PreparationOut], datetime, bool]:
+        """Execute the use case to get the preparations changed since a given time
+
+        :param query: The query containing the time to list the changes since and
+            the maximum number of changes
+        :type query: GetPreparationChangesQuery
+        :return: The changed PreparationOut entities, the time to list the next
+            changes since, and whether there were too many changes to list, in which
+            case the whole waiting list must be read again
+        :rtype: tuple[list[PreparationOut], datetime, bool]
+        :raises PersistenceError: If there is an error retrieving the changes
+        """
+
+        logger.info(
+            "Called the use case to get the preparations changed since %s",
+            query.since,
+        )
+
+        # One more than the limit tells whether some changes were left out
+        preparations, read_at = await self.preparation_repository.get_changed_since(
+            since=query.since, limit=query.limit + 1
+        )
+
+        settled_at = read_at - self.settle_time
+        if len(preparations) > query.limit:
+            logger.info("Too many changes since %s, resync required", query.since)
+            return [], settled_at, True
+
+        # Every change up to the read was listed, so the next call can start from
+        # the changes that may still be committed late
+        return preparations, max(query.since, settled_at), False
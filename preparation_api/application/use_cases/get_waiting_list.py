@@ -3,7 +3,7 @@
 import logging
 
 from preparation_api.domain.entities import PreparationOut
-from preparation_api.domain.ports import PreparationRepository
+from preparation_api.domain.ports import PreparationRepository, WaitingListCache
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +11,13 @@ logger = logging.getLogger(__name__)
 class GetWaitingListUseCase:
     """Use case to get the waiting list"""
 
-    def __init__(self, preparation_repository: PreparationRepository):
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        waiting_list_cache: WaitingListCache | None = None,
+    ):
         self.preparation_repository = preparation_repository
+        self.waiting_list_cache = waiting_list_cache
 
     async def execute(self) -> list[PreparationOut]:
         """Execute the use case to get the waiting list
@@ -24,18 +29,15 @@ class GetWaitingListUseCase:
 
         logger.info("Called the use case to get the waiting list")
 
-        # Retrieve the ready preparations retrieved from the repository
-        waiting_list = await self.preparation_repository.get_ready_waiting_list()
-
-        # Combine with in-preparation preparations retrieved from the repository
-        waiting_list.extend(
-            await self.preparation_repository.get_in_preparation_waiting_list()
-        )
-
-        # Combine with received preparations retrieved from the repository
-        waiting_list.extend(
-            await self.preparation_repository.get_received_waiting_list()
-        )
+        # Retrieve the ready, in preparation and received preparations, in this
+        # order, with a single read from the repository, shared through the cache
+        # by the reads that happen while it is fresh
+        if self.waiting_list_cache is not None:
+            waiting_list = await self.waiting_list_cache.get_or_load(
+                self.preparation_repository.get_waiting_list
+            )
+        else:
+            waiting_list = await self.preparation_repository.get_waiting_list()
 
         # Return the complete waiting list
         return waiting_list
@@ -0,0 +1,55 @@
+"""Use case to get a page of the waiting list"""
+
+import logging
+
+from preparation_api.application.queries import GetWaitingListPageQuery
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.ports import PreparationRepository
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
+
+logger = logging.getLogger(__name__)
+
+
+class GetWaitingListPageUseCase:
+    """Use case to get a page of the waiting list"""
+
+    def __init__(self, preparation_repository: PreparationRepository):
+        self.preparation_repository = preparation_repository
+
+    async def execute(
+        self, query: GetWaitingListPageQuery
+    ) -> tuple[list[PreparationOut], WaitingListCursor | None]:
+        """Execute the use case to get a page of the waiting list
+
+        :param query: The query containing the status filter, the page size and
+            the cursor of the previous page
+        :type query: GetWaitingListPageQuery
+        :return: The PreparationOut entities of the page and the cursor of the next
+            page, which is None on the last page
+        :rtype: tuple[list[PreparationOut], WaitingListCursor | None]
+        :raises ValueError: If there is a validation error
+        :raises PersistenceError: If there is an error retrieving the waiting list
+        """
+
+        logger.info(
+            "Called the use case to get a page of the waiting list status=%s",
+            query.preparation_status,
+        )
+
+        # Completed preparations are not part of the waiting list
+        if query.preparation_status == PreparationStatus.COMPLETED:
+            raise ValueError("Completed preparations are not in the waiting list")
+
+        # A cursor only resumes the listing it was returned with
+        if query.after is not None and (
+            query.after.preparation_status == PreparationStatus.COMPLETED
+            or query.preparation_status not in (None, query.after.preparation_status)
+        ):
+            raise ValueError("The cursor does not belong to this waiting list")
+
+        # Retrieve the page and the cursor of the next one from the repository
+        return await self.preparation_repository.get_waiting_list_page(
+            limit=query.limit,
+            preparation_status=query.preparation_status,
+            after=query.after,
+        )
@@ -0,0 +1,94 @@
+"""Use case to import preparations from many payments"""
+
+import asyncio
+import logging
+
+from preparation_api.application.commands import ImportPreparationsFromPaymentsCommand
+from preparation_api.domain.entities import PreparationIn
+from preparation_api.domain.exceptions import OrderInfoProviderError
+from preparation_api.domain.ports import OrderInfoProvider, PreparationRepository
+from preparation_api.domain.value_objects import OrderInfo, PreparationStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ImportPreparationsFromPaymentsUseCase:
+    """Use case to import preparations from many payments"""
+
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        order_info_provider: OrderInfoProvider,
+        max_concurrency: int = 10,
+    ):
+        self.preparation_repository = preparation_repository
+        self.order_info_provider = order_info_provider
+        self.max_concurrency = max_concurrency
+
+    async def execute(
+        self, command: ImportPreparationsFromPaymentsCommand
+    ) -> list[str]:
+        """Execute the use case to import preparations from many payments
+
+        Payments whose preparation already exists are skipped, so an interrupted
+        import can simply be run again.
+
+        :param command: The command containing the payment IDs
+        :type command: ImportPreparationsFromPaymentsCommand
+        :return: The IDs of the imported preparations, in queue order
+        :rtype: list[str]
+        :raises OrderInfoProviderError: If there is an error fetching order information
+        :raises PersistenceError: If there is an error saving the preparations
+        """
+
+        # Repeated payment IDs keep their first position
+        payment_ids = list(dict.fromkeys(command.payment_ids))
+        logger.info(
+            "Called the use case to import preparations from %d payments",
+            len(payment_ids),
+        )
+
+        # Get the order info of every payment concurrently, failing the whole
+        # import before anything is saved if any of them cannot be fetched
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(
+                        self._get_order_info(payment_id=payment_id, semaphore=semaphore)
+                    )
+                    for payment_id in payment_ids
+                ]
+        except* OrderInfoProviderError as errors:
+            raise errors.exceptions[0]
+
+        # Create the PreparationIn entities, their positions are allocated in the
+        # order of the payments when saved
+        preparations_in = [
+            PreparationIn(
+                id=order_info.order_id,
+                preparation_time=order_info.preparation_time,
+                preparation_status=PreparationStatus.RECEIVED,
+            )
+            for order_info in (task.result() for task in tasks)
+        ]
+
+        # Save every preparation at once using the repository
+        imported_ids = await self.preparation_repository.save_many(
+            preparations=preparations_in
+        )
+
+        logger.info(
+            "Imported %d preparations, skipped %d already existing",
+            len(imported_ids),
+            len(preparations_in) - len(imported_ids),
+        )
+
+        # Return the IDs of the imported preparations
+        return imported_ids
+
+    async def _get_order_info(
+        self, payment_id: str, semaphore: asyncio.Semaphore
+    ) -> OrderInfo:
+        async with semaphore:
+            return await self.order_info_provider.get(order_id=payment_id)
@@ -5,7 +5,7 @@ import logging
 from preparation_api.application.commands import MarkPreparationAsReadyCommand
 from preparation_api.domain.entities import PreparationIn, PreparationOut
 from preparation_api.domain.exceptions import NotFound
-from preparation_api.domain.ports import PreparationRepository
+from preparation_api.domain.ports import PreparationRepository, WaitingListCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +13,13 @@ logger = logging.getLogger(__name__)
 class MarkPreparationAsReadyUseCase:
     """Use case to mark a preparation as ready"""
 
-    def __init__(self, preparation_repository: PreparationRepository):
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        waiting_list_cache: WaitingListCache | None = None,
+    ):
         self.preparation_repository = preparation_repository
+        self.waiting_list_cache = waiting_list_cache
 
     async def execute(self, command: MarkPreparationAsReadyCommand) -> PreparationOut:
         """Execute the use case to mark a preparation as ready
@@ -59,5 +64,9 @@ class MarkPreparationAsReadyUseCase:
             preparation=preparation_in
         )
 
+        # The waiting list changed, so the cached one is stale
+        if self.waiting_list_cache is not None:
+            self.waiting_list_cache.invalidate()
+
         # Return the updated PreparationOut entity
         return updated_preparation
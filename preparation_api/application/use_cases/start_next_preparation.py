@@ -1,12 +1,10 @@
 """Use case to start the next preparation"""
 
 import logging
-from datetime import datetime, timedelta
 
-from preparation_api.domain.entities import PreparationIn, PreparationOut
+from preparation_api.domain.entities import PreparationOut
 from preparation_api.domain.exceptions import NotFound
-from preparation_api.domain.ports import PreparationRepository
-from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.domain.ports import PreparationRepository, WaitingListCache
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +12,13 @@ logger = logging.getLogger(__name__)
 class StartNextPreparationUseCase:
     """Use case to start the next preparation"""
 
-    def __init__(self, preparation_repository: PreparationRepository):
+    def __init__(
+        self,
+        preparation_repository: PreparationRepository,
+        waiting_list_cache: WaitingListCache | None = None,
+    ):
         self.preparation_repository = preparation_repository
+        self.waiting_list_cache = waiting_list_cache
 
     async def execute(self) -> PreparationOut:
         """Execute the use case to start the next preparation
@@ -28,42 +31,21 @@ class StartNextPreparationUseCase:
 
         logger.info("Called the use case to start the next preparation")
 
-        # Find the received preparation with the minimum position
+        # Claim and start the received preparation with the minimum position in a
+        # single step, so concurrent kitchen stations never start the same one
         try:
-            preparation_out = (
-                await self.preparation_repository.find_received_with_min_position()
+            started_preparation_out = (
+                await self.preparation_repository.start_next_received()
             )
         except NotFound as error:
             raise ValueError("No received preparation found to start") from error
 
-        # Save the old preparation position to decrease positions later
-        old_preparation_position = preparation_out.preparation_position
+        # The positions of the remaining received preparations are derived from
+        # their enqueue order, so there is nothing else to update
 
-        # Calculate the estimated datetime to the preparation be ready
-        estimated_ready_time = datetime.now() + timedelta(
-            minutes=preparation_out.preparation_time
-        )
-
-        # Create the updated PreparationIn entity
-        preparation_in = PreparationIn(
-            id=preparation_out.id,
-            preparation_position=None,  # Remove position when in preparation
-            preparation_time=preparation_out.preparation_time,
-            estimated_ready_time=estimated_ready_time,
-            preparation_status=PreparationStatus.IN_PREPARATION,
-        )
-
-        # Save the updated preparation
-        updated_preparation_out = await self.preparation_repository.save(
-            preparation=preparation_in
-        )
-
-        # Decrease the position of all received preparations with position greater
-        # than the old preparation position
-        if old_preparation_position is not None:
-            await self.preparation_repository.decrement_received_positions_greater_than(
-                preparation_position=old_preparation_position
-            )
+        # The waiting list changed, so the cached one is stale
+        if self.waiting_list_cache is not None:
+            self.waiting_list_cache.invalidate()
 
         # Return the started PreparationOut entity
-        return updated_preparation_out
+        return started_preparation_out
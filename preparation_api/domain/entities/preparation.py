@@ -14,7 +14,7 @@ class PreparationIn(BaseModel):
 
     id: str = Field(description="Unique identifier for the preparation")
     preparation_position: int | None = Field(
-        None, description="Position of the preparation in the queue"
+        default=None, description="Position of the preparation in the queue"
     )
 
     preparation_time: int = Field(
@@ -22,7 +22,7 @@ class PreparationIn(BaseModel):
     )
 
     estimated_ready_time: datetime | None = Field(
-        None, description="Estimated time when the preparation will be ready"
+        default=None, description="Estimated time when the preparation will be ready"
     )
 
     preparation_status: PreparationStatus = Field(
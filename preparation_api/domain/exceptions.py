@@ -15,6 +15,13 @@ class NotFound(DomainException):
         super().__init__(message)
 
 
+class AlreadyExists(DomainException):
+    """The already exists exception."""
+
+    def __init__(self, message="Already exists"):
+        super().__init__(message)
+
+
 class PersistenceError(DomainException):
     """If an error occurs trying to persist or retrieve data"""
 
@@ -31,3 +38,10 @@ class OrderInfoProviderError(DomainException):
         self, message="An error occurred while trying to fetch order information"
     ):
         super().__init__(message)
+
+
+class OrderInfoNotFound(OrderInfoProviderError):
+    """If the order information to fetch does not exist"""
+
+    def __init__(self, message="Order information not found"):
+        super().__init__(message)
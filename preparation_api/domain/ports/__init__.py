@@ -2,5 +2,6 @@
 
 from .order_info_provider import OrderInfoProvider
 from .preparation_repository import PreparationRepository
+from .waiting_list_cache import WaitingListCache
 
-__all__ = ["PreparationRepository", "OrderInfoProvider"]
+__all__ = ["PreparationRepository", "OrderInfoProvider", "WaitingListCache"]
@@ -16,6 +16,7 @@ class OrderInfoProvider(ABC):
         :type order_id: str
         :return: Order information
         :rtype: OrderInfo
+        :raises OrderInfoNotFound: If the order does not exist
         :raises OrderInfoProviderError: If an error occurs while fetching order
             information
         """
@@ -1,8 +1,10 @@
 """Preparation repository interface"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 
 from preparation_api.domain.entities import PreparationIn, PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
 
 
 class PreparationRepository(ABC):
@@ -10,7 +12,8 @@ class PreparationRepository(ABC):
 
     @abstractmethod
     async def save(self, preparation: PreparationIn) -> PreparationOut:
-        """Saves a preparation entity
+        """Saves a preparation entity, inserting it or updating the existing one
+        with the same ID
 
         :param: preparation: Preparation entity to be saved
         :type preparation: PreparationIn
@@ -20,6 +23,39 @@ class PreparationRepository(ABC):
             preparation entity
         """
 
+    @abstractmethod
+    async def enqueue(self, preparation: PreparationIn) -> PreparationOut:
+        """Inserts a new preparation at the end of the queue
+
+        The preparation position is allocated while inserting, so concurrent calls
+        never share a position. The given preparation position is ignored.
+
+        :param: preparation: Preparation entity to be enqueued
+        :type preparation: PreparationIn
+        :return: Enqueued preparation entity
+        :rtype: PreparationOut
+        :raises AlreadyExists: If a preparation with the same ID already exists
+        :raises PersistenceError: If an error occurs while inserting the
+            preparation entity
+        """
+
+    @abstractmethod
+    async def save_many(self, preparations: list[PreparationIn]) -> list[str]:
+        """Inserts many preparations at once, skipping the ones whose ID already
+        exists
+
+        Received preparations are queued in the given order, with positions
+        allocated the same way as when enqueued. The given preparation positions
+        are ignored.
+
+        :param: preparations: Preparation entities to be inserted
+        :type preparations: list[PreparationIn]
+        :return: IDs of the inserted preparations, in the given order
+        :rtype: list[str]
+        :raises PersistenceError: If an error occurs while inserting the
+            preparation entities
+        """
+
     @abstractmethod
     async def find_by_id(self, preparation_id: str) -> PreparationOut:
         """Finds a preparation by its ID
@@ -46,36 +82,104 @@ class PreparationRepository(ABC):
         """
 
     @abstractmethod
-    async def find_max_position(self) -> int:
-        """Finds the maximum preparation position among preparations
+    async def start_next_received(self) -> PreparationOut:
+        """Atomically claims the received preparation with the minimum preparation
+        position and moves it to IN_PREPARATION
+
+        The claimed preparation leaves the queue and its estimated ready time is
+        the current time of the storage, in UTC, plus its preparation time.
+        Concurrent calls never claim the same preparation and do not wait for each
+        other.
+
+        :return: The started preparation entity
+        :rtype: PreparationOut
+        :raises NotFound: If no preparation with status RECEIVED is available
+        :raises PersistenceError: If an error occurs while updating the
+            preparation entity
+        """
 
-        :return: Maximum preparation position
+    @abstractmethod
+    async def archive_completed(self, retention: timedelta, limit: int) -> int:
+        """Moves a batch of completed preparations last updated longer ago than
+        the retention to the preparation history
+
+        Each call is its own short transaction. Preparations locked by concurrent
+        transactions are skipped and left for a later call. The retention is
+        counted back from the current time of the storage, the same clock the
+        preparations are timestamped with.
+
+        :param: retention: Only preparations last updated longer ago than this
+            are archived
+        :type retention: timedelta
+        :param: limit: Maximum number of preparations to archive
+        :type limit: int
+        :return: Number of archived preparations
         :rtype: int
-        :raises PersistenceError: If an error occurs while retrieving the
-            maximum preparation position
+        :raises PersistenceError: If an error occurs while archiving the
+            preparation entities
         """
 
     @abstractmethod
-    async def find_received_with_min_position(self) -> PreparationOut:
-        """Finds the received preparation with the minimum preparation position
+    async def get_waiting_list(self) -> list[PreparationOut]:
+        """Gets the whole waiting list in a single read
 
-        :return: Preparation entity with the minimum position and status RECEIVED
-        :rtype: PreparationOut
-        :raises NotFound: If no preparation with status RECEIVED exists
+        The list holds the READY preparations ordered by timestamp, then the
+        IN_PREPARATION ones ordered by estimated ready time and finally the RECEIVED
+        ones ordered by their position in the queue
+
+        :return: List of the preparations that are not completed
+        :rtype: list[PreparationOut]
         :raises PersistenceError: If an error occurs while retrieving the
-            preparation entity
+            preparation entities
         """
 
     @abstractmethod
-    async def decrement_received_positions_greater_than(
-        self, preparation_position: int
-    ) -> None:
-        """Decrements the preparation positions of received preparations greater than
-        the given position
-
-        :param: preparation_position: Position threshold
-        :type preparation_position: int
-        :raises PersistenceError: If an error occurs while updating the
+    async def get_waiting_list_page(
+        self,
+        limit: int,
+        preparation_status: PreparationStatus | None = None,
+        after: WaitingListCursor | None = None,
+    ) -> tuple[list[PreparationOut], WaitingListCursor | None]:
+        """Gets a page of the waiting list, in the same order as the whole one
+
+        Pages are read by keyset, so each one costs the same however deep in the
+        waiting list it starts.
+
+        :param: limit: Maximum number of preparations in the page
+        :type limit: int
+        :param: preparation_status: Only preparations with this status are listed,
+            all the waiting list statuses are listed when omitted
+        :type preparation_status: PreparationStatus | None
+        :param: after: Cursor returned with the previous page, the first page is
+            read when omitted
+        :type after: WaitingListCursor | None
+        :return: The preparations of the page and the cursor of the next page,
+            which is None on the last page
+        :rtype: tuple[list[PreparationOut], WaitingListCursor | None]
+        :raises PersistenceError: If an error occurs while retrieving the
+            preparation entities
+        """
+
+    @abstractmethod
+    async def get_changed_since(
+        self, since: datetime, limit: int
+    ) -> tuple[list[PreparationOut], datetime]:
+        """Gets the preparations whose row changed after the given time
+
+        Preparations that left the waiting list are included, with their status,
+        until they are archived. The position of a received preparation is its
+        current position in the queue. When a preparation that may have left the
+        queue changed, every received preparation is included, as the positions
+        behind it moved without their rows changing.
+
+        :param: since: Only preparations last updated after this time are listed
+        :type since: datetime
+        :param: limit: Maximum number of preparations to list
+        :type limit: int
+        :return: The changed preparations ordered by their last update and the
+            database time the read started at
+        :rtype: tuple[list[PreparationOut], datetime]
+        :raises PersistenceError: If an error occurs while retrieving the
             preparation entities
         """
 
@@ -83,6 +187,9 @@ class PreparationRepository(ABC):
     async def get_received_waiting_list(self) -> list[PreparationOut]:
         """Gets the list of preparations with status RECEIVED
 
+        The preparation position of each item is its current position in the queue,
+        starting at 1, whatever the gaps left by preparations already started
+
         :return: List of preparations with status RECEIVED
         :rtype: list[PreparationOut]
         :raises PersistenceError: If an error occurs while retrieving the
@@ -0,0 +1,42 @@
+"""Abstract base class for the waiting list cache"""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import CacheStats
+
+
+class WaitingListCache(ABC):
+    """Abstract base class for the waiting list cache"""
+
+    @abstractmethod
+    async def get_or_load(
+        self, loader: Callable[[], Awaitable[list[PreparationOut]]]
+    ) -> list[PreparationOut]:
+        """Gets the cached waiting list, loading it when missing or expired
+
+        Concurrent reads that miss share a single load. The returned list may be
+        shared with other reads, so it must not be modified.
+
+        :param: loader: Loads the whole waiting list
+        :type loader: Callable[[], Awaitable[list[PreparationOut]]]
+        :return: The whole waiting list
+        :rtype: list[PreparationOut]
+        :raises PersistenceError: If an error occurs while loading the waiting list
+        """
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Discards the cached waiting list after a change to the preparations
+
+        Loads already in progress are not shared with the reads that follow.
+        """
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Gets the counters of how the reads of the cache were served
+
+        :return: The cache statistics
+        :rtype: CacheStats
+        """
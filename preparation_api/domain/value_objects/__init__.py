@@ -1,6 +1,8 @@
 """Domain value objects package"""
 
+from .cache_stats import CacheStats
 from .order_info import OrderInfo
 from .preparation_status import PreparationStatus
+from .waiting_list_cursor import WaitingListCursor
 
-__all__ = ["OrderInfo", "PreparationStatus"]
+__all__ = ["CacheStats", "OrderInfo", "PreparationStatus", "WaitingListCursor"]
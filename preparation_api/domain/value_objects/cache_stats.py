@@ -0,0 +1,20 @@
+"""Cache statistics value object definition"""
+
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    """Counters of how the reads of a cache were served"""
+
+    hits: int = Field(..., description="Reads served from the cached value")
+    misses: int = Field(..., description="Reads that loaded the value")
+    coalesced: int = Field(
+        ..., description="Reads that waited for a load started by another read"
+    )
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of the reads served without loading the value themselves"""
+
+        reads = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / reads if reads else 0.0
@@ -0,0 +1,43 @@
+"""Waiting list cursor value object definition"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, model_validator
+
+from .preparation_status import PreparationStatus
+
+
+class WaitingListCursor(BaseModel):
+    """Position after which the next page of the waiting list starts"""
+
+    preparation_status: PreparationStatus = Field(
+        ..., description="Status of the last preparation of the previous page"
+    )
+
+    sort_key: datetime | int = Field(
+        ...,
+        description="Value the waiting list of that status is sorted by for the last "
+        "preparation of the previous page",
+    )
+
+    id: str = Field(
+        ...,
+        description="Unique identifier of the last preparation of the previous page, "
+        "breaking ties between equal sort keys",
+    )
+
+    @model_validator(mode="after")
+    def check_sort_key_type(self) -> "WaitingListCursor":
+        """The received waiting list is sorted by position and the others by time"""
+
+        expected_type = (
+            int if self.preparation_status == PreparationStatus.RECEIVED else datetime
+        )
+
+        if not isinstance(self.sort_key, expected_type):
+            raise ValueError(
+                f"The sort key of a {self.preparation_status.value} cursor must be "
+                f"of type {expected_type.__name__}"
+            )
+
+        return self
@@ -1,7 +1,8 @@
 """Entrypoint module for the Preparation API application"""
 
+import asyncio
+import contextlib
 import logging
-from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
@@ -12,6 +13,10 @@ from preparation_api.infrastructure import factory
 from preparation_api.infrastructure.config import (
     APPSettings,
     DatabaseSettings,
+    PreparationChangedListenerSettings,
+    ResponseCompressionSettings,
+    WaitingListCacheSettings,
+    WaitingListStreamSettings,
 )
 
 logger = logging.getLogger(__name__)
@@ -27,7 +32,7 @@ def create_api() -> FastAPI:
     return app_instance
 
 
-@asynccontextmanager
+@contextlib.asynccontextmanager
 async def fastapi_lifespan(app_instance: FastAPI):
     """Lifespan context manager for FastAPI application"""
 
@@ -51,8 +56,45 @@ async def fastapi_lifespan(app_instance: FastAPI):
         settings=app_instance.state.database_settings
     )
 
+    logger.info("Starting waiting list cache")
+    app_instance.state.waiting_list_cache = factory.get_waiting_list_cache(
+        settings=WaitingListCacheSettings()
+    )
+
+    logger.info("Starting response compressor")
+    app_instance.state.response_compressor = factory.get_response_compressor(
+        settings=ResponseCompressionSettings()
+    )
+
+    logger.info("Starting waiting list broadcaster")
+    app_instance.state.waiting_list_broadcaster = factory.get_waiting_list_broadcaster(
+        session_manager=app_instance.state.session_manager,
+        waiting_list_cache=app_instance.state.waiting_list_cache,
+        settings=WaitingListStreamSettings(),
+    )
+    waiting_list_broadcaster_task = asyncio.create_task(
+        app_instance.state.waiting_list_broadcaster.run()
+    )
+
+    logger.info("Starting preparation changed listener")
+    preparation_changed_listener = factory.get_preparation_changed_listener(
+        database_settings=app_instance.state.database_settings,
+        settings=PreparationChangedListenerSettings(),
+        waiting_list_cache=app_instance.state.waiting_list_cache,
+        on_change=app_instance.state.waiting_list_broadcaster.notify_changed,
+    )
+    preparation_changed_listener_task = asyncio.create_task(
+        preparation_changed_listener.listen()
+    )
+
     # Application state teardown
     yield
+    logger.info("Stopping preparation changed listener and waiting list broadcaster")
+    for task in (preparation_changed_listener_task, waiting_list_broadcaster_task):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
     logger.info("Closing session manager")
     await app_instance.state.session_manager.close()
 
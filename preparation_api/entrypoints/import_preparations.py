@@ -0,0 +1,100 @@
+"""Bulk preparation import entrypoint module
+
+Recreates the preparations of a list of payments, for incident recovery and store
+onboarding. The payment IDs are read one per line, in queue order, from a file or
+from the standard input::
+
+    python -m preparation_api.entrypoints.import_preparations payments.txt
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from preparation_api.application.commands import ImportPreparationsFromPaymentsCommand
+from preparation_api.infrastructure import factory
+from preparation_api.infrastructure.config import DatabaseSettings, OrderAPISettings
+from preparation_api.infrastructure.http import log_order_api_stats
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments"""
+
+    parser = argparse.ArgumentParser(
+        description="Import the preparations of many payments at once"
+    )
+
+    parser.add_argument(
+        "file",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="File with one payment ID per line, defaults to the standard input",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of concurrent requests to the Order API",
+    )
+
+    return parser.parse_args(args)
+
+
+async def main():
+    """Run the bulk preparation import"""
+
+    args = parse_args()
+    with args.file as file:
+        payment_ids = [line.strip() for line in file if line.strip()]
+
+    logger.info("Loading database settings")
+    db_settings = DatabaseSettings()
+    logger.info("Loading Order API settings")
+    order_api_settings = OrderAPISettings()
+    logger.info("Starting session manager")
+    session_manager = factory.get_session_manager(settings=db_settings)
+    logger.info("Starting HTTP client")
+    order_api_transport = factory.get_order_api_transport(settings=order_api_settings)
+    http_client = factory.get_http_client(
+        settings=order_api_settings, transport=order_api_transport
+    )
+    order_info_provider = factory.get_order_info_provider(
+        settings=order_api_settings, http_client=http_client
+    )
+    try:
+        async with factory.get_db_session(session_manager=session_manager) as session:
+            use_case = factory.get_import_preparations_from_payments_use_case(
+                preparation_repository=factory.get_preparation_repository(
+                    session=session
+                ),
+                order_info_provider=order_info_provider,
+                max_concurrency=args.concurrency,
+            )
+
+            logger.info("Importing preparations from %d payments", len(payment_ids))
+            imported_ids = await use_case.execute(
+                command=ImportPreparationsFromPaymentsCommand(payment_ids=payment_ids)
+            )
+
+        log_order_api_stats(order_info_provider, order_api_transport)
+
+        logger.info(
+            "Imported %d preparations: %s", len(imported_ids), ", ".join(imported_ids)
+        )
+    finally:
+        logger.info("Closing session manager")
+        await session_manager.close()
+        logger.info("Closing HTTP client")
+        await http_client.aclose()
+
+
+if __name__ == "__main__":
+    import logging.config
+
+    logging.config.fileConfig("logging.ini", disable_existing_loggers=False)
+    asyncio.run(main())
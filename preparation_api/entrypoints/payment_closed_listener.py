@@ -1,6 +1,7 @@
 """Payment closed event listener entrypoint module"""
 
 import asyncio
+import contextlib
 import logging
 import signal
 
@@ -11,6 +12,10 @@ from preparation_api.infrastructure.config import (
     OrderAPISettings,
     PaymentClosedListenerSettings,
 )
+from preparation_api.infrastructure.http import (
+    log_order_api_stats,
+    log_order_api_stats_periodically,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,16 +47,25 @@ async def main():
         logger.info("Starting session manager")
         session_manager = factory.get_session_manager(settings=db_settings)
         logger.info("Starting HTTP client")
-        http_client = factory.get_http_client()
+        order_api_transport = factory.get_order_api_transport(
+            settings=order_api_settings
+        )
+        http_client = factory.get_http_client(
+            settings=order_api_settings, transport=order_api_transport
+        )
         logger.info("Starting AWS session")
         aws_settings = AWSSettings()
         logger.info("Starting AWS session")
         aws_session = factory.get_aws_session(settings=aws_settings)
+        logger.info("Creating order info provider")
+        order_info_provider = factory.get_order_info_provider(
+            settings=order_api_settings, http_client=http_client
+        )
+
         logger.info("Creating payment closed message handler")
         handler = factory.get_payment_closed_handler(
             session_manager=session_manager,
-            order_api_settings=order_api_settings,
-            http_client=http_client,
+            order_info_provider=order_info_provider,
         )
 
         logger.info("Creating payment closed event listener")
@@ -61,8 +75,22 @@ async def main():
             settings=payment_closed_listener_settings,
         )
 
+        stats_interval = payment_closed_listener_settings.STATS_LOG_INTERVAL_SECONDS
+        stats_task = asyncio.create_task(
+            log_order_api_stats_periodically(
+                order_info_provider, order_api_transport, stats_interval
+            )
+        )
+
         logger.info("Starting payment closed event listener")
-        await listener.listen(shutdown_event=shutdown_handler)
+        try:
+            await listener.listen(shutdown_event=shutdown_handler)
+        finally:
+            stats_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stats_task
+
+        log_order_api_stats(order_info_provider, order_api_transport)
     finally:
         logger.info("Closing session manager")
         await session_manager.close()
@@ -0,0 +1,48 @@
+"""Preparation archiver entrypoint module
+
+Moves the completed preparations past the retention window to the preparation
+history and exits, so it is meant to be run on a schedule.
+"""
+
+import asyncio
+import logging
+
+from preparation_api.infrastructure import factory
+from preparation_api.infrastructure.config import (
+    DatabaseSettings,
+    PreparationArchiverSettings,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def main():
+    """Run the preparation archiver"""
+
+    logger.info("Loading database settings")
+    db_settings = DatabaseSettings()
+    logger.info("Loading Preparation Archiver settings")
+    preparation_archiver_settings = PreparationArchiverSettings()
+    logger.info("Starting session manager")
+    session_manager = factory.get_session_manager(settings=db_settings)
+    try:
+        async with factory.get_db_session(session_manager=session_manager) as session:
+            use_case = factory.get_archive_completed_preparations_use_case(
+                preparation_repository=factory.get_preparation_repository(
+                    session=session
+                ),
+                settings=preparation_archiver_settings,
+            )
+
+            logger.info("Archiving completed preparations")
+            await use_case.execute()
+    finally:
+        logger.info("Closing session manager")
+        await session_manager.close()
+
+
+if __name__ == "__main__":
+    import logging.config
+
+    logging.config.fileConfig("logging.ini", disable_existing_loggers=False)
+    asyncio.run(main())
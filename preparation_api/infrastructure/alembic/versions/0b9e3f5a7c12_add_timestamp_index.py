@@ -0,0 +1,39 @@
+"""add timestamp index
+
+Revision ID: 0b9e3f5a7c12
+Revises: f4a2d8c61b07
+Create Date: 2026-10-17 19:05:11.472930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b9e3f5a7c12"
+down_revision: Union[str, Sequence[str], None] = "f4a2d8c61b07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tb_pagamento_timestamp_id",
+            "tb_pagamento",
+            ["timestamp", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tb_pagamento_timestamp_id",
+            table_name="tb_pagamento",
+            postgresql_concurrently=True,
+        )
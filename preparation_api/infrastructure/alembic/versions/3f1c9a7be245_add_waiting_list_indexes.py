@@ -0,0 +1,92 @@
+"""add waiting list indexes
+
+Revision ID: 3f1c9a7be245
+Revises: 6dbfe5d7afe9
+Create Date: 2026-10-17 09:12:31.418250
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7be245"
+down_revision: Union[str, Sequence[str], None] = "6dbfe5d7afe9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so the live table is not locked against writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tb_pagamento_received_posicao_preparacao",
+            "tb_pagamento",
+            ["posicao_preparacao"],
+            unique=False,
+            postgresql_where=sa.text("st_preparacao = 'RECEIVED'"),
+            postgresql_include=[
+                "id",
+                "tempo_de_preparacao",
+                "estimativa_de_pronto",
+                "st_preparacao",
+                "dt_inclusao",
+                "timestamp",
+            ],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tb_pagamento_in_preparation_estimativa_de_pronto",
+            "tb_pagamento",
+            ["estimativa_de_pronto"],
+            unique=False,
+            postgresql_where=sa.text("st_preparacao = 'IN_PREPARATION'"),
+            postgresql_include=[
+                "id",
+                "posicao_preparacao",
+                "tempo_de_preparacao",
+                "st_preparacao",
+                "dt_inclusao",
+                "timestamp",
+            ],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_tb_pagamento_ready_timestamp",
+            "tb_pagamento",
+            ["timestamp"],
+            unique=False,
+            postgresql_where=sa.text("st_preparacao = 'READY'"),
+            postgresql_include=[
+                "id",
+                "posicao_preparacao",
+                "tempo_de_preparacao",
+                "estimativa_de_pronto",
+                "st_preparacao",
+                "dt_inclusao",
+            ],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tb_pagamento_ready_timestamp",
+            table_name="tb_pagamento",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tb_pagamento_in_preparation_estimativa_de_pronto",
+            table_name="tb_pagamento",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_tb_pagamento_received_posicao_preparacao",
+            table_name="tb_pagamento",
+            postgresql_concurrently=True,
+        )
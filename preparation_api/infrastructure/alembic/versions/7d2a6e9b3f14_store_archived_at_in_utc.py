@@ -0,0 +1,40 @@
+"""store archived at in utc
+
+Revision ID: 7d2a6e9b3f14
+Revises: 0b9e3f5a7c12
+Create Date: 2026-10-17 21:12:40.318205
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2a6e9b3f14"
+down_revision: Union[str, Sequence[str], None] = "0b9e3f5a7c12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "tb_pagamento_historico",
+        "dt_arquivamento",
+        existing_type=sa.TIMESTAMP(),
+        server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "tb_pagamento_historico",
+        "dt_arquivamento",
+        existing_type=sa.TIMESTAMP(),
+        server_default=sa.text("now()"),
+        existing_nullable=False,
+    )
@@ -0,0 +1,37 @@
+"""add preparation position sequence
+
+Revision ID: a84d2e6c01f3
+Revises: 3f1c9a7be245
+Create Date: 2026-10-17 11:03:54.207914
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a84d2e6c01f3"
+down_revision: Union[str, Sequence[str], None] = "3f1c9a7be245"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        sa.schema.CreateSequence(sa.Sequence("sq_tb_pagamento_posicao_preparacao"))
+    )
+    # Continue after the positions already handed out
+    op.execute(
+        "SELECT setval('sq_tb_pagamento_posicao_preparacao', "
+        "COALESCE(MAX(posicao_preparacao), 0) + 1, false) FROM tb_pagamento"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        sa.schema.DropSequence(sa.Sequence("sq_tb_pagamento_posicao_preparacao"))
+    )
@@ -0,0 +1,70 @@
+"""add preparation history table
+
+Revision ID: c5e7b19d42a8
+Revises: a84d2e6c01f3
+Create Date: 2026-10-17 14:21:07.583102
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e7b19d42a8"
+down_revision: Union[str, Sequence[str], None] = "a84d2e6c01f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tb_pagamento_historico",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("tempo_de_preparacao", sa.Integer(), nullable=False),
+        sa.Column("estimativa_de_pronto", sa.TIMESTAMP(), nullable=True),
+        sa.Column(
+            "st_preparacao",
+            sa.Enum(
+                "RECEIVED",
+                "IN_PREPARATION",
+                "READY",
+                "COMPLETED",
+                name="preparationstatus",
+                native_enum=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("dt_inclusao", sa.TIMESTAMP(), nullable=False),
+        sa.Column("timestamp", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "dt_arquivamento",
+            sa.TIMESTAMP(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Built concurrently so the live table is not locked against writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tb_pagamento_completed_timestamp",
+            "tb_pagamento",
+            ["timestamp"],
+            unique=False,
+            postgresql_where=sa.text("st_preparacao = 'COMPLETED'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tb_pagamento_completed_timestamp",
+            table_name="tb_pagamento",
+            postgresql_concurrently=True,
+        )
+    op.drop_table("tb_pagamento_historico")
@@ -0,0 +1,96 @@
+"""add id to waiting list indexes
+
+Revision ID: e1b6f0c3d957
+Revises: c5e7b19d42a8
+Create Date: 2026-10-17 16:48:22.961045
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1b6f0c3d957"
+down_revision: Union[str, Sequence[str], None] = "c5e7b19d42a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Name, sort key, status and included columns of each waiting list index
+WAITING_LIST_INDEXES = [
+    (
+        "ix_tb_pagamento_received_posicao_preparacao",
+        "posicao_preparacao",
+        "RECEIVED",
+        [
+            "tempo_de_preparacao",
+            "estimativa_de_pronto",
+            "st_preparacao",
+            "dt_inclusao",
+            "timestamp",
+        ],
+    ),
+    (
+        "ix_tb_pagamento_in_preparation_estimativa_de_pronto",
+        "estimativa_de_pronto",
+        "IN_PREPARATION",
+        [
+            "posicao_preparacao",
+            "tempo_de_preparacao",
+            "st_preparacao",
+            "dt_inclusao",
+            "timestamp",
+        ],
+    ),
+    (
+        "ix_tb_pagamento_ready_timestamp",
+        "timestamp",
+        "READY",
+        [
+            "posicao_preparacao",
+            "tempo_de_preparacao",
+            "estimativa_de_pronto",
+            "st_preparacao",
+            "dt_inclusao",
+        ],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The new indexes are built before the old ones are dropped, concurrently so
+    # the live table is never left without them nor locked against writes
+    with op.get_context().autocommit_block():
+        for name, sort_key, status, include in WAITING_LIST_INDEXES:
+            op.create_index(
+                f"{name}_id",
+                "tb_pagamento",
+                [sort_key, "id"],
+                unique=False,
+                postgresql_where=sa.text(f"st_preparacao = '{status}'"),
+                postgresql_include=include,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(name, table_name="tb_pagamento", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, sort_key, status, include in WAITING_LIST_INDEXES:
+            op.create_index(
+                name,
+                "tb_pagamento",
+                [sort_key],
+                unique=False,
+                postgresql_where=sa.text(f"st_preparacao = '{status}'"),
+                postgresql_include=["id", *include],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f"{name}_id",
+                table_name="tb_pagamento",
+                postgresql_concurrently=True,
+            )
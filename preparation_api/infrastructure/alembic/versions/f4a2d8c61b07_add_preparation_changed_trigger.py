@@ -0,0 +1,43 @@
+"""add preparation changed trigger
+
+Revision ID: f4a2d8c61b07
+Revises: e1b6f0c3d957
+Create Date: 2026-10-17 18:12:40.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a2d8c61b07"
+down_revision: Union[str, Sequence[str], None] = "e1b6f0c3d957"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION fn_notify_preparation_changed()
+        RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('preparation_changed', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """)
+    op.execute("""
+        CREATE TRIGGER tg_tb_pagamento_preparation_changed
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tb_pagamento
+        FOR EACH STATEMENT EXECUTE FUNCTION fn_notify_preparation_changed()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS tg_tb_pagamento_preparation_changed ON tb_pagamento"
+    )
+    op.execute("DROP FUNCTION IF EXISTS fn_notify_preparation_changed()")
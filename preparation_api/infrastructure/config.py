@@ -50,7 +50,16 @@ class OrderAPISettings(BaseSettings):
     )
 
     BASE_URL: str
-    TIMEOUT: float = 10.0  # seconds
+    TIMEOUT: float = 10.0  # seconds, to read and write
+    CONNECT_TIMEOUT: float = 3.0  # seconds
+    POOL_TIMEOUT: float = 5.0  # seconds waiting for a pooled connection
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    HTTP2: bool = False
+    CACHE_MAX_SIZE: int = 10_000  # orders
+    CACHE_TTL_SECONDS: float = 3600.0
+    CACHE_NOT_FOUND_TTL_SECONDS: float = 5.0
 
 
 class PaymentClosedListenerSettings(BaseSettings):
@@ -65,7 +74,80 @@ class PaymentClosedListenerSettings(BaseSettings):
     QUEUE_NAME: str
     WAIT_TIME_SECONDS: int = 5
     MAX_NUMBER_OF_MESSAGES_PER_BATCH: int = 5
-    VISIBILITY_TIMEOUT_SECONDS: int = 60
+    MAX_CONCURRENT_MESSAGES: int = 5  # handler workers
+    RECEIVERS: int = 2  # concurrent long polls
+    MAX_PENDING_SEQUENCES: int = 10  # received message groups waiting for a worker
+    VISIBILITY_TIMEOUT_SECONDS: int = 30
+    VISIBILITY_HEARTBEAT_SECONDS: float = 10.0  # seconds between lease extensions
+    DEAD_LETTER_QUEUE_NAME: str | None = None
+    MAX_RECEIVE_COUNT: int = 5  # attempts before a message is dead-lettered
+    RETRY_BASE_DELAY_SECONDS: float = 2.0
+    RETRY_MAX_DELAY_SECONDS: float = 300.0
+    STATS_LOG_INTERVAL_SECONDS: float = 60.0
+
+
+class WaitingListCacheSettings(BaseSettings):
+    """Waiting list cache settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/waiting_list_cache.env",
+        env_file_encoding="utf-8",
+        env_prefix="WAITING_LIST_CACHE_",
+    )
+
+    TTL_SECONDS: float = 1.0
+
+
+class WaitingListStreamSettings(BaseSettings):
+    """Waiting list stream settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/waiting_list_stream.env",
+        env_file_encoding="utf-8",
+        env_prefix="WAITING_LIST_STREAM_",
+    )
+
+    MAX_PENDING_CHANGES: int = 32
+    HEARTBEAT_SECONDS: float = 15.0
+
+
+class ResponseCompressionSettings(BaseSettings):
+    """REST API response compression settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/response_compression.env",
+        env_file_encoding="utf-8",
+        env_prefix="RESPONSE_COMPRESSION_",
+    )
+
+    MINIMUM_SIZE: int = 1024  # bytes
+    GZIP_LEVEL: int = 6
+
+
+class PreparationChangedListenerSettings(BaseSettings):
+    """Preparation Changed Listener settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/preparation_changed_listener.env",
+        env_file_encoding="utf-8",
+        env_prefix="PREPARATION_CHANGED_LISTENER_",
+    )
+
+    RECONNECT_DELAY_SECONDS: float = 1.0
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 30.0
+
+
+class PreparationArchiverSettings(BaseSettings):
+    """Preparation Archiver settings"""
+
+    model_config = SettingsConfigDict(
+        env_file="settings/preparation_archiver.env",
+        env_file_encoding="utf-8",
+        env_prefix="PREPARATION_ARCHIVER_",
+    )
+
+    RETENTION_DAYS: int = 30
+    BATCH_SIZE: int = 500
 
 
 class AWSSettings(BaseSettings):
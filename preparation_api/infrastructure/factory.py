@@ -1,33 +1,66 @@
 """Factory module for manual dependency injection"""
 
+import importlib.util
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from datetime import timedelta
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable
 
+import asyncpg
 from aioboto3 import Session as AIOBoto3Session
-from httpx import AsyncClient
+from httpx import AsyncClient, Limits, Timeout
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from preparation_api.adapters.inbound.listeners import (
     PaymentClosedHandler,
     PaymentClosedListener,
+    PreparationChangedListener,
+)
+from preparation_api.adapters.inbound.rest.v1.compression import ResponseCompressor
+from preparation_api.adapters.inbound.rest.v1.waiting_list_broadcaster import (
+    WaitingListBroadcaster,
+)
+from preparation_api.adapters.out import (
+    APIOrderInfoProvider,
+    CachingOrderInfoProvider,
+    InMemoryWaitingListCache,
+    SAPreparationRepository,
 )
-from preparation_api.adapters.out import APIOrderInfoProvider, SAPreparationRepository
 from preparation_api.application.use_cases import (
+    ArchiveCompletedPreparationsUseCase,
     CreatePreparationFromPaymentUseCase,
+    GetPreparationChangesUseCase,
+    GetWaitingListPageUseCase,
     GetWaitingListUseCase,
+    ImportPreparationsFromPaymentsUseCase,
     MarkPreparationAsCompletedUseCase,
     MarkPreparationAsReadyUseCase,
     StartNextPreparationUseCase,
 )
-from preparation_api.domain.ports import OrderInfoProvider, PreparationRepository
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.ports import (
+    OrderInfoProvider,
+    PreparationRepository,
+    WaitingListCache,
+)
 from preparation_api.infrastructure.config import (
     AWSSettings,
     DatabaseSettings,
     OrderAPISettings,
     PaymentClosedListenerSettings,
+    PreparationArchiverSettings,
+    PreparationChangedListenerSettings,
+    ResponseCompressionSettings,
+    WaitingListCacheSettings,
+    WaitingListStreamSettings,
 )
+from preparation_api.infrastructure.http import InstrumentedTransport
 from preparation_api.infrastructure.orm import SessionManager
 
+logger = logging.getLogger(__name__)
+
 
 def get_session_manager(settings: DatabaseSettings) -> SessionManager:
     """Return a SessionManager instance"""
@@ -45,19 +78,50 @@ async def get_db_session(
         yield session
 
 
-def get_http_client() -> AsyncClient:
-    """Return an AsyncClient instance"""
+def get_order_api_transport(settings: OrderAPISettings) -> InstrumentedTransport:
+    """Return the instrumented transport pooling the Order API connections"""
+
+    limits = Limits(
+        max_connections=settings.MAX_CONNECTIONS,
+        max_keepalive_connections=settings.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.KEEPALIVE_EXPIRY,
+    )
+
+    http2 = settings.HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requires the h2 package, falling back to HTTP/1.1")
+        http2 = False
+
+    return InstrumentedTransport(limits=limits, http2=http2)
+
 
-    return AsyncClient(timeout=10.0)  # Default timeout of 10 seconds
+def get_http_client(
+    settings: OrderAPISettings, transport: InstrumentedTransport
+) -> AsyncClient:
+    """Return an AsyncClient instance for the Order API"""
+
+    return AsyncClient(
+        transport=transport,
+        timeout=Timeout(
+            settings.TIMEOUT,
+            connect=settings.CONNECT_TIMEOUT,
+            pool=settings.POOL_TIMEOUT,
+        ),
+    )
 
 
 def get_order_info_provider(
     settings: OrderAPISettings,
     http_client: AsyncClient,
-) -> OrderInfoProvider:
-    """Return an OrderInfoProvider instance"""
-
-    return APIOrderInfoProvider(settings=settings, http_client=http_client)
+) -> CachingOrderInfoProvider:
+    """Return an OrderInfoProvider instance caching the Order API responses"""
+
+    return CachingOrderInfoProvider(
+        provider=APIOrderInfoProvider(settings=settings, http_client=http_client),
+        max_size=settings.CACHE_MAX_SIZE,
+        ttl_seconds=settings.CACHE_TTL_SECONDS,
+        not_found_ttl_seconds=settings.CACHE_NOT_FOUND_TTL_SECONDS,
+    )
 
 
 def get_preparation_repository(session: AsyncSession) -> PreparationRepository:
@@ -66,6 +130,12 @@ def get_preparation_repository(session: AsyncSession) -> PreparationRepository:
     return SAPreparationRepository(session=session)
 
 
+def get_waiting_list_cache(settings: WaitingListCacheSettings) -> WaitingListCache:
+    """Return a WaitingListCache instance"""
+
+    return InMemoryWaitingListCache(ttl_seconds=settings.TTL_SECONDS)
+
+
 def get_aws_session(settings: AWSSettings) -> AIOBoto3Session:
     """Return an AIOBoto3Session instance"""
 
@@ -89,52 +159,108 @@ def get_create_preparation_from_payment_use_case(
     )
 
 
+def get_import_preparations_from_payments_use_case(
+    preparation_repository: PreparationRepository,
+    order_info_provider: OrderInfoProvider,
+    max_concurrency: int,
+) -> ImportPreparationsFromPaymentsUseCase:
+    """Return an ImportPreparationsFromPaymentsUseCase instance"""
+
+    return ImportPreparationsFromPaymentsUseCase(
+        preparation_repository=preparation_repository,
+        order_info_provider=order_info_provider,
+        max_concurrency=max_concurrency,
+    )
+
+
 def get_waiting_list_use_case(
     preparation_repository: PreparationRepository,
+    waiting_list_cache: WaitingListCache | None = None,
 ) -> GetWaitingListUseCase:
     """Return a GetWaitingListUseCase instance"""
 
-    return GetWaitingListUseCase(preparation_repository=preparation_repository)
+    return GetWaitingListUseCase(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
+
+
+def get_waiting_list_page_use_case(
+    preparation_repository: PreparationRepository,
+) -> GetWaitingListPageUseCase:
+    """Return a GetWaitingListPageUseCase instance"""
+
+    return GetWaitingListPageUseCase(preparation_repository=preparation_repository)
+
+
+def get_preparation_changes_use_case(
+    preparation_repository: PreparationRepository,
+) -> GetPreparationChangesUseCase:
+    """Return a GetPreparationChangesUseCase instance"""
+
+    return GetPreparationChangesUseCase(preparation_repository=preparation_repository)
 
 
 def get_start_next_preparation_use_case(
     preparation_repository: PreparationRepository,
+    waiting_list_cache: WaitingListCache | None = None,
 ) -> StartNextPreparationUseCase:
     """Return a StartNextPreparationUseCase instance"""
 
-    return StartNextPreparationUseCase(preparation_repository=preparation_repository)
+    return StartNextPreparationUseCase(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
 
 
 def get_mark_preparation_as_ready_use_case(
     preparation_repository: PreparationRepository,
+    waiting_list_cache: WaitingListCache | None = None,
 ) -> MarkPreparationAsReadyUseCase:
     """Return a MarkPreparationAsReadyUseCase instance"""
 
-    return MarkPreparationAsReadyUseCase(preparation_repository=preparation_repository)
+    return MarkPreparationAsReadyUseCase(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
 
 
 def get_mark_preparation_as_completed_use_case(
     preparation_repository: PreparationRepository,
+    waiting_list_cache: WaitingListCache | None = None,
 ) -> MarkPreparationAsCompletedUseCase:
     """Return a MarkPreparationAsCompletedUseCase instance"""
 
     return MarkPreparationAsCompletedUseCase(
-        preparation_repository=preparation_repository
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
+
+
+def get_archive_completed_preparations_use_case(
+    preparation_repository: PreparationRepository,
+    settings: PreparationArchiverSettings,
+) -> ArchiveCompletedPreparationsUseCase:
+    """Return an ArchiveCompletedPreparationsUseCase instance"""
+
+    return ArchiveCompletedPreparationsUseCase(
+        preparation_repository=preparation_repository,
+        retention=timedelta(days=settings.RETENTION_DAYS),
+        batch_size=settings.BATCH_SIZE,
     )
 
 
 def create_preparation_from_payment_use_case_factory(
-    order_api_settings: OrderAPISettings,
-    http_client: AsyncClient,
+    order_info_provider: OrderInfoProvider,
 ):
-    """Create a factory function for creating use cases with sessions"""
+    """Create a factory function for creating use cases with sessions
+
+    The order info provider is shared by the use cases, so its cache outlives the
+    session of each message.
+    """
 
     def use_case_factory(session: AsyncSession) -> CreatePreparationFromPaymentUseCase:
         repository = get_preparation_repository(session=session)
-        order_info_provider = get_order_info_provider(
-            settings=order_api_settings,
-            http_client=http_client,
-        )
 
         return get_create_preparation_from_payment_use_case(
             preparation_repository=repository,
@@ -146,15 +272,14 @@ def create_preparation_from_payment_use_case_factory(
 
 def get_payment_closed_handler(
     session_manager: SessionManager,
-    order_api_settings: OrderAPISettings,
-    http_client: AsyncClient,
+    order_info_provider: OrderInfoProvider,
 ) -> PaymentClosedHandler:
     """Create a PaymentClosedHandler instance"""
 
     return PaymentClosedHandler(
         session_manager=session_manager,
         use_case_factory=create_preparation_from_payment_use_case_factory(
-            order_api_settings=order_api_settings, http_client=http_client
+            order_info_provider=order_info_provider
         ),
     )
 
@@ -167,3 +292,68 @@ def get_payment_closed_listener(
     """Create a PaymentClosedListener instance"""
 
     return PaymentClosedListener(session=session, handler=handler, settings=settings)
+
+
+def waiting_list_loader_factory(
+    session_manager: SessionManager,
+    waiting_list_cache: WaitingListCache,
+) -> Callable[[], Awaitable[list[PreparationOut]]]:
+    """Create a function loading the waiting list in a session of its own"""
+
+    async def load_waiting_list() -> list[PreparationOut]:
+        async with session_manager.session() as session:
+            use_case = get_waiting_list_use_case(
+                preparation_repository=get_preparation_repository(session=session),
+                waiting_list_cache=waiting_list_cache,
+            )
+
+            return await use_case.execute()
+
+    return load_waiting_list
+
+
+def get_waiting_list_broadcaster(
+    session_manager: SessionManager,
+    waiting_list_cache: WaitingListCache,
+    settings: WaitingListStreamSettings,
+) -> WaitingListBroadcaster:
+    """Create a WaitingListBroadcaster instance"""
+
+    return WaitingListBroadcaster(
+        load_waiting_list=waiting_list_loader_factory(
+            session_manager=session_manager, waiting_list_cache=waiting_list_cache
+        ),
+        settings=settings,
+    )
+
+
+def get_response_compressor(
+    settings: ResponseCompressionSettings,
+) -> ResponseCompressor:
+    """Create a ResponseCompressor instance"""
+
+    return ResponseCompressor(settings=settings)
+
+
+def get_preparation_changed_listener(
+    database_settings: DatabaseSettings,
+    settings: PreparationChangedListenerSettings,
+    waiting_list_cache: WaitingListCache,
+    on_change: Callable[[], None] | None = None,
+) -> PreparationChangedListener:
+    """Create a PreparationChangedListener instance"""
+
+    # The listening connection is held outside the SQLAlchemy pool, so it is
+    # opened with asyncpg directly from the same DSN
+    dsn = (
+        make_url(database_settings.DSN)
+        .set(drivername="postgresql")
+        .render_as_string(hide_password=False)
+    )
+
+    return PreparationChangedListener(
+        connect=partial(asyncpg.connect, dsn=dsn),
+        waiting_list_cache=waiting_list_cache,
+        settings=settings,
+        on_change=on_change,
+    )
@@ -0,0 +1,170 @@
+"""HTTP client transport instrumentation and Order API counters logging"""
+
+import asyncio
+import logging
+import time
+
+from httpx import AsyncHTTPTransport, Request, Response
+from pydantic import BaseModel, Field
+
+from preparation_api.adapters.out import CachingOrderInfoProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPoolStats(BaseModel):
+    """Counters of how the connection pool of a transport served the requests"""
+
+    requests: int = Field(..., description="Requests sent")
+    connections_opened: int = Field(
+        ..., description="Requests that had to open a new connection"
+    )
+    connections_reused: int = Field(
+        ..., description="Requests sent on a kept alive connection"
+    )
+    pool_wait_seconds_total: float = Field(
+        ..., description="Time the requests waited for a connection of the pool"
+    )
+    pool_wait_seconds_max: float = Field(
+        ..., description="Longest time a request waited for a connection"
+    )
+    response_seconds_total: float = Field(
+        ...,
+        description="Time from getting a connection to receiving the response headers",
+    )
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of the requests sent on a kept alive connection"""
+
+        return self.connections_reused / self.requests if self.requests else 0.0
+
+    @property
+    def pool_wait_seconds_mean(self) -> float:
+        """Mean time a request waited for a connection of the pool"""
+
+        return self.pool_wait_seconds_total / self.requests if self.requests else 0.0
+
+    @property
+    def response_seconds_mean(self) -> float:
+        """Mean time the server took to send the response headers"""
+
+        return self.response_seconds_total / self.requests if self.requests else 0.0
+
+
+class InstrumentedTransport(AsyncHTTPTransport):
+    """An HTTP transport recording how its connection pool serves the requests
+
+    The first event traced by the connection pool for a request is either opening
+    a new connection or sending the request on a kept alive one, and both happen
+    once the request got a connection. The time before it is the time the request
+    waited for the pool, which tells local pool starvation apart from the latency
+    of the server.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._requests = 0
+        self._connections_opened = 0
+        self._connections_reused = 0
+        self._pool_wait_seconds_total = 0.0
+        self._pool_wait_seconds_max = 0.0
+        self._response_seconds_total = 0.0
+
+    async def handle_async_request(self, request: Request) -> Response:
+        started_at = time.perf_counter()
+        connected_at: float | None = None
+        opened_connection = False
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict):
+            nonlocal connected_at, opened_connection
+            if connected_at is None:
+                connected_at = time.perf_counter()
+                opened_connection = event_name.startswith("connection.connect_")
+
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            finished_at = time.perf_counter()
+            self._requests += 1
+            if connected_at is None:
+                # A request that never got a connection waited for it throughout
+                connected_at = finished_at
+            elif opened_connection:
+                self._connections_opened += 1
+            else:
+                self._connections_reused += 1
+
+            pool_wait_seconds = connected_at - started_at
+            self._pool_wait_seconds_total += pool_wait_seconds
+            self._pool_wait_seconds_max = max(
+                self._pool_wait_seconds_max, pool_wait_seconds
+            )
+            self._response_seconds_total += finished_at - connected_at
+            logger.debug(
+                "HTTP request %s pool_wait=%.4fs response=%.4fs new_connection=%s",
+                request.url,
+                pool_wait_seconds,
+                finished_at - connected_at,
+                opened_connection,
+            )
+
+    def stats(self) -> ConnectionPoolStats:
+        """Get the counters of how the connection pool served the requests
+
+        :return: The connection pool counters
+        :rtype: ConnectionPoolStats
+        """
+
+        return ConnectionPoolStats(
+            requests=self._requests,
+            connections_opened=self._connections_opened,
+            connections_reused=self._connections_reused,
+            pool_wait_seconds_total=self._pool_wait_seconds_total,
+            pool_wait_seconds_max=self._pool_wait_seconds_max,
+            response_seconds_total=self._response_seconds_total,
+        )
+
+
+def log_order_api_stats(
+    order_info_provider: CachingOrderInfoProvider,
+    order_api_transport: InstrumentedTransport,
+):
+    """Log the counters of the order info cache and of the Order API pool"""
+
+    stats = order_info_provider.stats()
+    logger.info(
+        "Order info cache hits=%d misses=%d coalesced=%d hit_rate=%.2f",
+        stats.hits,
+        stats.misses,
+        stats.coalesced,
+        stats.hit_rate,
+    )
+
+    pool_stats = order_api_transport.stats()
+    logger.info(
+        "Order API pool requests=%d reuse_rate=%.2f pool_wait_mean=%.4fs "
+        "pool_wait_max=%.4fs response_mean=%.4fs",
+        pool_stats.requests,
+        pool_stats.reuse_rate,
+        pool_stats.pool_wait_seconds_mean,
+        pool_stats.pool_wait_seconds_max,
+        pool_stats.response_seconds_mean,
+    )
+
+
+async def log_order_api_stats_periodically(
+    order_info_provider: CachingOrderInfoProvider,
+    order_api_transport: InstrumentedTransport,
+    interval_seconds: float,
+):
+    """Log the Order API counters every interval until cancelled"""
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        log_order_api_stats(order_info_provider, order_api_transport)
@@ -1,6 +1,18 @@
 """Preparation ORM models"""
 
-from .base import BaseModel
-from .preparation import Preparation
+from .base import BaseModel, utcnow
+from .preparation import (
+    PREPARATION_CHANGED_CHANNEL,
+    Preparation,
+    preparation_position_sequence,
+)
+from .preparation_history import PreparationHistory
 
-__all__ = ["Preparation", "BaseModel"]
+__all__ = [
+    "PREPARATION_CHANGED_CHANNEL",
+    "Preparation",
+    "PreparationHistory",
+    "BaseModel",
+    "preparation_position_sequence",
+    "utcnow",
+]
@@ -1,5 +1,29 @@
+from sqlalchemy import types
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.functions import FunctionElement
 
 
 class BaseModel(DeclarativeBase):
     """Base class for all ORM models"""
+
+
+class utcnow(FunctionElement):  # pylint: disable=C0103,W0223
+    """The current database time as a naive UTC timestamp
+
+    Every stored time is written and compared with it, so they do not depend on
+    the time zone of the database session nor on the clock of the application.
+    """
+
+    type = types.TIMESTAMP()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kwargs):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kwargs):
+    return "CURRENT_TIMESTAMP"
@@ -2,18 +2,80 @@
 
 from datetime import datetime
 
-from sqlalchemy import func, types
+from sqlalchemy import DDL, Index, Sequence, event, text, types
 from sqlalchemy.orm import Mapped, mapped_column
 
 from preparation_api.domain.value_objects import PreparationStatus
 
-from .base import BaseModel
+from .base import BaseModel, utcnow
+
+# Allocates the enqueue sequence stored in the position of received preparations
+preparation_position_sequence = Sequence(
+    "sq_tb_pagamento_posicao_preparacao", metadata=BaseModel.metadata
+)
+
+# Channel notified once per statement changing the preparations, so the workers
+# caching the waiting list learn about writes made by any process
+PREPARATION_CHANGED_CHANNEL = "preparation_changed"
 
 
 class Preparation(BaseModel):
     """The preparation ORM model"""
 
     __tablename__ = "tb_pagamento"
+    __table_args__ = (
+        # Partial covering indexes matching the ordering of each waiting list, so
+        # the board is read with index-only scans however large the history grows.
+        # The ID breaks ties so keyset pages resume straight from the index.
+        Index(
+            "ix_tb_pagamento_received_posicao_preparacao_id",
+            "posicao_preparacao",
+            "id",
+            postgresql_where=text("st_preparacao = 'RECEIVED'"),
+            postgresql_include=[
+                "tempo_de_preparacao",
+                "estimativa_de_pronto",
+                "st_preparacao",
+                "dt_inclusao",
+                "timestamp",
+            ],
+        ),
+        Index(
+            "ix_tb_pagamento_in_preparation_estimativa_de_pronto_id",
+            "estimativa_de_pronto",
+            "id",
+            postgresql_where=text("st_preparacao = 'IN_PREPARATION'"),
+            postgresql_include=[
+                "posicao_preparacao",
+                "tempo_de_preparacao",
+                "st_preparacao",
+                "dt_inclusao",
+                "timestamp",
+            ],
+        ),
+        Index(
+            "ix_tb_pagamento_ready_timestamp_id",
+            "timestamp",
+            "id",
+            postgresql_where=text("st_preparacao = 'READY'"),
+            postgresql_include=[
+                "posicao_preparacao",
+                "tempo_de_preparacao",
+                "estimativa_de_pronto",
+                "st_preparacao",
+                "dt_inclusao",
+            ],
+        ),
+        # Lists the preparations changed since a given time, in the order they
+        # changed, for the clients syncing the board incrementally
+        Index("ix_tb_pagamento_timestamp_id", "timestamp", "id"),
+        # Finds the completed preparations past the retention window to archive
+        Index(
+            "ix_tb_pagamento_completed_timestamp",
+            "timestamp",
+            postgresql_where=text("st_preparacao = 'COMPLETED'"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         types.String, primary_key=True, unique=True, nullable=False
@@ -41,17 +103,47 @@ class Preparation(BaseModel):
     created_at: Mapped[datetime] = mapped_column(
         types.TIMESTAMP,
         name="dt_inclusao",
-        default=func.now(),  # pylint: disable=E1102
+        default=utcnow(),
         nullable=False,
     )
 
     timestamp: Mapped[datetime] = mapped_column(
         types.TIMESTAMP,
         name="timestamp",
-        default=func.now(),  # pylint: disable=E1102
-        onupdate=func.now(),  # pylint: disable=E1102
+        default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     def __repr__(self):
         return f"{type(self).__name__}[{self.id}]"
+
+
+# Notifies the change channel once per statement, after the change is committed
+notify_preparation_changed_function = DDL(f"""
+    CREATE OR REPLACE FUNCTION fn_notify_preparation_changed()
+    RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{PREPARATION_CHANGED_CHANNEL}', '');
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+
+notify_preparation_changed_trigger = DDL("""
+    CREATE TRIGGER tg_tb_pagamento_preparation_changed
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tb_pagamento
+    FOR EACH STATEMENT EXECUTE FUNCTION fn_notify_preparation_changed()
+    """)
+
+# The notification is PostgreSQL specific, other dialects create the table alone
+event.listen(
+    Preparation.__table__,
+    "after_create",
+    notify_preparation_changed_function.execute_if(dialect="postgresql"),
+)
+event.listen(
+    Preparation.__table__,
+    "after_create",
+    notify_preparation_changed_trigger.execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,54 @@
+"""The preparation history ORM model"""
+
+from datetime import datetime
+
+from sqlalchemy import types
+from sqlalchemy.orm import Mapped, mapped_column
+
+from preparation_api.domain.value_objects import PreparationStatus
+
+from .base import BaseModel, utcnow
+
+
+class PreparationHistory(BaseModel):
+    """The preparation history ORM model
+
+    Completed preparations are moved here once past the retention window, so the
+    preparation table only holds the live board and the recent history.
+    """
+
+    __tablename__ = "tb_pagamento_historico"
+
+    id: Mapped[str] = mapped_column(types.String, primary_key=True, nullable=False)
+
+    preparation_time: Mapped[int] = mapped_column(
+        types.Integer, name="tempo_de_preparacao", nullable=False
+    )
+
+    estimated_ready_time: Mapped[datetime | None] = mapped_column(
+        types.TIMESTAMP, name="estimativa_de_pronto", nullable=True
+    )
+
+    preparation_status: Mapped[PreparationStatus] = mapped_column(
+        types.Enum(PreparationStatus, native_enum=False),
+        name="st_preparacao",
+        nullable=False,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP, name="dt_inclusao", nullable=False
+    )
+
+    timestamp: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP, name="timestamp", nullable=False
+    )
+
+    archived_at: Mapped[datetime] = mapped_column(
+        types.TIMESTAMP,
+        name="dt_arquivamento",
+        server_default=utcnow(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"{type(self).__name__}[{self.id}]"
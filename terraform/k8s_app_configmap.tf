@@ -5,13 +5,16 @@ resource "kubernetes_config_map" "preparation_api" {
   }
 
   data = {
-    APP_TITLE                          = var.app_title
-    APP_VERSION                        = var.app_version
-    APP_ENVIRONMENT                    = var.app_environment
-    APP_ROOT_PATH                      = var.app_root_path
-    AWS_REGION_NAME                    = var.region
-    DATABASE_ECHO                      = tostring(var.database_echo)
-    ORDER_API_BASE_URL                 = var.order_api_base_url
-    PAYMENT_CLOSED_LISTENER_QUEUE_NAME = var.payment_closed_listener_queue_name
+    APP_TITLE                                      = var.app_title
+    APP_VERSION                                    = var.app_version
+    APP_ENVIRONMENT                                = var.app_environment
+    APP_ROOT_PATH                                  = var.app_root_path
+    AWS_REGION_NAME                                = var.region
+    DATABASE_ECHO                                  = tostring(var.database_echo)
+    ORDER_API_BASE_URL                             = var.order_api_base_url
+    PAYMENT_CLOSED_LISTENER_QUEUE_NAME             = var.payment_closed_listener_queue_name
+    PAYMENT_CLOSED_LISTENER_DEAD_LETTER_QUEUE_NAME = var.payment_closed_listener_dead_letter_queue_name
+    PREPARATION_ARCHIVER_RETENTION_DAYS            = tostring(var.preparation_archiver_retention_days)
+    WAITING_LIST_CACHE_TTL_SECONDS                 = tostring(var.waiting_list_cache_ttl_seconds)
   }
 }
@@ -0,0 +1,67 @@
+resource "kubernetes_cron_job_v1" "preparation_archiver" {
+  metadata {
+    name      = "preparation-archiver-cronjob"
+    namespace = kubernetes_namespace.preparation_api.metadata[0].name
+  }
+
+  spec {
+    schedule                      = var.preparation_archiver_schedule
+    concurrency_policy            = "Forbid"
+    successful_jobs_history_limit = 1
+    failed_jobs_history_limit     = 3
+
+    job_template {
+      metadata {
+        labels = {
+          app = "preparation-archiver"
+        }
+      }
+
+      spec {
+        backoff_limit = 2
+
+        template {
+          metadata {
+            labels = {
+              app = "preparation-archiver"
+            }
+          }
+
+          spec {
+            restart_policy = "Never"
+
+            container {
+              name              = "preparation-archiver"
+              image             = var.docker_api_image
+              image_pull_policy = "Always"
+              command           = ["sh", "/app/docker-entrypoint/start_preparation_archiver.sh"]
+
+              resources {
+                limits = {
+                  cpu    = "250m"
+                  memory = "512Mi"
+                }
+                requests = {
+                  cpu    = "100m"
+                  memory = "256Mi"
+                }
+              }
+
+              env_from {
+                config_map_ref {
+                  name = kubernetes_config_map.preparation_api.metadata[0].name
+                }
+              }
+
+              env_from {
+                secret_ref {
+                  name = kubernetes_secret.preparation_api.metadata[0].name
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
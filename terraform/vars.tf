@@ -93,3 +93,24 @@ variable "order_api_timeout" {
 variable "payment_closed_listener_queue_name" {
   description = "The name of the SQS queue to listen for payment closed events"
 }
+
+variable "payment_closed_listener_dead_letter_queue_name" {
+  description = "The name of the SQS queue payment closed events failing permanently are moved to"
+}
+
+variable "preparation_archiver_schedule" {
+  description = "The cron schedule of the job archiving completed preparations"
+  default     = "0 * * * *"
+}
+
+variable "preparation_archiver_retention_days" {
+  description = "The days completed preparations are kept before being archived"
+  type        = number
+  default     = 30
+}
+
+variable "waiting_list_cache_ttl_seconds" {
+  description = "The seconds a worker serves its cached waiting list before reloading it"
+  type        = number
+  default     = 1
+}
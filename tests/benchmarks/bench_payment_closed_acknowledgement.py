@@ -0,0 +1,107 @@
+"""Benchmark of acknowledging the payment closed messages
+
+Compares deleting every handled message with its own DeleteMessage call, as the
+handler used to, with deleting each received batch with DeleteMessageBatch.
+
+The queue is a local stand-in of the SQS queue resource which answers every call
+after a fixed round trip, so the benchmark runs without AWS and counts the calls
+each path makes.
+
+Run it with ``python -m tests.benchmarks.bench_payment_closed_acknowledgement``.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+from preparation_api.adapters.inbound.listeners.payment_closed import (
+    PaymentClosedListener,
+)
+from tests.benchmarks.local_sqs import LocalQueue, LocalSession
+
+ROUND_TRIP_SECONDS = 0.02  # SQS API call from the cluster
+HANDLE_SECONDS = 0.03  # Order API call and preparation insert
+BATCH_SIZE = 10
+BATCHES = 20
+CONCURRENCIES = (1, BATCH_SIZE)
+
+
+class SimulatedHandler:
+    """Handler taking a fixed time per message"""
+
+    async def handle(self, message):  # pylint: disable=W0613
+        """Handle a message"""
+        await asyncio.sleep(HANDLE_SECONDS)
+
+
+class DeletingHandler(SimulatedHandler):
+    """Handler deleting each message it handles, as it used to"""
+
+    async def handle(self, message):
+        await super().handle(message)
+        await message.delete()
+
+
+class PerMessageDeleteListener(PaymentClosedListener):
+    """Listener leaving the deletes to the handler"""
+
+    async def _delete(self, queue, messages):
+        pass
+
+
+def _settings(concurrency: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        QUEUE_NAME="payment-closed.fifo",
+        WAIT_TIME_SECONDS=0,
+        VISIBILITY_TIMEOUT_SECONDS=30,
+        VISIBILITY_HEARTBEAT_SECONDS=10,
+        DEAD_LETTER_QUEUE_NAME="payment-closed-dlq.fifo",
+        MAX_RECEIVE_COUNT=5,
+        RETRY_BASE_DELAY_SECONDS=2.0,
+        RETRY_MAX_DELAY_SECONDS=300.0,
+        MAX_NUMBER_OF_MESSAGES_PER_BATCH=BATCH_SIZE,
+        MAX_CONCURRENT_MESSAGES=concurrency,
+        RECEIVERS=1,
+        MAX_PENDING_SEQUENCES=BATCH_SIZE,
+    )
+
+
+async def _run(listener_class, handler, concurrency: int) -> tuple[float, Counter]:
+    """Listen until the batches are handled, returning the time and the calls"""
+
+    queue = LocalQueue(ROUND_TRIP_SECONDS, BATCH_SIZE, BATCHES)
+    listener = listener_class(
+        session=LocalSession(queue), handler=handler, settings=_settings(concurrency)
+    )
+
+    start = time.perf_counter()
+    await listener.listen(shutdown_event=queue.shutdown_event)
+    return time.perf_counter() - start, queue.calls
+
+
+async def main() -> None:
+    """Print the throughput and the SQS calls of each acknowledgement path"""
+
+    message_count = BATCH_SIZE * BATCHES
+    print(
+        f"{'acknowledgement':>26} {'concurrency':>11} {'messages/s':>11} "
+        f"{'calls/message':>14}"
+    )
+
+    for concurrency in CONCURRENCIES:
+        variants = {
+            "DeleteMessage per message": (PerMessageDeleteListener, DeletingHandler()),
+            "DeleteMessageBatch": (PaymentClosedListener, SimulatedHandler()),
+        }
+
+        for name, (listener_class, handler) in variants.items():
+            elapsed, calls = await _run(listener_class, handler, concurrency)
+            print(
+                f"{name:>26} {concurrency:>11} {message_count / elapsed:>11.1f} "
+                f"{sum(calls.values()) / message_count:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
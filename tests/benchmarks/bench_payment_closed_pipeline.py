@@ -0,0 +1,93 @@
+"""Benchmark of receiving the payment closed messages ahead of the workers
+
+Compares receiving the next batch only once the previous one is handled and
+deleted, as the listener used to, with the receivers feeding the workers through
+the internal queue.
+
+The queue is a local stand-in of the SQS queue resource which answers every call
+after a fixed round trip, so the benchmark runs without AWS.
+
+Run it with ``python -m tests.benchmarks.bench_payment_closed_pipeline``.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from preparation_api.adapters.inbound.listeners.payment_closed import (
+    PaymentClosedListener,
+)
+from tests.benchmarks.local_sqs import LocalQueue, LocalSession
+
+ROUND_TRIP_SECONDS = 0.02  # SQS API call from the cluster
+HANDLE_SECONDS = 0.03  # Order API call and preparation insert
+BATCH_SIZE = 10
+BATCHES = 20
+WORKERS = 10
+RECEIVER_COUNTS = (1, 2)
+
+
+class SimulatedHandler:
+    """Handler taking a fixed time per message"""
+
+    async def handle(self, message):  # pylint: disable=W0613
+        """Handle a message"""
+        await asyncio.sleep(HANDLE_SECONDS)
+
+
+class BatchAtATimeListener(PaymentClosedListener):
+    """Listener receiving a batch only once the previous one is done, as it used to"""
+
+    async def _receive_until_shutdown(self, queue, pending, shutdown_event=None):
+        while not (shutdown_event and shutdown_event.shutdown):
+            await self._receive(queue=queue, pending=pending)
+            await pending.join()
+
+
+def _settings(receivers: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        QUEUE_NAME="payment-closed.fifo",
+        WAIT_TIME_SECONDS=0,
+        VISIBILITY_TIMEOUT_SECONDS=30,
+        VISIBILITY_HEARTBEAT_SECONDS=10,
+        DEAD_LETTER_QUEUE_NAME="payment-closed-dlq.fifo",
+        MAX_RECEIVE_COUNT=5,
+        RETRY_BASE_DELAY_SECONDS=2.0,
+        RETRY_MAX_DELAY_SECONDS=300.0,
+        MAX_NUMBER_OF_MESSAGES_PER_BATCH=BATCH_SIZE,
+        MAX_CONCURRENT_MESSAGES=WORKERS,
+        RECEIVERS=receivers,
+        MAX_PENDING_SEQUENCES=BATCH_SIZE,
+    )
+
+
+async def _run(listener_class, receivers: int) -> float:
+    """Listen until the batches are handled, returning the elapsed time"""
+
+    queue = LocalQueue(ROUND_TRIP_SECONDS, BATCH_SIZE, BATCHES)
+    listener = listener_class(
+        session=LocalSession(queue),
+        handler=SimulatedHandler(),
+        settings=_settings(receivers),
+    )
+
+    start = time.perf_counter()
+    await listener.listen(shutdown_event=queue.shutdown_event)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    """Print the throughput of receiving a batch at a time and of the pipeline"""
+
+    message_count = BATCH_SIZE * BATCHES
+    print(f"{'listener':>16} {'receivers':>9} {'messages/s':>11}")
+
+    elapsed = await _run(BatchAtATimeListener, receivers=1)
+    print(f"{'batch at a time':>16} {1:>9} {message_count / elapsed:>11.1f}")
+    for receivers in RECEIVER_COUNTS:
+        elapsed = await _run(PaymentClosedListener, receivers=receivers)
+        print(f"{'pipeline':>16} {receivers:>9} {message_count / elapsed:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
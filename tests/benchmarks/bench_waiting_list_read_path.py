@@ -0,0 +1,113 @@
+"""Microbenchmark of the per-row cost of reading the waiting list
+
+Compares the previous read path, which loaded ORM instances into the session
+identity map and validated each one into a PreparationOut, with the current one,
+which validates the selected columns into the entities in a single call.
+
+The rows are served by an in-memory SQLite database so the benchmark runs without
+a Postgres server. Both paths pay for the same statement, so the difference is the
+per-row work done in Python.
+
+Run it with ``python -m tests.benchmarks.bench_waiting_list_read_path``.
+"""
+
+import timeit
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from preparation_api.adapters.out.sa_preparation_repository import (
+    _preparation_columns,
+    _to_preparation_outs,
+)
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.infrastructure.orm.models import BaseModel
+from preparation_api.infrastructure.orm.models import Preparation as PreparationModel
+
+ROW_COUNTS = (100, 1000)
+REPEAT = 5
+
+
+def _seed(engine, row_count: int) -> None:
+    """Seed the table with received preparations
+
+    :param engine: The engine of the benchmark database
+    :param row_count: The number of preparations to seed
+    :type row_count: int
+    """
+    base_time = datetime(2023, 1, 1, 0, 0, 0)
+    with Session(engine) as session:
+        session.execute(
+            insert(PreparationModel),
+            [
+                {
+                    "id": f"R{index:06d}",
+                    "preparation_position": index + 1,
+                    "preparation_time": 10,
+                    "estimated_ready_time": None,
+                    "preparation_status": PreparationStatus.RECEIVED,
+                    "created_at": base_time + timedelta(seconds=index),
+                    "timestamp": base_time + timedelta(seconds=index),
+                }
+                for index in range(row_count)
+            ],
+        )
+        session.commit()
+
+
+def _read_with_orm(engine) -> list[PreparationOut]:
+    """Read the preparations the way the repository used to"""
+    with Session(engine) as session:
+        return [
+            PreparationOut.model_validate(preparation)
+            for preparation in session.scalars(
+                select(PreparationModel).order_by(
+                    PreparationModel.preparation_position.asc()
+                )
+            )
+        ]
+
+
+def _read_columns(engine) -> list[PreparationOut]:
+    """Read the preparations the way the repository does now"""
+    with Session(engine) as session:
+        return _to_preparation_outs(
+            session.execute(
+                select(*_preparation_columns()).order_by(
+                    PreparationModel.preparation_position.asc()
+                )
+            ).all()
+        )
+
+
+def main() -> None:
+    """Print the best per-row cost of each read path"""
+    print(f"{'rows':>6} {'orm + validate':>16} {'columns':>10} {'speedup':>8}")
+
+    for row_count in ROW_COUNTS:
+        engine = create_engine("sqlite://")
+        BaseModel.metadata.create_all(engine)
+        _seed(engine, row_count)
+
+        assert _read_with_orm(engine) == _read_columns(engine)
+
+        number = max(1, 10_000 // row_count)
+        per_row = {}
+        for name, read in (("orm", _read_with_orm), ("columns", _read_columns)):
+            best = min(
+                timeit.repeat(lambda: read(engine), number=number, repeat=REPEAT)
+            )
+            per_row[name] = best / number / row_count * 1_000_000
+
+        print(
+            f"{row_count:>6} {per_row['orm']:>14.2f}us {per_row['columns']:>8.2f}us "
+            f"{per_row['orm'] / per_row['columns']:>7.1f}x"
+        )
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
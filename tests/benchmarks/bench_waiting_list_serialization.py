@@ -0,0 +1,112 @@
+"""Microbenchmark of serializing the waiting list response
+
+Compares the previous response path, which dumped every PreparationOut into a
+dict, validated the dicts into a PreparationListV1 and let the response model
+encode it, with the current one, which writes the JSON bytes straight from the
+entities with a cached TypeAdapter. The time of reusing the bytes of an unchanged
+board is shown as well, both for the same list and for the board reloaded into a
+new list, which only hashes it to compare its ETag.
+
+Run it with ``python -m tests.benchmarks.bench_waiting_list_serialization``.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
+
+from preparation_api.adapters.inbound.rest.v1.schemas import PreparationListV1
+from preparation_api.adapters.inbound.rest.v1.serialization import (
+    WaitingListRenderer,
+    dump_preparation_list_json,
+)
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+
+ROW_COUNTS = (100, 1000, 10_000)
+SAMPLES = 200
+
+
+def _waiting_list(row_count: int) -> list[PreparationOut]:
+    """Build a waiting list of received preparations
+
+    :param row_count: The number of preparations in the waiting list
+    :type row_count: int
+    """
+    base_time = datetime(2023, 1, 1, 0, 0, 0)
+    return [
+        PreparationOut(
+            id=f"R{index:06d}",
+            preparation_position=index + 1,
+            preparation_time=10,
+            estimated_ready_time=None,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=base_time + timedelta(seconds=index),
+            timestamp=base_time + timedelta(seconds=index),
+        )
+        for index in range(row_count)
+    ]
+
+
+def _serialize_with_response_model(waiting_list: list[PreparationOut]) -> bytes:
+    """Serialize the waiting list the way the router used to"""
+    response = PreparationListV1.model_validate(
+        {"items": [preparation.model_dump() for preparation in waiting_list]}
+    )
+    # FastAPI validates the returned model against the response model and encodes
+    # the result with jsonable_encoder before rendering it
+    validated = PreparationListV1.model_validate(response.model_dump())
+    return json.dumps(
+        jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def _percentiles(serialize, waiting_list, samples: int) -> tuple[float, float]:
+    """Time a serializer, returning its p50 and p99 in milliseconds"""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        serialize(waiting_list)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.99) - 1]
+
+
+def main() -> None:
+    """Print the p50 and p99 serialization time of each response path"""
+    print(
+        f"{'rows':>6} {'response model p50/p99':>24} {'dump_json p50/p99':>20} "
+        f"{'reused p50/p99':>18} {'reloaded p50/p99':>18}"
+    )
+
+    for row_count in ROW_COUNTS:
+        waiting_list = _waiting_list(row_count)
+        assert json.loads(_serialize_with_response_model(waiting_list)) == json.loads(
+            dump_preparation_list_json(waiting_list)
+        )
+
+        samples = max(20, SAMPLES * 100 // row_count)
+        renderer = WaitingListRenderer()
+        results = [
+            _percentiles(serialize, waiting_list, samples)
+            for serialize in (
+                _serialize_with_response_model,
+                dump_preparation_list_json,
+                renderer.render,
+                lambda preparations: renderer.render(list(preparations)),
+            )
+        ]
+
+        print(
+            f"{row_count:>6} "
+            + " ".join(
+                f"{f'{p50:.3f}/{p99:.3f}ms':>{width}}"
+                for (p50, p99), width in zip(results, (24, 20, 18, 18))
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
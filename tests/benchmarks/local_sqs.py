@@ -0,0 +1,101 @@
+"""Local stand-in of the aioboto3 SQS resource for the listener benchmarks
+
+The queue answers every call after a fixed round trip and counts the calls made,
+so the benchmarks run without AWS.
+"""
+
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+
+
+class _Attribute:
+    """Attribute of an aioboto3 resource, which can be awaited more than once"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self.value
+
+
+class LocalMessage:
+    """Stand-in of an SQS message resource"""
+
+    def __init__(self, queue: "LocalQueue", index: int):
+        self.queue = queue
+        self.message_id = _Attribute(f"MSG{index}")
+        self.receipt_handle = _Attribute(f"RH{index}")
+        self.attributes = _Attribute({})
+
+    async def delete(self):
+        """Delete the message with a DeleteMessage call"""
+        await self.queue.call("DeleteMessage")
+
+
+class LocalQueue:
+    """Stand-in of an SQS queue resource holding a number of full batches
+
+    Shutdown is requested once the last batch is received.
+    """
+
+    def __init__(self, round_trip_seconds: float, batch_size: int, batches: int):
+        self.round_trip_seconds = round_trip_seconds
+        self.batch_size = batch_size
+        self.batches = batches
+        self.calls: Counter[str] = Counter()
+        self.received = 0
+        self.shutdown_event = SimpleNamespace(shutdown=False)
+
+    async def call(self, action: str):
+        """Make an API call"""
+        self.calls[action] += 1
+        await asyncio.sleep(self.round_trip_seconds)
+
+    async def receive_messages(self, **_kwargs) -> list[LocalMessage]:
+        """Receive a full batch of messages with a ReceiveMessage call"""
+        await self.call("ReceiveMessage")
+        if self.received == self.batch_size * self.batches:
+            return []
+
+        messages = [
+            LocalMessage(self, self.received + index)
+            for index in range(self.batch_size)
+        ]
+        self.received += self.batch_size
+        if self.received == self.batch_size * self.batches:
+            self.shutdown_event.shutdown = True
+
+        return messages
+
+    async def delete_messages(self, Entries):  # pylint: disable=C0103
+        """Delete messages with a DeleteMessageBatch call"""
+        await self.call("DeleteMessageBatch")
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries]}
+
+
+class _LocalResource:
+    def __init__(self, queue: LocalQueue):
+        self.queue = queue
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        return None
+
+    async def get_queue_by_name(self, **_kwargs) -> LocalQueue:
+        """Get the queue"""
+        return self.queue
+
+
+class LocalSession:
+    """Stand-in of an aioboto3 session serving a single queue"""
+
+    def __init__(self, queue: LocalQueue):
+        self.queue = queue
+
+    def resource(self, _service_name: str) -> _LocalResource:
+        """Create an SQS resource"""
+        return _LocalResource(self.queue)
@@ -2,19 +2,31 @@
 
 """Test for SQL Alchemy Preparation Repository implementation"""
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 
 import pytest
 from pytest_mock import MockerFixture
-from sqlalchemy import insert
+from sqlalchemy import event, insert, select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from preparation_api.adapters.out import SAPreparationRepository
 from preparation_api.domain.entities import PreparationIn, PreparationOut
-from preparation_api.domain.exceptions import NotFound, PersistenceError
+from preparation_api.domain.exceptions import (
+    AlreadyExists,
+    NotFound,
+    PersistenceError,
+)
 from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.infrastructure.orm import SessionManager
+from preparation_api.infrastructure.orm.models import (
+    PREPARATION_CHANGED_CHANNEL,
+)
 from preparation_api.infrastructure.orm.models import Preparation as PreparationModel
+from preparation_api.infrastructure.orm.models import (
+    PreparationHistory as PreparationHistoryModel,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -96,6 +108,10 @@ async def create_scenario(db_session: AsyncSession):
     ]
 
     await db_session.execute(insert(PreparationModel), preparations)
+    await db_session.execute(
+        text("SELECT setval('sq_tb_pagamento_posicao_preparacao', 3)")
+    )
+
     await db_session.commit()
 
 
@@ -157,6 +173,82 @@ async def test_should_update_existing_preparation_when_preparation_exists(
     assert preparation.estimated_ready_time == datetime(2023, 1, 1, 0, 45, 0)
 
 
+async def test_should_notify_preparation_changed_once_the_save_is_committed(
+    db_session_manager: SessionManager,
+    repository: SAPreparationRepository,
+):
+    """Given a connection listening to the preparation changed channel
+    When calling the repository to save a preparation
+    Then the channel should be notified so other processes can drop their cache
+    """
+
+    # Given
+    notifications: asyncio.Queue[str] = asyncio.Queue()
+    engine = db_session_manager._engine  # pylint: disable=W0212
+    async with engine.connect() as listening_connection:
+        raw_connection = await listening_connection.get_raw_connection()
+        await raw_connection.driver_connection.add_listener(
+            PREPARATION_CHANGED_CHANNEL,
+            lambda _connection, _pid, channel, _payload: notifications.put_nowait(
+                channel
+            ),
+        )
+
+        # When
+        await repository.save(
+            preparation=PreparationIn(
+                id="A009",
+                preparation_position=4,
+                preparation_time=12,
+                preparation_status=PreparationStatus.RECEIVED,
+            )
+        )
+
+        # Then
+        channel = await asyncio.wait_for(notifications.get(), timeout=5)
+        assert channel == PREPARATION_CHANGED_CHANNEL
+
+
+@pytest.mark.parametrize("preparation_id", ["A009", "A008"])
+async def test_should_save_preparation_with_a_single_statement(
+    preparation_id: str,
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given a new or an existing preparation
+    When calling the repository to save the preparation
+    Then exactly one statement should be sent to the database
+    """
+
+    # Given
+    preparation_in = PreparationIn(
+        id=preparation_id,
+        preparation_time=12,
+        preparation_status=PreparationStatus.IN_PREPARATION,
+        estimated_ready_time=datetime(2023, 1, 1, 0, 45, 0),
+    )
+
+    statements = []
+
+    def count_statement(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+
+    # When
+    try:
+        preparation = await repository.save(preparation=preparation_in)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    # Then
+    assert len(statements) == 1
+    assert "ON CONFLICT" in statements[0]
+    assert preparation.id == preparation_id
+    assert preparation.preparation_status == PreparationStatus.IN_PREPARATION
+
+
 async def test_should_raise_persistence_error_on_insert_db_issue(
     mocker: MockerFixture,
     repository: SAPreparationRepository,
@@ -174,8 +266,6 @@ async def test_should_raise_persistence_error_on_insert_db_issue(
         preparation_status=PreparationStatus.RECEIVED,
     )
 
-    # Mock exists_by_id to return False (so it tries to insert)
-    mocker.patch.object(repository, "exists_by_id", return_value=False)
     mocker.patch.object(
         repository.session,
         "execute",
@@ -206,8 +296,6 @@ async def test_should_raise_persistence_error_on_update_db_issue(
         estimated_ready_time=datetime(2023, 1, 1, 0, 45, 0),
     )
 
-    # Mock exists_by_id to return True (so it tries to update)
-    mocker.patch.object(repository, "exists_by_id", return_value=True)
     mocker.patch.object(
         repository.session,
         "execute",
@@ -352,27 +440,109 @@ async def test_should_raise_persistence_error_on_exists_by_id_db_issue(
     assert "Simulated database error" in str(exc_info.value)
 
 
-async def test_should_return_max_preparation_position(
+async def test_should_enqueue_preparation_at_the_end_of_the_queue(
+    repository: SAPreparationRepository,
+):
+    """Given existing preparations with RECEIVED status
+    When calling the repository to enqueue a new preparation
+    Then it should be inserted after the last received preparation
+    """
+
+    # Given
+    preparation_in = PreparationIn(
+        id="A009",
+        preparation_time=12,
+        preparation_status=PreparationStatus.RECEIVED,
+    )
+
+    # When
+    preparation = await repository.enqueue(preparation=preparation_in)
+
+    # Then
+    assert preparation.id == "A009"
+    assert preparation.preparation_position == 4
+    assert preparation.preparation_status == PreparationStatus.RECEIVED
+    received = await repository.get_received_waiting_list()
+    assert [(p.id, p.preparation_position) for p in received] == [
+        ("A006", 1),
+        ("A007", 2),
+        ("A008", 3),
+        ("A009", 4),
+    ]
+
+
+async def test_should_raise_already_exists_when_enqueuing_duplicated_preparation(
+    db_session: AsyncSession,
     repository: SAPreparationRepository,
 ):
-    """Given existing preparations with positions
-    When calling the repository to get the max preparation position
-    Then the correct max preparation position with status RECEIVED should be returned
+    """Given an existing preparation
+    When calling the repository to enqueue a preparation with the same ID
+    Then an AlreadyExists error should be raised using a single statement
+    """
+
+    # Given
+    preparation_in = PreparationIn(
+        id="A001",
+        preparation_time=12,
+        preparation_status=PreparationStatus.RECEIVED,
+    )
+
+    statements = []
+
+    def count_statement(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+
+    # When / Then
+    try:
+        with pytest.raises(AlreadyExists) as exc_info:
+            await repository.enqueue(preparation=preparation_in)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    assert "Preparation with ID A001 already exists" in str(exc_info.value)
+    assert len(statements) == 1
+
+
+async def test_should_enqueue_distinct_positions_on_concurrent_calls(
+    db_session: AsyncSession,
+    db_session_manager: SessionManager,
+):
+    """Given several preparations enqueued at the same time
+    When each one is enqueued from its own session
+    Then every preparation should get a distinct position
     """
 
+    # Given
+    callers = 10
+
+    async def enqueue(preparation_id: str) -> PreparationOut:
+        async with db_session_manager.session() as session:
+            return await SAPreparationRepository(session=session).enqueue(
+                preparation=PreparationIn(id=preparation_id, preparation_time=5)
+            )
+
     # When
-    max_position = await repository.find_max_position()
+    await asyncio.gather(*(enqueue(f"B{index:03d}") for index in range(callers)))
 
     # Then
-    assert max_position == 3
+    stored_positions = await db_session.execute(
+        select(PreparationModel.preparation_position).where(
+            PreparationModel.id.like("B%")
+        )
+    )
+
+    assert len(set(stored_positions.scalars().all())) == callers
 
 
-async def test_should_raise_persistence_error_on_db_issue_when_finding_max_position(
+async def test_should_raise_persistence_error_on_db_issue_when_enqueuing(
     mocker: MockerFixture,
     repository: SAPreparationRepository,
 ):
     """Given a database issue
-    When calling the repository to get the max preparation position
+    When calling the repository to enqueue a preparation
     Then a PersistenceError should be raised
     """
 
@@ -385,63 +555,94 @@ async def test_should_raise_persistence_error_on_db_issue_when_finding_max_posit
 
     # When / Then
     with pytest.raises(PersistenceError) as exc_info:
-        await repository.find_max_position()
+        await repository.enqueue(
+            preparation=PreparationIn(id="A010", preparation_time=15)
+        )
 
     assert "Simulated database error" in str(exc_info.value)
 
 
-async def test_should_return_received_preparation_with_min_position(
+async def test_should_save_many_preparations_after_the_last_received_one(
     repository: SAPreparationRepository,
 ):
     """Given existing preparations with RECEIVED status
-    When calling the repository to get the received preparation with min position
-    Then the first preparation in the queue should be returned
+    When calling the repository to save many new preparations
+    Then they should be queued after the last received preparation in the given
+    order
     """
 
+    # Given
+    preparation_ids = [f"B{index:04d}" for index in range(1500, 0, -1)]
+    preparations_in = [
+        PreparationIn(id=preparation_id, preparation_time=5)
+        for preparation_id in preparation_ids
+    ]
+
     # When
-    preparation = await repository.find_received_with_min_position()
+    saved_ids = await repository.save_many(preparations=preparations_in)
 
     # Then
-    assert preparation == PreparationOut(
-        id="A006",
-        preparation_position=1,
-        preparation_time=10,
-        estimated_ready_time=None,
-        preparation_status=PreparationStatus.RECEIVED,
-        created_at=datetime(2023, 1, 1, 0, 26, 0),
-        timestamp=datetime(2023, 1, 1, 0, 26, 0),
-    )
+    assert saved_ids == preparation_ids
+    received = await repository.get_received_waiting_list()
+    assert [p.id for p in received] == ["A006", "A007", "A008", *preparation_ids]
+    assert [p.preparation_position for p in received] == list(range(1, 1504))
 
 
-async def test_should_raise_not_found_error_when_no_received_preparation_exists(
+async def test_should_skip_existing_preparations_when_saving_many(
     repository: SAPreparationRepository,
 ):
-    """Given no preparations with RECEIVED status
-    When calling the repository to get the received preparation with min position
-    Then a NotFound error should be raised
+    """Given existing preparations
+    When calling the repository to save many preparations, some of them with
+    existing IDs
+    Then only the new preparations should be inserted and the existing ones should
+    be left untouched
     """
 
     # Given
-    # First, update all RECEIVED preparations to a different status
-    preparations = await repository.get_received_waiting_list()
-    for prep in preparations:
-        prep_in = PreparationIn.model_validate(prep)
-        prep_in.preparation_status = PreparationStatus.IN_PREPARATION
-        await repository.save(preparation=prep_in)
+    preparations_in = [
+        PreparationIn(id="A009", preparation_time=5),
+        PreparationIn(id="A001", preparation_time=30),
+        PreparationIn(id="A010", preparation_time=5),
+    ]
 
-    # When / Then
-    with pytest.raises(NotFound) as exc_info:
-        await repository.find_received_with_min_position()
+    # When
+    saved_ids = await repository.save_many(preparations=preparations_in)
 
-    assert "No received preparation found" in str(exc_info.value)
+    # Then
+    assert saved_ids == ["A009", "A010"]
+    existing = await repository.find_by_id(preparation_id="A001")
+    assert existing.preparation_time == 8
+    assert existing.preparation_status == PreparationStatus.COMPLETED
+    received = await repository.get_received_waiting_list()
+    assert [p.id for p in received][-2:] == ["A009", "A010"]
 
 
-async def test_should_raise_persistence_error_on_db_issue_when_finding_received_with_min_position(  # noqa: E501
+async def test_should_not_touch_the_database_when_saving_no_preparations(
+    mocker: MockerFixture,
+    repository: SAPreparationRepository,
+):
+    """Given no preparations
+    When calling the repository to save many preparations
+    Then nothing should be executed and no ID should be returned
+    """
+
+    # Given
+    execute = mocker.spy(repository.session, "execute")
+
+    # When
+    saved_ids = await repository.save_many(preparations=[])
+
+    # Then
+    assert saved_ids == []
+    execute.assert_not_called()
+
+
+async def test_should_raise_persistence_error_on_db_issue_when_saving_many(
     mocker: MockerFixture,
     repository: SAPreparationRepository,
 ):
     """Given a database issue
-    When calling the repository to get the received preparation with min position
+    When calling the repository to save many preparations
     Then a PersistenceError should be raised
     """
 
@@ -454,45 +655,211 @@ async def test_should_raise_persistence_error_on_db_issue_when_finding_received_
 
     # When / Then
     with pytest.raises(PersistenceError) as exc_info:
-        await repository.find_received_with_min_position()
+        await repository.save_many(
+            preparations=[PreparationIn(id="A010", preparation_time=15)]
+        )
 
     assert "Simulated database error" in str(exc_info.value)
 
 
-async def test_should_decrement_positions_greater_than_given_position(
+async def test_should_derive_received_positions_without_renumbering_rows(
+    db_session: AsyncSession,
     repository: SAPreparationRepository,
 ):
-    """Given existing preparations with positions
-    When calling the repository to decrement positions greater than a given position
-    Then the positions of the affected preparations should be decremented by 1
+    """Given the preparation at the head of the queue has been started
+    When calling the repository to get the received waiting list
+    Then the positions should be derived from the enqueue order without any of the
+    remaining rows being rewritten
     """
 
     # Given
-    position_to_decrement = 1
+    await repository.save(
+        preparation=PreparationIn(
+            id="A006",
+            preparation_position=None,
+            preparation_time=10,
+            estimated_ready_time=datetime(2023, 1, 1, 0, 40, 0),
+            preparation_status=PreparationStatus.IN_PREPARATION,
+        )
+    )
 
     # When
-    await repository.decrement_received_positions_greater_than(
-        preparation_position=position_to_decrement
-    )
+    preparations = await repository.get_received_waiting_list()
 
     # Then
-    preparations = await repository.get_received_waiting_list()
     positions = {p.id: p.preparation_position for p in preparations}
+    assert positions == {"A007": 1, "A008": 2}
+    assert [p.timestamp for p in preparations] == [
+        datetime(2023, 1, 1, 0, 27, 0),
+        datetime(2023, 1, 1, 0, 28, 0),
+    ]
+
+    stored_positions = await db_session.execute(
+        select(PreparationModel.id, PreparationModel.preparation_position).where(
+            PreparationModel.id.in_(["A007", "A008"])
+        )
+    )
+
+    assert dict(stored_positions.tuples().all()) == {"A007": 2, "A008": 3}
+
+
+async def test_should_keep_queue_order_when_saving_a_received_preparation_read(
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given a received preparation read by ID, with its rank in the queue as its
+    position
+    When it is modified and saved back
+    Then its stored enqueue sequence and the queue order should be unchanged
+    """
+
+    # Given
+    await repository.start_next_received()
+    await repository.enqueue(
+        preparation=PreparationIn(
+            id="A000",
+            preparation_time=5,
+            preparation_status=PreparationStatus.RECEIVED,
+        )
+    )
+    preparation = await repository.find_by_id(preparation_id="A000")
+    assert preparation.preparation_position == 3
+
+    preparation_in = PreparationIn.model_validate(preparation)
+    preparation_in.preparation_time = 20
+
+    # When
+    await repository.save(preparation=preparation_in)
+
+    # Then
+    stored_position = await db_session.execute(
+        select(PreparationModel.preparation_position).where(
+            PreparationModel.id == "A000"
+        )
+    )
+    assert stored_position.scalar_one() == 4
+    assert [
+        (p.id, p.preparation_position, p.preparation_time)
+        for p in await repository.get_received_waiting_list()
+    ] == [("A007", 1, 8), ("A008", 2, 15), ("A000", 3, 20)]
+
+
+async def test_should_return_derived_position_when_finding_received_by_id(
+    repository: SAPreparationRepository,
+):
+    """Given a gap in the enqueue sequence of the received preparations
+    When calling the repository to get a received preparation by ID
+    Then its position should be its current position in the queue
+    """
+
+    # Given
+    await repository.save(
+        preparation=PreparationIn(
+            id="A007",
+            preparation_position=None,
+            preparation_time=8,
+            estimated_ready_time=datetime(2023, 1, 1, 0, 40, 0),
+            preparation_status=PreparationStatus.IN_PREPARATION,
+        )
+    )
+
+    # When
+    preparation = await repository.find_by_id(preparation_id="A008")
+
+    # Then
+    assert preparation.preparation_position == 2
+
+
+async def test_should_start_received_preparation_at_the_head_of_the_queue(
+    repository: SAPreparationRepository,
+):
+    """Given existing preparations with RECEIVED status
+    When calling the repository to start the next received preparation
+    Then the one with the minimum position should be moved to IN_PREPARATION
+    """
+
+    # When
+    preparation = await repository.start_next_received()
+
+    # Then
+    assert preparation.id == "A006"
+    assert preparation.preparation_position is None
+    assert preparation.preparation_status == PreparationStatus.IN_PREPARATION
+    assert preparation.estimated_ready_time == preparation.timestamp + timedelta(
+        minutes=10
+    )
+    assert [p.id for p in await repository.get_received_waiting_list()] == [
+        "A007",
+        "A008",
+    ]
+
+
+async def test_should_raise_not_found_when_no_received_preparation_to_start(
+    repository: SAPreparationRepository,
+):
+    """Given every received preparation has already been started
+    When calling the repository to start the next received preparation
+    Then a NotFound error should be raised
+    """
+
+    # Given
+    for _ in range(3):
+        await repository.start_next_received()
+
+    # When / Then
+    with pytest.raises(NotFound) as exc_info:
+        await repository.start_next_received()
+
+    assert "No received preparation found" in str(exc_info.value)
+
+
+async def test_should_start_distinct_preparations_on_concurrent_calls(
+    db_session: AsyncSession,
+    db_session_manager: SessionManager,
+):
+    """Given a queue with as many received preparations as concurrent callers
+    When every caller starts the next received preparation at the same time
+    Then each one should start a different preparation
+    """
+
+    # Given
+    callers = 10
+    await db_session.execute(
+        insert(PreparationModel),
+        [
+            {
+                "id": f"B{index:03d}",
+                "preparation_position": 3 + index,
+                "preparation_time": 5,
+                "preparation_status": PreparationStatus.RECEIVED,
+            }
+            for index in range(1, callers - 2)
+        ],
+    )
+
+    await db_session.commit()
 
-    assert positions == {
-        "A006": 1,  # Unchanged because it will disappear from this query after the use
-        # case updates its status to IN_PREPARATION
-        "A007": 1,  # This passed from 2 to 1
-        "A008": 2,  # And this from 3 to 2
-    }
+    async def start_next() -> PreparationOut:
+        async with db_session_manager.session() as session:
+            return await SAPreparationRepository(session=session).start_next_received()
+
+    # When
+    started = await asyncio.gather(*(start_next() for _ in range(callers)))
+
+    # Then
+    assert len({preparation.id for preparation in started}) == callers
+    assert (
+        await SAPreparationRepository(session=db_session).get_received_waiting_list()
+        == []
+    )
 
 
-async def test_should_raise_persistence_error_on_db_issue_when_decrementing_positions(
+async def test_should_raise_persistence_error_on_db_issue_when_starting_next_received(
     mocker: MockerFixture,
     repository: SAPreparationRepository,
 ):
     """Given a database issue
-    When calling the repository to decrement positions
+    When calling the repository to start the next received preparation
     Then a PersistenceError should be raised
     """
 
@@ -505,9 +872,7 @@ async def test_should_raise_persistence_error_on_db_issue_when_decrementing_posi
 
     # When / Then
     with pytest.raises(PersistenceError) as exc_info:
-        await repository.decrement_received_positions_greater_than(
-            preparation_position=1
-        )
+        await repository.start_next_received()
 
     assert "Simulated database error" in str(exc_info.value)
 
@@ -693,3 +1058,336 @@ async def test_should_raise_persistence_error_on_db_issue_when_getting_ready_wai
         await repository.get_ready_waiting_list()
 
     assert "Simulated database error" in str(exc_info.value)
+
+
+async def test_should_page_through_whole_waiting_list_in_board_order(
+    repository: SAPreparationRepository,
+):
+    """Given preparations in every waiting list status
+    When calling the repository to read the waiting list page by page
+    Then the pages should follow the board order with the received positions
+    counted from the head of the queue
+    """
+
+    # Given
+    pages = []
+    after = None
+
+    # When
+    while True:
+        preparations, after = await repository.get_waiting_list_page(
+            limit=3, after=after
+        )
+
+        pages.append([(p.id, p.preparation_position) for p in preparations])
+        if after is None:
+            break
+
+    # Then
+    assert pages == [
+        [("A002", None), ("A003", None), ("A004", None)],
+        [("A005", None), ("A006", 1), ("A007", 2)],
+        [("A008", 3)],
+    ]
+
+
+async def test_should_page_through_waiting_list_of_a_single_status(
+    repository: SAPreparationRepository,
+):
+    """Given preparations with RECEIVED status
+    When calling the repository to read the received waiting list page by page
+    Then each page should resume after the previous one keeping the queue positions
+    """
+
+    # When
+    first_page, after = await repository.get_waiting_list_page(
+        limit=2, preparation_status=PreparationStatus.RECEIVED
+    )
+
+    second_page, last_cursor = await repository.get_waiting_list_page(
+        limit=2, preparation_status=PreparationStatus.RECEIVED, after=after
+    )
+
+    # Then
+    assert [(p.id, p.preparation_position) for p in first_page] == [
+        ("A006", 1),
+        ("A007", 2),
+    ]
+
+    assert after is not None
+    assert after.preparation_status == PreparationStatus.RECEIVED
+    assert after.id == "A007"
+    assert [(p.id, p.preparation_position) for p in second_page] == [("A008", 3)]
+    assert last_cursor is None
+
+
+async def test_should_raise_persistence_error_on_db_issue_when_getting_waiting_list_page(  # noqa: E501
+    mocker: MockerFixture,
+    repository: SAPreparationRepository,
+):
+    """Given a database issue
+    When calling the repository to get a page of the waiting list
+    Then a PersistenceError should be raised
+    """
+
+    # Given
+    mocker.patch.object(
+        repository.session,
+        "execute",
+        side_effect=SQLAlchemyError("Simulated database error"),
+    )
+
+    # When / Then
+    with pytest.raises(PersistenceError) as exc_info:
+        await repository.get_waiting_list_page(limit=10)
+
+    assert "Simulated database error" in str(exc_info.value)
+
+
+async def test_should_archive_completed_preparations_older_than_the_retention(
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given completed preparations last updated longer and shorter ago than a
+    retention
+    When calling the repository to archive the completed preparations older than it
+    Then only the older completed preparations should be moved to the history
+    """
+
+    # Given
+    await repository.save(
+        preparation=PreparationIn(
+            id="A009",
+            preparation_time=5,
+            preparation_status=PreparationStatus.COMPLETED,
+        )
+    )
+
+    # When
+    archived_count = await repository.archive_completed(
+        retention=timedelta(days=1), limit=10
+    )
+
+    # Then
+    assert archived_count == 1
+    remaining = await db_session.execute(select(PreparationModel.id))
+    assert "A001" not in remaining.scalars().all()
+    assert await repository.exists_by_id(preparation_id="A009")
+
+    archived = (await db_session.execute(select(PreparationHistoryModel))).scalar_one()
+
+    assert archived.id == "A001"
+    assert archived.preparation_time == 8
+    assert archived.preparation_status == PreparationStatus.COMPLETED
+    assert archived.created_at == datetime(2023, 1, 1, 0, 0, 0)
+    assert archived.timestamp == datetime(2023, 1, 1, 0, 10, 0)
+    assert isinstance(archived.archived_at, datetime)
+
+
+async def test_should_archive_at_most_the_given_limit_oldest_first(
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given more completed preparations to archive than the given limit
+    When calling the repository to archive the completed preparations
+    Then only the oldest ones up to the limit should be archived
+    """
+
+    # Given
+    await db_session.execute(
+        insert(PreparationModel),
+        [
+            {
+                "id": f"C{index:03d}",
+                "preparation_position": None,
+                "preparation_time": 5,
+                "estimated_ready_time": None,
+                "preparation_status": PreparationStatus.COMPLETED,
+                "created_at": datetime(2022, 1, 1, 0, index, 0),
+                "timestamp": datetime(2022, 1, 1, 0, index, 0),
+            }
+            for index in range(5)
+        ],
+    )
+
+    await db_session.commit()
+
+    # When
+    archived_count = await repository.archive_completed(
+        retention=timedelta(days=1), limit=3
+    )
+
+    # Then
+    assert archived_count == 3
+    archived = await db_session.execute(select(PreparationHistoryModel.id))
+    assert sorted(archived.scalars().all()) == ["C000", "C001", "C002"]
+
+
+async def test_should_raise_persistence_error_on_db_issue_when_archiving_completed(
+    mocker: MockerFixture,
+    repository: SAPreparationRepository,
+):
+    """Given a database issue
+    When calling the repository to archive the completed preparations
+    Then a PersistenceError should be raised
+    """
+
+    # Given
+    mocker.patch.object(
+        repository.session,
+        "execute",
+        side_effect=SQLAlchemyError("Simulated database error"),
+    )
+
+    # When / Then
+    with pytest.raises(PersistenceError) as exc_info:
+        await repository.archive_completed(retention=timedelta(days=1), limit=10)
+
+    assert "Simulated database error" in str(exc_info.value)
+
+
+async def test_should_return_whole_waiting_list_in_board_order(
+    repository: SAPreparationRepository,
+):
+    """Given existing preparations in every status
+    When calling the repository to get the whole waiting list
+    Then the ready, in preparation and received preparations should be returned in
+    this order, each group sorted by its own key, without the completed ones
+    """
+
+    # When
+    preparations = await repository.get_waiting_list()
+
+    # Then
+    assert [(p.id, p.preparation_position) for p in preparations] == [
+        ("A002", None),
+        ("A003", None),
+        ("A004", None),
+        ("A005", None),
+        ("A006", 1),
+        ("A007", 2),
+        ("A008", 3),
+    ]
+
+    assert preparations == [
+        *(await repository.get_ready_waiting_list()),
+        *(await repository.get_in_preparation_waiting_list()),
+        *(await repository.get_received_waiting_list()),
+    ]
+
+
+async def test_should_raise_persistence_error_on_db_issue_when_getting_waiting_list(
+    mocker: MockerFixture,
+    repository: SAPreparationRepository,
+):
+    """Given a database issue
+    When calling the repository to get the whole waiting list
+    Then a PersistenceError should be raised
+    """
+
+    # Given
+    mocker.patch.object(
+        repository.session,
+        "execute",
+        side_effect=SQLAlchemyError("Simulated database error"),
+    )
+
+    # When / Then
+    with pytest.raises(PersistenceError) as exc_info:
+        await repository.get_waiting_list()
+
+    assert "Simulated database error" in str(exc_info.value)
+
+
+async def test_should_return_preparations_changed_since_the_given_time(
+    repository: SAPreparationRepository,
+):
+    """Given preparations last updated before and after a given time
+    When calling the repository to get the preparations changed since it
+    Then the newer ones should be returned in the order they changed, with the
+    completed ones, and the whole queue with the received positions counted from
+    its head, as a preparation left it
+    """
+
+    # When
+    preparations, read_at = await repository.get_changed_since(
+        since=datetime(2023, 1, 1, 0, 26, 0), limit=10
+    )
+
+    # Then
+    assert [(p.id, p.preparation_position) for p in preparations] == [
+        ("A006", 1),
+        ("A005", None),
+        ("A007", 2),
+        ("A008", 3),
+        ("A003", None),
+    ]
+
+    assert read_at > datetime(2023, 1, 1, 0, 30, 0)
+
+    # When
+    preparations, _ = await repository.get_changed_since(
+        since=datetime(2023, 1, 1, 0, 0, 0), limit=2
+    )
+
+    # Then
+    assert [(p.id, p.preparation_status) for p in preparations] == [
+        ("A001", PreparationStatus.COMPLETED),
+        ("A002", PreparationStatus.READY),
+    ]
+
+
+async def test_should_return_renumbered_queue_changed_since_next_was_started(
+    repository: SAPreparationRepository,
+):
+    """Given no preparation changed since a given time
+    When the head of the queue is started and the changes since that time are read
+    Then the started preparation should be returned along with every received one
+    still in the queue, at its new position
+    """
+
+    # Given
+    since = datetime(2023, 1, 1, 1, 0, 0)
+    preparations, _ = await repository.get_changed_since(since=since, limit=10)
+    assert not preparations
+
+    await repository.start_next_received()
+
+    # When
+    preparations, _ = await repository.get_changed_since(since=since, limit=10)
+
+    # Then
+    assert [
+        (p.id, p.preparation_status, p.preparation_position) for p in preparations
+    ] == [
+        ("A007", PreparationStatus.RECEIVED, 1),
+        ("A008", PreparationStatus.RECEIVED, 2),
+        ("A006", PreparationStatus.IN_PREPARATION, None),
+    ]
+    assert [
+        (p.id, p.preparation_position)
+        for p in await repository.get_received_waiting_list()
+    ] == [("A007", 1), ("A008", 2)]
+
+
+async def test_should_raise_persistence_error_on_db_issue_when_getting_changes(
+    mocker: MockerFixture,
+    repository: SAPreparationRepository,
+):
+    """Given a database issue
+    When calling the repository to get the preparations changed since a given time
+    Then a PersistenceError should be raised
+    """
+
+    # Given
+    mocker.patch.object(
+        repository.session,
+        "execute",
+        side_effect=SQLAlchemyError("Simulated database error"),
+    )
+
+    # When / Then
+    with pytest.raises(PersistenceError) as exc_info:
+        await repository.get_changed_since(since=datetime(2023, 1, 1), limit=10)
+
+    assert "Simulated database error" in str(exc_info.value)
@@ -0,0 +1,212 @@
+# pylint: disable=W0621
+
+"""Query plan regression tests for the SQL Alchemy Preparation Repository"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from preparation_api.adapters.out import SAPreparationRepository
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
+from preparation_api.infrastructure.orm.models import Preparation as PreparationModel
+
+HISTORY_SIZE = 20_000
+LIVE_SIZE_PER_STATUS = 100
+
+
+@pytest.fixture(autouse=True)
+async def create_scenario(db_session: AsyncSession):
+    """Fixture to seed a table with a long history and a live board"""
+    base_time = datetime(2023, 1, 1, 0, 0, 0)
+    preparations = [
+        {
+            "id": f"C{index:06d}",
+            "preparation_position": None,
+            "preparation_time": 10,
+            "estimated_ready_time": None,
+            "preparation_status": PreparationStatus.COMPLETED,
+            "created_at": base_time + timedelta(seconds=index),
+            "timestamp": base_time + timedelta(seconds=index),
+        }
+        for index in range(HISTORY_SIZE)
+    ]
+
+    for prefix, status in (
+        ("R", PreparationStatus.RECEIVED),
+        ("P", PreparationStatus.IN_PREPARATION),
+        ("D", PreparationStatus.READY),
+    ):
+        preparations.extend(
+            {
+                "id": f"{prefix}{index:06d}",
+                "preparation_position": (
+                    index + 1 if status == PreparationStatus.RECEIVED else None
+                ),
+                "preparation_time": 10,
+                "estimated_ready_time": (
+                    base_time + timedelta(minutes=index)
+                    if status == PreparationStatus.IN_PREPARATION
+                    else None
+                ),
+                "preparation_status": status,
+                "created_at": base_time + timedelta(seconds=index),
+                "timestamp": base_time + timedelta(seconds=index),
+            }
+            for index in range(LIVE_SIZE_PER_STATUS)
+        )
+
+    await db_session.execute(insert(PreparationModel), preparations)
+    await db_session.commit()
+
+    # Refresh the statistics and the visibility map so index-only scans are
+    # considered the same way they would be on a long-lived table
+    async with db_session.bind.connect() as connection:
+        autocommit_connection = await connection.execution_options(
+            isolation_level="AUTOCOMMIT"
+        )
+
+        await autocommit_connection.execute(text("VACUUM ANALYZE tb_pagamento"))
+
+
+@pytest.fixture
+def repository(db_session: AsyncSession) -> SAPreparationRepository:
+    """Fixture to create an instance of SAPreparationRepository"""
+    return SAPreparationRepository(session=db_session)
+
+
+def _plan_node_types(plan: dict) -> list[str]:
+    """Flatten the node types of a JSON query plan"""
+    node_types = [plan["Node Type"]]
+    for sub_plan in plan.get("Plans", []):
+        node_types.extend(_plan_node_types(sub_plan))
+    return node_types
+
+
+async def _explain(db_session: AsyncSession, statement) -> list[str]:
+    """Get the node types of the query plan of a statement"""
+    compiled = statement.compile(
+        dialect=db_session.bind.dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+
+    result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return _plan_node_types(plan[0]["Plan"])
+
+
+async def _captured_statements(
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+    method_name: str,
+    **kwargs,
+) -> list:
+    """Call a repository method capturing the statements it executes"""
+    statements = []
+
+    def capture_statement(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    sync_session = db_session.sync_session
+    event.listen(sync_session, "do_orm_execute", capture_statement)
+    try:
+        await getattr(repository, method_name)(**kwargs)
+    finally:
+        event.remove(sync_session, "do_orm_execute", capture_statement)
+
+    return statements
+
+
+@pytest.mark.parametrize(
+    "method_name",
+    [
+        "get_received_waiting_list",
+        "get_in_preparation_waiting_list",
+        "get_ready_waiting_list",
+    ],
+)
+async def test_should_read_waiting_list_without_sequential_scan(
+    method_name: str,
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given a table where completed preparations outnumber the live board
+    When the repository runs a waiting list query
+    Then the query plan should use the partial indexes instead of a sequential scan
+    followed by a sort
+    """
+
+    # Given
+    statements = await _captured_statements(db_session, repository, method_name)
+    assert statements
+
+    for statement in statements:
+        # When
+        node_types = await _explain(db_session, statement)
+
+        # Then
+        assert "Seq Scan" not in node_types, f"{method_name}: {node_types}"
+        assert "Sort" not in node_types, f"{method_name}: {node_types}"
+
+
+async def test_should_read_whole_waiting_list_from_partial_indexes(
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given a table where completed preparations outnumber the live board
+    When the repository reads the whole waiting list
+    Then every status branch should be read from its partial index, leaving only
+    the final ordering of the live rows to sort
+    """
+
+    # Given
+    (statement,) = await _captured_statements(
+        db_session, repository, "get_waiting_list"
+    )
+
+    # When
+    node_types = await _explain(db_session, statement)
+
+    # Then
+    assert "Seq Scan" not in node_types, node_types
+    assert sum("Index" in node_type for node_type in node_types) == 3, node_types
+
+
+@pytest.mark.parametrize(
+    "after",
+    [
+        WaitingListCursor(
+            preparation_status=PreparationStatus.READY,
+            sort_key=datetime(2023, 1, 1, 0, 0, 50),
+            id="D000050",
+        ),
+        WaitingListCursor(
+            preparation_status=PreparationStatus.RECEIVED, sort_key=50, id="R000049"
+        ),
+    ],
+)
+async def test_should_read_waiting_list_page_from_partial_indexes(
+    after: WaitingListCursor,
+    db_session: AsyncSession,
+    repository: SAPreparationRepository,
+):
+    """Given a table where completed preparations outnumber the live board
+    When the repository reads a page of the waiting list resuming from a cursor
+    Then the page should be read from the partial indexes without a sequential scan
+    """
+
+    # Given
+    (statement,) = await _captured_statements(
+        db_session, repository, "get_waiting_list_page", limit=10, after=after
+    )
+
+    # When
+    node_types = await _explain(db_session, statement)
+
+    # Then
+    assert "Seq Scan" not in node_types, node_types
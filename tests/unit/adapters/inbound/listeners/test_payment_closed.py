@@ -2,22 +2,29 @@
 
 """Unit tests for Payment Closed Listener and Handler"""
 
+import asyncio
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock
 
 import pytest
 from botocore.exceptions import ClientError as BotoCoreClientError
+from botocore.exceptions import EndpointConnectionError
 from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from preparation_api.adapters.inbound.listeners.payment_closed import (
+    InvalidPaymentClosedMessage,
     PaymentClosedHandler,
     PaymentClosedListener,
 )
 from preparation_api.application.commands import CreatePreparationFromPaymentCommand
 from preparation_api.application.use_cases import CreatePreparationFromPaymentUseCase
+from preparation_api.domain.exceptions import AlreadyExists, OrderInfoProviderError
 from preparation_api.infrastructure.orm import SessionManager
 
+DEAD_LETTER_QUEUE_NAME = "test-payment-dlq.fifo"
+
 
 @pytest.fixture
 def mock_session_manager(mocker: MockerFixture) -> MagicMock:
@@ -60,27 +67,114 @@ def sample_payment_message_dict() -> dict:
     }
 
 
+class AwaitableAttribute:
+    """Attribute of an aioboto3 resource, which can be awaited more than once"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self.value
+
+
 @pytest.fixture
 def mock_sqs_message(
     sample_payment_message_dict: dict, mocker: MockerFixture
 ) -> MagicMock:
     """Mock SQS message for testing"""
     message = mocker.MagicMock()
+    message.body = AwaitableAttribute(json.dumps(sample_payment_message_dict))
+    message.message_id = AwaitableAttribute("MSG123")
+    message.attributes = AwaitableAttribute({"MessageGroupId": "payments"})
+    message.receipt_handle = AwaitableAttribute("RH123")
+    message.delete = mocker.AsyncMock()
+    return message
 
-    # Create coroutines for body and message_id that return awaitable values
-    async def get_body():
-        return json.dumps(sample_payment_message_dict)
-
-    async def get_message_id():
-        return "MSG123"
 
-    # Set the attributes to the coroutine objects themselves (not calling them)
-    message.body = get_body()
-    message.message_id = get_message_id()
-    message.delete = mocker.AsyncMock()
+def _sqs_message(
+    mocker: MockerFixture,
+    message_id: str,
+    group_id: str | None,
+    receive_count: int = 1,
+):
+    """Create a mock SQS message of a message group"""
+    message = mocker.MagicMock()
+    message.message_id = AwaitableAttribute(message_id)
+    attributes = {"ApproximateReceiveCount": str(receive_count)}
+    if group_id is not None:
+        attributes["MessageGroupId"] = group_id
+
+    message.attributes = AwaitableAttribute(attributes)
+    message.receipt_handle = AwaitableAttribute(f"RH-{message_id}")
+    message.body = AwaitableAttribute(f'{{"Message": "{message_id}"}}')
     return message
 
 
+def _mock_queue(
+    mocker: MockerFixture,
+    session: MagicMock,
+    batches: list[list],
+    shutdown_event: SimpleNamespace,
+    failed_ids=(),
+) -> MagicMock:
+    """Create the mock SQS queue of a session receiving the given batches
+
+    Shutdown is requested once the last batch is received.
+    """
+    mock_queue = mocker.MagicMock()
+    remaining = list(batches)
+
+    async def receive_messages(**_kwargs):
+        messages = remaining.pop(0) if remaining else []
+        if not remaining:
+            shutdown_event.shutdown = True
+
+        return messages
+
+    mock_queue.receive_messages = mocker.AsyncMock(side_effect=receive_messages)
+
+    async def delete_messages(Entries):  # pylint: disable=C0103
+        return {
+            "Successful": [
+                {"Id": entry["Id"]}
+                for entry in Entries
+                if entry["Id"] not in failed_ids
+            ],
+            "Failed": [
+                {
+                    "Id": entry["Id"],
+                    "SenderFault": True,
+                    "Code": "ReceiptHandleIsInvalid",
+                    "Message": "The receipt handle is not valid",
+                }
+                for entry in Entries
+                if entry["Id"] in failed_ids
+            ],
+        }
+
+    mock_queue.delete_messages = mocker.AsyncMock(side_effect=delete_messages)
+    mock_queue.change_message_visibility_batch = mocker.AsyncMock(
+        return_value={"Successful": [], "Failed": []}
+    )
+    dead_letter_queue = mocker.MagicMock()
+    dead_letter_queue.send_message = mocker.AsyncMock(return_value={})
+    mock_queue.dead_letter_queue = dead_letter_queue
+
+    async def get_queue_by_name(QueueName):  # pylint: disable=C0103
+        return dead_letter_queue if QueueName == DEAD_LETTER_QUEUE_NAME else mock_queue
+
+    sqs_client = session.resource.return_value.__aenter__.return_value
+    sqs_client.get_queue_by_name = mocker.AsyncMock(side_effect=get_queue_by_name)
+    return mock_queue
+
+
+@pytest.fixture
+def shutdown_event() -> SimpleNamespace:
+    """Shutdown handler which did not receive a signal yet"""
+    return SimpleNamespace(shutdown=False)
+
+
 @pytest.fixture
 def listener_settings(mocker: MockerFixture) -> Mock:
     """PaymentClosedListenerSettings for testing"""
@@ -88,7 +182,15 @@ def listener_settings(mocker: MockerFixture) -> Mock:
     mock_settings.QUEUE_NAME = "test-payment-queue"
     mock_settings.WAIT_TIME_SECONDS = 5
     mock_settings.MAX_NUMBER_OF_MESSAGES_PER_BATCH = 10
+    mock_settings.MAX_CONCURRENT_MESSAGES = 2
+    mock_settings.RECEIVERS = 2
+    mock_settings.MAX_PENDING_SEQUENCES = 10
     mock_settings.VISIBILITY_TIMEOUT_SECONDS = 30
+    mock_settings.VISIBILITY_HEARTBEAT_SECONDS = 10
+    mock_settings.DEAD_LETTER_QUEUE_NAME = None
+    mock_settings.MAX_RECEIVE_COUNT = 3
+    mock_settings.RETRY_BASE_DELAY_SECONDS = 2.0
+    mock_settings.RETRY_MAX_DELAY_SECONDS = 60.0
     return mock_settings
 
 
@@ -141,7 +243,63 @@ class TestPaymentClosedHandler:
             )
         )
 
-        mock_sqs_message.delete.assert_awaited_once_with()
+        mock_sqs_message.delete.assert_not_awaited()
+
+    async def test_should_handle_a_message_whose_payment_is_already_prepared(
+        self,
+        mock_session_manager: MagicMock,
+        mock_use_case_factory: MagicMock,
+        mock_use_case: MagicMock,
+        mock_sqs_message: MagicMock,
+        mocker: MockerFixture,
+    ):
+        """Given a message delivered again for a payment already prepared
+        When the handler processes the message
+        Then it should be handled without an error, so it is deleted
+        """
+
+        # Given
+        mock_use_case.execute = mocker.AsyncMock(
+            side_effect=AlreadyExists("Preparation for payment ID A001 already exists")
+        )
+        handler = PaymentClosedHandler(
+            session_manager=mock_session_manager, use_case_factory=mock_use_case_factory
+        )
+
+        # When
+        await handler.handle(message=mock_sqs_message)
+
+        # Then
+        mock_use_case.execute.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "body",
+        ["not json", "[]", "{}", '{"Message": "{}"}'],
+    )
+    async def test_should_raise_invalid_message_error_for_a_malformed_body(
+        self,
+        mock_session_manager: MagicMock,
+        mock_use_case_factory: MagicMock,
+        mock_sqs_message: MagicMock,
+        body: str,
+    ):
+        """Given a message whose body is not a payment closed notification
+        When the handler processes the message
+        Then an InvalidPaymentClosedMessage error should be raised without opening
+        a database session
+        """
+
+        # Given
+        mock_sqs_message.body = AwaitableAttribute(body)
+        handler = PaymentClosedHandler(
+            session_manager=mock_session_manager, use_case_factory=mock_use_case_factory
+        )
+
+        # When / Then
+        with pytest.raises(InvalidPaymentClosedMessage):
+            await handler.handle(message=mock_sqs_message)
+
+        mock_session_manager.session.assert_not_called()
 
 
 class TestPaymentClosedListener:
@@ -173,25 +331,30 @@ class TestPaymentClosedListener:
         assert listener.wait_time == 5
         assert listener.max_messages == 10
         assert listener.visibility_timeout == 30
+        assert listener.max_concurrent_messages == 2
+        assert listener.receivers == 2
+        assert listener.max_pending_sequences == 10
 
     async def test_should_consume_messages_successfully(
         self,
         mock_aio_boto3_session: MagicMock,
         listener_settings: Mock,
         mock_sqs_message: MagicMock,
+        shutdown_event: SimpleNamespace,
         mocker: MockerFixture,
     ):
         """Given messages available in the queue
-        When consuming messages
-        Then it should retrieve and process them successfully
+        When listening until they are received
+        Then it should retrieve, process and delete them successfully
         """
 
         # Given
         mock_handler = mocker.Mock(spec=PaymentClosedHandler)
         mock_handler.handle = mocker.AsyncMock()
 
-        mock_queue = mocker.MagicMock()
-        mock_queue.receive_messages = mocker.AsyncMock(return_value=[mock_sqs_message])
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, [[mock_sqs_message]], shutdown_event
+        )
 
         listener = PaymentClosedListener(
             session=mock_aio_boto3_session,
@@ -200,18 +363,21 @@ class TestPaymentClosedListener:
         )
 
         # When
-        messages = await listener._consume(queue=mock_queue)  # pylint: disable=W0212
+        await listener.listen(shutdown_event=shutdown_event)
 
         # Then
-        assert len(messages) == 1
-        mock_queue.receive_messages.assert_awaited_once_with(
+        mock_queue.receive_messages.assert_awaited_with(
             MessageAttributeNames=["All"],
+            MessageSystemAttributeNames=["MessageGroupId", "ApproximateReceiveCount"],
             MaxNumberOfMessages=10,
             WaitTimeSeconds=5,
             VisibilityTimeout=30,
         )
 
         mock_handler.handle.assert_awaited_once_with(message=mock_sqs_message)
+        mock_queue.delete_messages.assert_awaited_once_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH123"}]
+        )
 
     async def test_should_handle_sqs_client_error_during_consume(
         self,
@@ -220,7 +386,7 @@ class TestPaymentClosedListener:
         mocker: MockerFixture,
     ):
         """Given an SQS client error occurs
-        When consuming messages
+        When receiving messages
         Then it should raise the client error
         """
 
@@ -242,28 +408,203 @@ class TestPaymentClosedListener:
 
         # When/Then
         with pytest.raises(BotoCoreClientError):
-            await listener._consume(queue=mock_queue)  # pylint: disable=W0212
+            await listener._receive(  # pylint: disable=W0212
+                queue=mock_queue, pending=asyncio.Queue()
+            )
 
-    async def test_should_handle_message_processing_failure_and_delete_message(
+    @pytest.mark.parametrize(
+        "error",
+        [
+            OrderInfoProviderError("Order API unavailable"),
+            TypeError("Unexpected bug"),
+        ],
+    )
+    async def test_should_retry_a_message_failing_transiently_with_backoff(
         self,
         mock_aio_boto3_session: MagicMock,
         listener_settings: Mock,
-        mock_sqs_message: MagicMock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+        error: Exception,
+    ):
+        """Given a message failing with an error other than an invalid message on
+        its second attempt
+        When listening until the message is received
+        Then it should be left in the queue, visible again after the backoff
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=error)
+
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", group_id="A", receive_count=2)]],
+            shutdown_event,
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+            jitter=lambda low, high: high,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_queue.change_message_visibility_batch.assert_awaited_once_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH-MSG1", "VisibilityTimeout": 4}]
+        )
+        mock_queue.dead_letter_queue.send_message.assert_not_awaited()
+        mock_queue.delete_messages.assert_not_awaited()
+
+    async def test_should_retry_the_rest_of_the_group_without_blocking_the_batch(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a batch whose first message of a group fails transiently
+        When listening until the batch is received
+        Then the later message of the group should be retried along with it and
+        the message of the other group should be handled and deleted
+        """
+
+        # Given
+        failing = _sqs_message(mocker, "MSG1", group_id="A")
+        later = _sqs_message(mocker, "MSG2", group_id="A")
+        other = _sqs_message(mocker, "MSG3", group_id="B")
+
+        async def handle(message):
+            if message is failing:
+                raise OrderInfoProviderError("Order API unavailable")
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, [[failing, later, other]], shutdown_event
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+            jitter=lambda low, high: high,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        assert mock_handler.handle.await_count == 2
+        mock_handler.handle.assert_any_await(message=other)
+        mock_queue.change_message_visibility_batch.assert_awaited_once_with(
+            Entries=[
+                {"Id": "0", "ReceiptHandle": "RH-MSG1", "VisibilityTimeout": 2},
+                {"Id": "1", "ReceiptHandle": "RH-MSG2", "VisibilityTimeout": 2},
+            ]
+        )
+        mock_queue.delete_messages.assert_awaited_once_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH-MSG3"}]
+        )
+
+    @pytest.mark.parametrize(
+        "error, receive_count",
+        [
+            (InvalidPaymentClosedMessage("Invalid message"), 1),
+            (OrderInfoProviderError("Order API unavailable"), 3),
+        ],
+    )
+    async def test_should_dead_letter_a_message_failing_for_good(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+        error: Exception,
+        receive_count: int,
+    ):
+        """Given a message failing permanently or for the last allowed attempt
+        When listening until the message is received
+        Then it should be sent to the dead-letter queue and deleted
+        """
+
+        # Given
+        listener_settings.DEAD_LETTER_QUEUE_NAME = DEAD_LETTER_QUEUE_NAME
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=error)
+
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", "A", receive_count=receive_count)]],
+            shutdown_event,
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_queue.dead_letter_queue.send_message.assert_awaited_once_with(
+            MessageBody='{"Message": "MSG1"}',
+            MessageAttributes={
+                "SourceMessageId": {"DataType": "String", "StringValue": "MSG1"},
+                "ErrorType": {
+                    "DataType": "String",
+                    "StringValue": type(error).__name__,
+                },
+                "ErrorMessage": {"DataType": "String", "StringValue": str(error)},
+            },
+            MessageGroupId="A",
+            MessageDeduplicationId="MSG1",
+        )
+        mock_queue.change_message_visibility_batch.assert_not_awaited()
+        mock_queue.delete_messages.assert_awaited_once_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH-MSG1"}]
+        )
+
+    async def test_should_retry_a_message_the_dead_letter_queue_did_not_take(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
         mocker: MockerFixture,
     ):
-        """Given a message processing failure occurs
-        When consuming messages
-        Then it should log error and delete the message to avoid retries
+        """Given a message failing permanently and the dead-letter queue failing
+        When listening until the message is received
+        Then the message should be retried instead of deleted
         """
 
         # Given
+        listener_settings.DEAD_LETTER_QUEUE_NAME = DEAD_LETTER_QUEUE_NAME
         mock_handler = mocker.Mock(spec=PaymentClosedHandler)
         mock_handler.handle = mocker.AsyncMock(
-            side_effect=Exception("Processing failed")
+            side_effect=InvalidPaymentClosedMessage("Invalid")
         )
 
-        mock_queue = mocker.MagicMock()
-        mock_queue.receive_messages = mocker.AsyncMock(return_value=[mock_sqs_message])
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", group_id=None)]],
+            shutdown_event,
+        )
+        mock_queue.dead_letter_queue.send_message = mocker.AsyncMock(
+            side_effect=BotoCoreClientError(
+                error_response={"Error": {"Code": "TestError", "Message": "Error"}},
+                operation_name="SendMessage",
+            )
+        )
 
         listener = PaymentClosedListener(
             session=mock_aio_boto3_session,
@@ -272,29 +613,68 @@ class TestPaymentClosedListener:
         )
 
         # When
-        messages = await listener._consume(queue=mock_queue)  # pylint: disable=W0212
+        await listener.listen(shutdown_event=shutdown_event)
 
         # Then
-        assert len(messages) == 1
-        mock_handler.handle.assert_awaited_once_with(message=mock_sqs_message)
-        mock_sqs_message.delete.assert_awaited_once_with()
+        mock_queue.dead_letter_queue.send_message.assert_awaited_once()
+        mock_queue.change_message_visibility_batch.assert_awaited_once()
+        mock_queue.delete_messages.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        "receive_count, jitter, expected_delay",
+        [
+            (1, 0.0, 1),
+            (1, 1.0, 2),
+            (3, 0.0, 4),
+            (3, 1.0, 8),
+            (10, 0.0, 30),
+            (10, 1.0, 60),
+        ],
+    )
+    def test_should_back_off_exponentially_with_jitter_up_to_the_maximum(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        mocker: MockerFixture,
+        receive_count: int,
+        jitter: float,
+        expected_delay: int,
+    ):
+        """Given a base delay of 2 seconds and a maximum of 60 seconds
+        When getting the retry delay of a message received a number of times
+        Then half of the doubled delay should be random, up to the maximum
+        """
+
+        # Given
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mocker.Mock(spec=PaymentClosedHandler),
+            settings=listener_settings,
+            jitter=lambda low, high: low + (high - low) * jitter,
+        )
+
+        # When
+        delay = listener._retry_delay(receive_count)  # pylint: disable=W0212
+
+        # Then
+        assert delay == expected_delay
 
     async def test_should_handle_empty_message_queue(
         self,
         mock_aio_boto3_session: MagicMock,
         listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
         mocker: MockerFixture,
     ):
         """Given no messages in the queue
-        When consuming messages
-        Then it should return empty list
+        When listening until a receive comes back empty
+        Then it should neither handle nor delete anything
         """
 
         # Given
         mock_handler = mocker.Mock(spec=PaymentClosedHandler)
 
-        mock_queue = mocker.MagicMock()
-        mock_queue.receive_messages = mocker.AsyncMock(return_value=[])
+        mock_queue = _mock_queue(mocker, mock_aio_boto3_session, [], shutdown_event)
 
         listener = PaymentClosedListener(
             session=mock_aio_boto3_session,
@@ -303,11 +683,12 @@ class TestPaymentClosedListener:
         )
 
         # When
-        messages = await listener._consume(queue=mock_queue)  # pylint: disable=W0212
+        await listener.listen(shutdown_event=shutdown_event)
 
         # Then
-        assert len(messages) == 0
+        mock_queue.receive_messages.assert_awaited()
         mock_handler.handle.assert_not_awaited()
+        mock_queue.delete_messages.assert_not_awaited()
 
     async def test_should_stop_listening_on_shutdown_signal(
         self,
@@ -354,3 +735,527 @@ class TestPaymentClosedListener:
         )
 
         mock_handler.handle.assert_not_awaited()
+
+    async def test_should_handle_messages_of_a_batch_concurrently_up_to_the_limit(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a batch of three messages of distinct groups and a limit of two
+        When listening until the batch is received
+        Then two messages should be handled at the same time and never more
+        """
+
+        # Given
+        running = 0
+        max_running = 0
+
+        async def handle(message):  # pylint: disable=W0613
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        messages = [
+            _sqs_message(mocker, f"MSG{index}", group_id=None) for index in range(3)
+        ]
+
+        _mock_queue(mocker, mock_aio_boto3_session, [messages], shutdown_event)
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        assert mock_handler.handle.await_count == 3
+        assert max_running == 2
+
+    async def test_should_handle_messages_of_the_same_group_in_order(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a batch with two messages of one group and one of another group
+        When listening until the batch is received
+        Then the messages of the same group should be handled one after the other
+        """
+
+        # Given
+        events = []
+
+        async def handle(message):
+            message_id = await message.message_id
+            events.append(f"start {message_id}")
+            await asyncio.sleep(0.01)
+            events.append(f"end {message_id}")
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        first = _sqs_message(mocker, "MSG1", group_id="A")
+        second = _sqs_message(mocker, "MSG2", group_id="A")
+        other = _sqs_message(mocker, "MSG3", group_id="B")
+
+        _mock_queue(
+            mocker, mock_aio_boto3_session, [[first, second, other]], shutdown_event
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        assert events.index("end MSG1") < events.index("start MSG2")
+        assert events.index("start MSG3") < events.index("end MSG1")
+
+    async def test_should_keep_handling_the_batch_when_a_message_fails(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a batch where one message fails to be handled
+        When listening until the batch is received
+        Then the other messages should still be handled
+        """
+
+        # Given
+        failing = _sqs_message(mocker, "MSG1", group_id=None)
+        succeeding = _sqs_message(mocker, "MSG2", group_id=None)
+
+        async def handle(message):
+            if message is failing:
+                raise InvalidPaymentClosedMessage("Invalid message")
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, [[failing, succeeding]], shutdown_event
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_handler.handle.assert_any_await(message=succeeding)
+        mock_queue.delete_messages.assert_awaited_once()
+        entries = mock_queue.delete_messages.await_args.kwargs["Entries"]
+        assert {entry["ReceiptHandle"] for entry in entries} == {"RH-MSG1", "RH-MSG2"}
+
+    async def test_should_report_messages_the_batch_delete_failed_for(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Given a batch delete that fails for one of the handled messages
+        When listening until the batch is received
+        Then the message it failed for should be reported
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock()
+        messages = [
+            _sqs_message(mocker, "MSG1", group_id=None),
+            _sqs_message(mocker, "MSG2", group_id=None),
+        ]
+
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [messages],
+            shutdown_event,
+            failed_ids=("1",),
+        )
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_queue.delete_messages.assert_awaited_once()
+        errors = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+        assert len(errors) == 1
+        assert "MSG2" in errors[0]
+        assert "ReceiptHandleIsInvalid" in errors[0]
+
+    async def test_should_not_raise_when_the_batch_delete_fails(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given SQS failing the whole batch delete
+        When listening until the batch is received
+        Then the error should be logged without stopping the listener, leaving
+        the messages to be received again
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock()
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", None)]],
+            shutdown_event,
+        )
+        mock_queue.delete_messages = mocker.AsyncMock(
+            side_effect=BotoCoreClientError(
+                error_response={"Error": {"Code": "TestError", "Message": "Error"}},
+                operation_name="DeleteMessageBatch",
+            )
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_queue.delete_messages.assert_awaited_once()
+
+    async def test_should_receive_the_next_batch_while_handling_the_previous_one(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a single receiver and two batches in the queue
+        When listening until both batches are received
+        Then the second batch should be received while the first one is handled
+        """
+
+        # Given
+        listener_settings.RECEIVERS = 1
+        first = _sqs_message(mocker, "MSG1", group_id=None)
+        second = _sqs_message(mocker, "MSG2", group_id=None)
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, [[first], [second]], shutdown_event
+        )
+
+        received_while_handling = []
+
+        async def handle(message):
+            if message is first:
+                await asyncio.sleep(0.01)
+                received_while_handling.append(mock_queue.receive_messages.await_count)
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        assert received_while_handling == [2]
+        assert mock_handler.handle.await_count == 2
+        assert mock_queue.delete_messages.await_count == 2
+
+    async def test_should_stop_receiving_while_the_internal_queue_is_full(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a single worker blocked on a message and room for one more
+        When listening to a queue with more batches
+        Then the receiver should wait for the worker instead of receiving them
+        """
+
+        # Given
+        listener_settings.RECEIVERS = 1
+        listener_settings.MAX_CONCURRENT_MESSAGES = 1
+        listener_settings.MAX_PENDING_SEQUENCES = 1
+        batches = [
+            [_sqs_message(mocker, f"MSG{index}", group_id=None)] for index in range(5)
+        ]
+
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, batches, shutdown_event
+        )
+
+        release = asyncio.Event()
+
+        async def handle(message):  # pylint: disable=W0613
+            await release.wait()
+
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        listening = asyncio.create_task(listener.listen(shutdown_event=shutdown_event))
+        await asyncio.sleep(0.01)
+        received_while_blocked = mock_queue.receive_messages.await_count
+        release.set()
+        await listening
+
+        # Then
+        # One batch handled, one queued and one waiting to be queued
+        assert received_while_blocked == 3
+        assert mock_handler.handle.await_count == 5
+
+    async def test_should_extend_the_visibility_while_a_message_is_handled(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a message taking longer to handle than the heartbeat interval
+        When listening until the message is received
+        Then its visibility should be extended until it is handled and no longer
+        """
+
+        # Given
+        listener_settings.VISIBILITY_HEARTBEAT_SECONDS = 0.01
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+
+        async def handle(message):  # pylint: disable=W0613
+            await asyncio.sleep(0.035)
+
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", group_id=None)]],
+            shutdown_event,
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+        extensions = mock_queue.change_message_visibility_batch.await_count
+        await asyncio.sleep(0.03)
+
+        # Then
+        assert extensions >= 2
+        assert mock_queue.change_message_visibility_batch.await_count == extensions
+        mock_queue.change_message_visibility_batch.assert_awaited_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH-MSG1", "VisibilityTimeout": 30}]
+        )
+        mock_queue.delete_messages.assert_awaited_once()
+
+    async def test_should_keep_handling_when_the_visibility_extension_fails(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given SQS failing to extend the visibility of a message
+        When listening until the message is received
+        Then the message should still be handled and deleted
+        """
+
+        # Given
+        listener_settings.VISIBILITY_HEARTBEAT_SECONDS = 0.01
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+
+        async def handle(message):  # pylint: disable=W0613
+            await asyncio.sleep(0.025)
+
+        mock_handler.handle = mocker.AsyncMock(side_effect=handle)
+
+        mock_queue = _mock_queue(
+            mocker,
+            mock_aio_boto3_session,
+            [[_sqs_message(mocker, "MSG1", group_id=None)]],
+            shutdown_event,
+        )
+        mock_queue.change_message_visibility_batch = mocker.AsyncMock(
+            side_effect=BotoCoreClientError(
+                error_response={"Error": {"Code": "TestError", "Message": "Error"}},
+                operation_name="ChangeMessageVisibilityBatch",
+            )
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await listener.listen(shutdown_event=shutdown_event)
+
+        # Then
+        mock_queue.change_message_visibility_batch.assert_awaited()
+        mock_handler.handle.assert_awaited_once()
+        mock_queue.delete_messages.assert_awaited_once()
+
+    async def test_should_not_hang_when_sqs_cannot_be_reached_to_delete(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given the SQS endpoint being unreachable when deleting the batches
+        When listening until the batches are received
+        Then every message should still be handled and the listener should stop
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock()
+        batches = [
+            [_sqs_message(mocker, f"MSG{index}", group_id=None)] for index in range(3)
+        ]
+
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, batches, shutdown_event
+        )
+        mock_queue.delete_messages = mocker.AsyncMock(
+            side_effect=EndpointConnectionError(endpoint_url="https://sqs")
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        # When
+        await asyncio.wait_for(listener.listen(shutdown_event=shutdown_event), 1)
+
+        # Then
+        assert mock_handler.handle.await_count == 3
+        assert mock_queue.delete_messages.await_count == 3
+
+    async def test_should_settle_the_batch_when_a_sequence_fails_unexpectedly(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        shutdown_event: SimpleNamespace,
+        mocker: MockerFixture,
+    ):
+        """Given a batch where settling one of the messages fails unexpectedly
+        When listening until the batch is received
+        Then the other message should still be deleted, leaving the failed one to
+        be received again
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        mock_handler.handle = mocker.AsyncMock()
+        failing = _sqs_message(mocker, "MSG1", group_id="A")
+        succeeding = _sqs_message(mocker, "MSG2", group_id="B")
+
+        mock_queue = _mock_queue(
+            mocker, mock_aio_boto3_session, [[failing, succeeding]], shutdown_event
+        )
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+
+        process = listener._process  # pylint: disable=W0212
+
+        async def process_or_fail(msg):
+            if msg is failing:
+                raise RuntimeError("Unexpected")
+
+            return await process(msg)
+
+        mocker.patch.object(listener, "_process", side_effect=process_or_fail)
+
+        # When
+        await asyncio.wait_for(listener.listen(shutdown_event=shutdown_event), 1)
+
+        # Then
+        mock_queue.delete_messages.assert_awaited_once_with(
+            Entries=[{"Id": "0", "ReceiptHandle": "RH-MSG2"}]
+        )
+
+    async def test_should_stop_listening_when_a_worker_dies(
+        self,
+        mock_aio_boto3_session: MagicMock,
+        listener_settings: Mock,
+        mocker: MockerFixture,
+    ):
+        """Given a worker stopping on an error
+        When listening for messages
+        Then the listener should stop, raising the error
+        """
+
+        # Given
+        mock_handler = mocker.Mock(spec=PaymentClosedHandler)
+        never_shutdown = SimpleNamespace(shutdown=False)
+        mock_queue = _mock_queue(mocker, mock_aio_boto3_session, [], never_shutdown)
+
+        listener = PaymentClosedListener(
+            session=mock_aio_boto3_session,
+            handler=mock_handler,
+            settings=listener_settings,
+        )
+        mocker.patch.object(
+            listener, "_work", side_effect=RuntimeError("Worker failed")
+        )
+
+        # When/Then
+        with pytest.raises(ExceptionGroup) as error:
+            await asyncio.wait_for(listener.listen(shutdown_event=never_shutdown), 1)
+
+        assert error.group_contains(RuntimeError)
+        mock_queue.receive_messages.assert_awaited()
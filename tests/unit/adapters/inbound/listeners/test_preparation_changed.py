@@ -0,0 +1,206 @@
+# pylint: disable=W0621
+
+"""Unit tests for Preparation Changed Listener"""
+
+import asyncio
+import contextlib
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.inbound.listeners.preparation_changed import (
+    PreparationChangedListener,
+)
+from preparation_api.infrastructure.orm.models import PREPARATION_CHANGED_CHANNEL
+
+
+class FakeConnection:
+    """Fake asyncpg connection delivering notifications on demand"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query, timeout=None):  # pylint: disable=W0613
+        return "SELECT 1"
+
+    def is_closed(self):
+        return self.closed
+
+    def terminate(self):
+        self.closed = True
+
+    def notify(self, channel):
+        """Deliver a notification as the server would"""
+        self.listeners[channel](self, 1234, channel, "")
+
+    def lose(self):
+        """Drop the connection as the server would"""
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+@pytest.fixture
+def settings(mocker: MockerFixture) -> MagicMock:
+    """Fixture to create a mock PreparationChangedListenerSettings for testing"""
+    mock_settings = mocker.Mock()
+    mock_settings.RECONNECT_DELAY_SECONDS = 0.0
+    mock_settings.HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+    return mock_settings
+
+
+@pytest.fixture
+def waiting_list_cache(mocker: MockerFixture) -> MagicMock:
+    """Fixture to create a mock WaitingListCache"""
+    return mocker.Mock()
+
+
+async def _start(listener: PreparationChangedListener) -> asyncio.Task:
+    task = asyncio.create_task(listener.listen())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    return task
+
+
+async def _stop(task: asyncio.Task):
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def test_should_invalidate_cache_when_preparations_change(
+    mocker: MockerFixture,
+    settings: MagicMock,
+    waiting_list_cache: MagicMock,
+):
+    """Given a listener connected to the preparation changed channel
+    When a preparation changed notification is received
+    Then the cached waiting list should be invalidated
+    """
+
+    # Given
+    connection = FakeConnection()
+    listener = PreparationChangedListener(
+        connect=mocker.AsyncMock(return_value=connection),
+        waiting_list_cache=waiting_list_cache,
+        settings=settings,
+    )
+
+    task = await _start(listener)
+    waiting_list_cache.invalidate.reset_mock()
+
+    # When
+    connection.notify(PREPARATION_CHANGED_CHANNEL)
+
+    # Then
+    waiting_list_cache.invalidate.assert_called_once_with()
+    await _stop(task)
+    assert connection.is_closed()
+
+
+async def test_should_invalidate_cache_and_reconnect_when_connection_is_lost(
+    mocker: MockerFixture,
+    settings: MagicMock,
+    waiting_list_cache: MagicMock,
+):
+    """Given a listener connected to the preparation changed channel
+    When the connection is lost
+    Then the cached waiting list should be invalidated, since notifications are
+    missed until the listener connects again
+    """
+
+    # Given
+    first_connection = FakeConnection()
+    second_connection = FakeConnection()
+    connect = mocker.AsyncMock(side_effect=[first_connection, second_connection])
+    listener = PreparationChangedListener(
+        connect=connect,
+        waiting_list_cache=waiting_list_cache,
+        settings=settings,
+    )
+
+    task = await _start(listener)
+    waiting_list_cache.invalidate.reset_mock()
+
+    # When
+    first_connection.lose()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # Then
+    assert connect.await_count == 2
+    assert PREPARATION_CHANGED_CHANNEL in second_connection.listeners
+    # Once for the lost connection and once for the changes made before the new
+    # one listened
+    assert waiting_list_cache.invalidate.call_count == 2
+    await _stop(task)
+
+
+async def test_should_keep_retrying_when_connection_fails(
+    mocker: MockerFixture,
+    settings: MagicMock,
+    waiting_list_cache: MagicMock,
+):
+    """Given a database that refuses connections
+    When the listener is started
+    Then it should keep retrying to connect instead of stopping
+    """
+
+    # Given
+    connection = FakeConnection()
+    connect = mocker.AsyncMock(
+        side_effect=[ConnectionRefusedError(), ConnectionRefusedError(), connection]
+    )
+    listener = PreparationChangedListener(
+        connect=connect,
+        waiting_list_cache=waiting_list_cache,
+        settings=settings,
+    )
+
+    # When
+    task = await _start(listener)
+
+    # Then
+    assert connect.await_count == 3
+    assert PREPARATION_CHANGED_CHANNEL in connection.listeners
+    await _stop(task)
+
+
+async def test_should_call_on_change_along_with_invalidation(
+    mocker: MockerFixture,
+    settings: MagicMock,
+    waiting_list_cache: MagicMock,
+):
+    """Given a listener with an on_change callback
+    When a preparation changed notification is received
+    Then the callback should be called along with the cache invalidation
+    """
+
+    # Given
+    connection = FakeConnection()
+    on_change = mocker.Mock()
+    listener = PreparationChangedListener(
+        connect=mocker.AsyncMock(return_value=connection),
+        waiting_list_cache=waiting_list_cache,
+        settings=settings,
+        on_change=on_change,
+    )
+
+    task = await _start(listener)
+    on_change.reset_mock()
+
+    # When
+    connection.notify(PREPARATION_CHANGED_CHANNEL)
+
+    # Then
+    on_change.assert_called_once_with()
+    await _stop(task)
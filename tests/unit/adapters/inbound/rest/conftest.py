@@ -9,12 +9,19 @@ from httpx import ASGITransport, AsyncClient
 from pytest_mock import MockerFixture
 
 from preparation_api.adapters.inbound.rest.dependencies.core import (
+    get_get_preparation_changes_use_case,
+    get_get_waiting_list_page_use_case,
     get_get_waiting_list_use_case,
     get_mark_preparation_as_completed_use_case,
     get_mark_preparation_as_ready_use_case,
+    get_response_compressor,
     get_start_next_preparation_use_case,
+    get_waiting_list_broadcaster,
+    get_waiting_list_cache,
 )
+from preparation_api.adapters.inbound.rest.v1.compression import ResponseCompressor
 from preparation_api.entrypoints.api import app
+from preparation_api.infrastructure.config import ResponseCompressionSettings
 
 
 @pytest.fixture
@@ -22,9 +29,16 @@ def payment_use_cases_mock(mocker: MockerFixture):
     """Fixture to provide a mock for payment use cases called in the REST API"""
     return {
         "waiting_list": mocker.MagicMock(),
+        "changes": mocker.MagicMock(),
+        "waiting_list_page": mocker.MagicMock(),
         "start_next": mocker.MagicMock(),
         "mark_as_ready": mocker.MagicMock(),
         "mark_as_completed": mocker.MagicMock(),
+        "waiting_list_cache": mocker.MagicMock(),
+        "waiting_list_broadcaster": mocker.MagicMock(),
+        "response_compressor": ResponseCompressor(
+            settings=ResponseCompressionSettings()
+        ),
     }
 
 
@@ -35,6 +49,10 @@ async def test_app_client(
     """Fixture to provide an AsyncClient for testing FastAPI endpoints"""
     app.dependency_overrides = {
         get_get_waiting_list_use_case: lambda: payment_use_cases_mock["waiting_list"],
+        get_get_preparation_changes_use_case: lambda: payment_use_cases_mock["changes"],
+        get_get_waiting_list_page_use_case: lambda: payment_use_cases_mock[
+            "waiting_list_page"
+        ],
         get_start_next_preparation_use_case: lambda: payment_use_cases_mock[
             "start_next"
         ],
@@ -44,6 +62,11 @@ async def test_app_client(
         get_mark_preparation_as_completed_use_case: (
             lambda: payment_use_cases_mock["mark_as_completed"]
         ),
+        get_waiting_list_cache: lambda: payment_use_cases_mock["waiting_list_cache"],
+        get_waiting_list_broadcaster: lambda: payment_use_cases_mock[
+            "waiting_list_broadcaster"
+        ],
+        get_response_compressor: lambda: payment_use_cases_mock["response_compressor"],
     }
 
     async with AsyncClient(
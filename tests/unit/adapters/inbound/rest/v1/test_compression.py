@@ -0,0 +1,88 @@
+# pylint: disable=W0621
+
+"""Unit tests for the REST API v1 response compression"""
+
+import gzip
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.inbound.rest.v1.compression import ResponseCompressor
+
+
+@pytest.fixture
+def settings(mocker: MockerFixture) -> MagicMock:
+    """Fixture to create a mock ResponseCompressionSettings for testing"""
+    mock_settings = mocker.Mock()
+    mock_settings.MINIMUM_SIZE = 1024
+    mock_settings.GZIP_LEVEL = 6
+    return mock_settings
+
+
+@pytest.fixture
+def compressor(settings: MagicMock) -> ResponseCompressor:
+    """Fixture to create a ResponseCompressor"""
+    return ResponseCompressor(settings=settings)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("identity", None),
+        ("*", "gzip"),
+        ("*;q=0.5, gzip;q=0", None),
+        (None, None),
+        ("", None),
+    ],
+)
+def test_should_negotiate_the_coding_the_client_prefers(
+    compressor: ResponseCompressor,
+    accept_encoding: str | None,
+    expected: str | None,
+):
+    """Given a client Accept-Encoding header
+    When negotiating the coding of a large body
+    Then gzip should be chosen only when the client accepts it
+    """
+
+    # When
+    encoding = compressor.negotiate(accept_encoding, size=4096)
+
+    # Then
+    assert encoding == expected
+
+
+def test_should_not_compress_bodies_under_the_minimum_size(
+    compressor: ResponseCompressor,
+):
+    """Given a body smaller than the minimum size
+    When negotiating its coding
+    Then it should be sent as it is
+    """
+
+    # When
+    encoding = compressor.negotiate("gzip, br", size=1023)
+
+    # Then
+    assert encoding is None
+
+
+def test_should_compress_with_gzip(compressor: ResponseCompressor):
+    """Given a JSON body
+    When compressing it with gzip
+    Then it should decompress back to the same body
+    """
+
+    # Given
+    body = b'{"items":[]}' * 200
+
+    # When
+    compressed = compressor.compress(body, "gzip")
+
+    # Then
+    assert len(compressed) < len(body)
+    assert gzip.decompress(compressed) == body
@@ -2,6 +2,9 @@
 
 """Unit tests for Preparation API v1 routes"""
 
+import asyncio
+import base64
+import contextlib
 from datetime import datetime
 
 from httpx import AsyncClient
@@ -11,9 +14,17 @@ from preparation_api.application.commands import (
     MarkPreparationAsCompletedCommand,
     MarkPreparationAsReadyCommand,
 )
+from preparation_api.application.queries import (
+    GetPreparationChangesQuery,
+    GetWaitingListPageQuery,
+)
 from preparation_api.domain.entities import PreparationOut
 from preparation_api.domain.exceptions import PersistenceError
-from preparation_api.domain.value_objects import PreparationStatus
+from preparation_api.domain.value_objects import (
+    CacheStats,
+    PreparationStatus,
+    WaitingListCursor,
+)
 
 
 class TestStartNextRoute:
@@ -407,6 +418,190 @@ class TestGetWaitingListRoute:
         assert len(response_data["items"]) == 0
         payment_use_cases_mock["waiting_list"].execute.assert_awaited_once()
 
+    async def test_should_tag_waiting_list_with_etag_and_cache_control(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given preparations in the waiting list
+        When retrieving the waiting list via GET endpoint
+        Then it should be returned with a weak ETag and a short Cache-Control
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[
+                PreparationOut(
+                    id="A001",
+                    preparation_position=1,
+                    preparation_time=15,
+                    preparation_status=PreparationStatus.RECEIVED,
+                    created_at=datetime(2025, 11, 26, 14, 0, 0),
+                    timestamp=datetime(2025, 11, 26, 14, 0, 0),
+                )
+            ]
+        )
+
+        # When
+        response = await test_app_client.get("/v1/preparation/waiting-list")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert "max-age=1" in response.headers["Cache-Control"]
+        assert "stale-while-revalidate" in response.headers["Cache-Control"]
+
+    async def test_should_return_304_when_waiting_list_is_unchanged(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a client that already has the current waiting list
+        When it polls the waiting list sending its ETag in If-None-Match
+        Then a 304 should be returned without a body
+        """
+
+        # Given
+        preparation = PreparationOut(
+            id="A001",
+            preparation_position=1,
+            preparation_time=15,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=datetime(2025, 11, 26, 14, 0, 0),
+            timestamp=datetime(2025, 11, 26, 14, 0, 0),
+        )
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[preparation]
+        )
+
+        first_response = await test_app_client.get("/v1/preparation/waiting-list")
+        etag = first_response.headers["ETag"]
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", headers={"If-None-Match": etag}
+        )
+
+        # Then
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    async def test_should_return_waiting_list_when_it_changed_since_etag(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a client that has an older waiting list
+        When a preparation changes and the client polls with its old ETag
+        Then the new waiting list should be returned with a new ETag
+        """
+
+        # Given
+        preparation = PreparationOut(
+            id="A001",
+            preparation_position=1,
+            preparation_time=15,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=datetime(2025, 11, 26, 14, 0, 0),
+            timestamp=datetime(2025, 11, 26, 14, 0, 0),
+        )
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[preparation]
+        )
+
+        first_response = await test_app_client.get("/v1/preparation/waiting-list")
+        etag = first_response.headers["ETag"]
+
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[
+                preparation.model_copy(
+                    update={
+                        "preparation_status": PreparationStatus.IN_PREPARATION,
+                        "timestamp": datetime(2025, 11, 26, 14, 1, 0),
+                    }
+                )
+            ]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", headers={"If-None-Match": etag}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["items"][0]["preparation_status"] == "IN_PREPARATION"
+
+    async def test_should_compress_large_waiting_list_for_clients_accepting_it(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a waiting list larger than the compression minimum size
+        When a client accepting gzip retrieves it via GET endpoint
+        Then it should be returned compressed with gzip, varying on Accept-Encoding
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[
+                PreparationOut(
+                    id=f"A{index:03d}",
+                    preparation_position=index,
+                    preparation_time=15,
+                    preparation_status=PreparationStatus.RECEIVED,
+                    created_at=datetime(2025, 11, 26, 14, 0, 0),
+                    timestamp=datetime(2025, 11, 26, 14, 0, 0),
+                )
+                for index in range(1, 41)
+            ]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert int(response.headers["Content-Length"]) < len(response.content)
+        assert len(response.json()["items"]) == 40
+
+    async def test_should_not_compress_small_waiting_list(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a waiting list smaller than the compression minimum size
+        When a client accepting gzip retrieves it via GET endpoint
+        Then it should be returned uncompressed
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list"].execute = mocker.AsyncMock(
+            return_value=[]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.json() == {"items": [], "next_cursor": None}
+
     async def test_should_return_500_when_persistence_error_occurs_getting_waiting_list(
         self,
         test_app_client: AsyncClient,
@@ -430,3 +625,452 @@ class TestGetWaitingListRoute:
         assert response.status_code == 500
         assert response.json()["detail"] == "Internal server error"
         payment_use_cases_mock["waiting_list"].execute.assert_awaited_once()
+
+    async def test_should_return_waiting_list_page_with_next_cursor(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given more ready preparations than the requested limit
+        When retrieving the ready waiting list via GET endpoint with a limit
+        Then the page should be returned with an opaque cursor of the next page
+        """
+
+        # Given
+        preparation = PreparationOut(
+            id="A001",
+            preparation_position=None,
+            preparation_time=15,
+            estimated_ready_time=None,
+            preparation_status=PreparationStatus.READY,
+            created_at=datetime(2025, 11, 26, 14, 0, 0),
+            timestamp=datetime(2025, 11, 26, 14, 20, 0),
+        )
+
+        next_cursor = WaitingListCursor(
+            preparation_status=PreparationStatus.READY,
+            sort_key=datetime(2025, 11, 26, 14, 20, 0),
+            id="A001",
+        )
+
+        payment_use_cases_mock["waiting_list_page"].execute = mocker.AsyncMock(
+            return_value=([preparation], next_cursor)
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", params={"status": "READY", "limit": 1}
+        )
+
+        # Then
+        assert response.status_code == 200
+        response_data = response.json()
+        assert [item["id"] for item in response_data["items"]] == ["A001"]
+        assert (
+            WaitingListCursor.model_validate_json(
+                base64.urlsafe_b64decode(response_data["next_cursor"])
+            )
+            == next_cursor
+        )
+
+        payment_use_cases_mock["waiting_list_page"].execute.assert_awaited_once_with(
+            query=GetWaitingListPageQuery(
+                limit=1, preparation_status=PreparationStatus.READY
+            )
+        )
+
+        payment_use_cases_mock["waiting_list"].execute.assert_not_called()
+
+    async def test_should_resume_waiting_list_from_cursor(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given the cursor returned with a previous page
+        When retrieving the waiting list via GET endpoint with that cursor
+        Then the next page should be read after the cursor with the default limit
+        and no cursor should be returned on the last page
+        """
+
+        # Given
+        cursor = WaitingListCursor(
+            preparation_status=PreparationStatus.RECEIVED, sort_key=12, id="A012"
+        )
+
+        payment_use_cases_mock["waiting_list_page"].execute = mocker.AsyncMock(
+            return_value=([], None)
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list",
+            params={
+                "cursor": base64.urlsafe_b64encode(
+                    cursor.model_dump_json().encode()
+                ).decode()
+            },
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_cursor": None}
+        payment_use_cases_mock["waiting_list_page"].execute.assert_awaited_once_with(
+            query=GetWaitingListPageQuery(limit=50, after=cursor)
+        )
+
+    async def test_should_return_400_when_waiting_list_cursor_is_invalid(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a cursor that was not returned by the API
+        When retrieving the waiting list via GET endpoint with that cursor
+        Then a 400 error should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list_page"].execute = mocker.AsyncMock()
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", params={"cursor": "not-a-cursor"}
+        )
+
+        # Then
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+        payment_use_cases_mock["waiting_list_page"].execute.assert_not_awaited()
+
+    async def test_should_return_400_when_waiting_list_cursor_sort_key_mismatches(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a cursor of the ready waiting list whose sort key is a position
+        When retrieving the waiting list via GET endpoint with that cursor
+        Then a 400 error should be returned without reading the waiting list
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list_page"].execute = mocker.AsyncMock()
+        token = base64.urlsafe_b64encode(
+            b'{"preparation_status": "READY", "sort_key": 12, "id": "A012"}'
+        ).decode()
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", params={"cursor": token}
+        )
+
+        # Then
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+        payment_use_cases_mock["waiting_list_page"].execute.assert_not_awaited()
+
+    async def test_should_return_422_when_waiting_list_limit_is_out_of_range(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+    ):
+        """Given a limit above the maximum page size
+        When retrieving the waiting list via GET endpoint with that limit
+        Then a 422 error should be returned without reading the waiting list
+        """
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list", params={"limit": 1000}
+        )
+
+        # Then
+        assert response.status_code == 422
+        payment_use_cases_mock["waiting_list_page"].execute.assert_not_called()
+
+    async def test_should_return_waiting_list_cache_stats(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+    ):
+        """Given a waiting list cache that served some reads
+        When retrieving its statistics via GET endpoint
+        Then the hit, miss and coalesced counters should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["waiting_list_cache"].stats.return_value = CacheStats(
+            hits=7, misses=2, coalesced=3
+        )
+
+        # When
+        response = await test_app_client.get("/v1/preparation/waiting-list/cache-stats")
+
+        # Then
+        assert response.status_code == 200
+        assert response.json() == {"hits": 7, "misses": 2, "coalesced": 3}
+
+    async def test_should_stream_snapshot_and_changes_of_waiting_list(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+    ):
+        """Given a broadcaster with a snapshot and a change of the waiting list
+        When a client opens the waiting list stream
+        Then it should get the snapshot followed by the change as Server-Sent Events
+        """
+
+        # Given
+        snapshot = b'event: snapshot\ndata: {"items":[]}\n\n'
+        change = b'event: completed\ndata: {"id": "A001"}\n\n'
+        changes: asyncio.Queue[bytes] = asyncio.Queue()
+        changes.put_nowait(change)
+        # The stream ends once the client is dropped for falling behind
+        changes.put_nowait(b"")
+
+        @contextlib.asynccontextmanager
+        async def subscribe():
+            yield snapshot, changes
+
+        broadcaster = payment_use_cases_mock["waiting_list_broadcaster"]
+        broadcaster.subscribe = subscribe
+        broadcaster.heartbeat_seconds = 15.0
+
+        # When
+        response = await test_app_client.get("/v1/preparation/waiting-list/stream")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == snapshot + change
+
+    async def test_should_return_500_when_stream_snapshot_cannot_be_loaded(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+    ):
+        """Given a broadcaster failing to load the waiting list
+        When a client opens the waiting list stream
+        Then a 500 should be returned instead of an empty stream
+        """
+
+        # Given
+        @contextlib.asynccontextmanager
+        async def subscribe():
+            raise PersistenceError("Database unavailable")
+            yield  # pylint: disable=W0101
+
+        payment_use_cases_mock["waiting_list_broadcaster"].subscribe = subscribe
+
+        # When
+        response = await test_app_client.get("/v1/preparation/waiting-list/stream")
+
+        # Then
+        assert response.status_code == 500
+
+    async def test_should_answer_poll_at_once_when_waiting_list_differs(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a client that has not seen the current waiting list
+        When it polls the waiting list with an older version
+        Then the current waiting list should be returned at once with its ETag
+        """
+
+        # Given
+        broadcaster = payment_use_cases_mock["waiting_list_broadcaster"]
+        broadcaster.next_change.return_value = asyncio.Event()
+        broadcaster.load_waiting_list = mocker.AsyncMock(
+            return_value=[
+                PreparationOut(
+                    id="A001",
+                    preparation_position=1,
+                    preparation_time=15,
+                    preparation_status=PreparationStatus.RECEIVED,
+                    created_at=datetime(2025, 11, 26, 14, 0, 0),
+                    timestamp=datetime(2025, 11, 26, 14, 0, 0),
+                )
+            ]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list/poll", params={"version": 'W/"old"'}
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["items"][0]["id"] == "A001"
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Cache-Control"] == "no-store"
+        broadcaster.load_waiting_list.assert_awaited_once()
+
+    async def test_should_hold_poll_until_waiting_list_changes(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a client that has seen the current waiting list
+        When it polls the waiting list with that version and a preparation changes
+        Then the changed waiting list should be returned with a new ETag
+        """
+
+        # Given
+        preparation = PreparationOut(
+            id="A001",
+            preparation_position=1,
+            preparation_time=15,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=datetime(2025, 11, 26, 14, 0, 0),
+            timestamp=datetime(2025, 11, 26, 14, 0, 0),
+        )
+        started_preparation = preparation.model_copy(
+            update={
+                "preparation_status": PreparationStatus.IN_PREPARATION,
+                "timestamp": datetime(2025, 11, 26, 14, 1, 0),
+            }
+        )
+
+        broadcaster = payment_use_cases_mock["waiting_list_broadcaster"]
+        broadcaster.load_waiting_list = mocker.AsyncMock(return_value=[preparation])
+        broadcaster.next_change.return_value = asyncio.Event()
+        first_response = await test_app_client.get("/v1/preparation/waiting-list/poll")
+        etag = first_response.headers["ETag"]
+
+        change = asyncio.Event()
+        change.set()
+        broadcaster.next_change.return_value = change
+        broadcaster.load_waiting_list = mocker.AsyncMock(
+            side_effect=[[preparation], [started_preparation]]
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list/poll",
+            params={"version": etag, "timeout": 5},
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["items"][0]["preparation_status"] == "IN_PREPARATION"
+        assert broadcaster.load_waiting_list.await_count == 2
+
+    async def test_should_return_304_when_waiting_list_does_not_change_in_time(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a client that has seen the current waiting list
+        When it polls the waiting list and nothing changes before the timeout
+        Then a 304 should be returned with the same ETag
+        """
+
+        # Given
+        broadcaster = payment_use_cases_mock["waiting_list_broadcaster"]
+        broadcaster.next_change.return_value = asyncio.Event()
+        broadcaster.load_waiting_list = mocker.AsyncMock(return_value=[])
+        first_response = await test_app_client.get("/v1/preparation/waiting-list/poll")
+        etag = first_response.headers["ETag"]
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/waiting-list/poll",
+            params={"timeout": 0.05},
+            headers={"If-None-Match": etag},
+        )
+
+        # Then
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+
+class TestGetChangesRoute:
+    """Test cases for the GET /v1/preparation/changes route"""
+
+    async def test_should_return_preparations_changed_since_given_time(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a preparation completed since the given time
+        When retrieving the changes via GET endpoint
+        Then the completed preparation should be returned with the next since
+        """
+
+        # Given
+        completed = PreparationOut(
+            id="A001",
+            preparation_time=15,
+            preparation_status=PreparationStatus.COMPLETED,
+            created_at=datetime(2025, 11, 26, 14, 0, 0),
+            timestamp=datetime(2025, 11, 26, 14, 20, 0),
+        )
+        payment_use_cases_mock["changes"].execute = mocker.AsyncMock(
+            return_value=([completed], datetime(2025, 11, 26, 14, 20, 5), False)
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/changes",
+            params={"since": "2025-11-26T14:10:00", "limit": 10},
+        )
+
+        # Then
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data["items"][0]["id"] == "A001"
+        assert response_data["items"][0]["preparation_status"] == "COMPLETED"
+        assert response_data["next_since"] == "2025-11-26T14:20:05"
+        assert response_data["resync"] is False
+        payment_use_cases_mock["changes"].execute.assert_awaited_once_with(
+            query=GetPreparationChangesQuery(
+                since=datetime(2025, 11, 26, 14, 10, 0), limit=10
+            )
+        )
+
+    async def test_should_return_422_when_since_is_missing(
+        self,
+        test_app_client: AsyncClient,
+    ):
+        """Given no time to list the changes since
+        When retrieving the changes via GET endpoint
+        Then a 422 should be returned
+        """
+
+        # When
+        response = await test_app_client.get("/v1/preparation/changes")
+
+        # Then
+        assert response.status_code == 422
+
+    async def test_should_return_500_when_persistence_error_occurs_getting_changes(
+        self,
+        test_app_client: AsyncClient,
+        payment_use_cases_mock: dict,
+        mocker: MockerFixture,
+    ):
+        """Given a persistence error while reading the changes
+        When retrieving the changes via GET endpoint
+        Then a 500 should be returned
+        """
+
+        # Given
+        payment_use_cases_mock["changes"].execute = mocker.AsyncMock(
+            side_effect=PersistenceError("Database unavailable")
+        )
+
+        # When
+        response = await test_app_client.get(
+            "/v1/preparation/changes", params={"since": "2025-11-26T14:10:00"}
+        )
+
+        # Then
+        assert response.status_code == 500
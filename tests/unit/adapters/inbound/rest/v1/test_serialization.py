@@ -0,0 +1,213 @@
+# pylint: disable=W0621
+
+"""Unit tests for the REST API v1 serialization"""
+
+import json
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.inbound.rest.v1.schemas import (
+    PreparationChangesV1,
+    PreparationListV1,
+)
+from preparation_api.adapters.inbound.rest.v1.serialization import (
+    WaitingListRenderer,
+    dump_preparation_changes_json,
+    dump_preparation_list_json,
+)
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+
+
+@pytest.fixture
+def waiting_list() -> list[PreparationOut]:
+    """Fixture to create a sample waiting list"""
+    return [
+        PreparationOut(
+            id="A001",
+            preparation_position=None,
+            preparation_time=10,
+            estimated_ready_time=datetime(2024, 1, 1, 10, 10, 0),
+            preparation_status=PreparationStatus.IN_PREPARATION,
+            created_at=datetime(2024, 1, 1, 10, 0, 0),
+            timestamp=datetime(2024, 1, 1, 10, 0, 0, 123456),
+        ),
+        PreparationOut(
+            id="A002",
+            preparation_position=1,
+            preparation_time=15,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=datetime(2024, 1, 1, 10, 5, 0),
+            timestamp=datetime(2024, 1, 1, 10, 5, 0),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("next_cursor", [None, "eyJpZCI6IkEwMDIifQ=="])
+def test_should_serialize_preparation_list_as_response_model_would(
+    waiting_list: list[PreparationOut],
+    next_cursor: str | None,
+):
+    """Given a list of preparations
+    When serializing it straight from the entities
+    Then the JSON should be the same the PreparationListV1 response model produces
+    """
+
+    # Given
+    expected = jsonable_encoder(
+        PreparationListV1.model_validate(
+            {
+                "items": [preparation.model_dump() for preparation in waiting_list],
+                "next_cursor": next_cursor,
+            }
+        )
+    )
+
+    # When
+    body = dump_preparation_list_json(waiting_list, next_cursor=next_cursor)
+
+    # Then
+    assert json.loads(body) == expected
+
+
+@pytest.mark.parametrize("resync", [False, True])
+def test_should_serialize_preparation_changes_as_response_model_would(
+    waiting_list: list[PreparationOut],
+    resync: bool,
+):
+    """Given a list of changed preparations
+    When serializing it straight from the entities
+    Then the JSON should be the same the PreparationChangesV1 model produces
+    """
+
+    # Given
+    next_since = datetime(2024, 1, 1, 10, 5, 0, 250000)
+    expected = jsonable_encoder(
+        PreparationChangesV1.model_validate(
+            {
+                "items": [preparation.model_dump() for preparation in waiting_list],
+                "next_since": next_since,
+                "resync": resync,
+            }
+        )
+    )
+
+    # When
+    body = dump_preparation_changes_json(waiting_list, next_since, resync)
+
+    # Then
+    assert json.loads(body) == expected
+
+
+def test_should_reuse_rendered_waiting_list_while_it_is_the_same_list(
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list rendered once
+    When the same list is rendered again
+    Then the same body and ETag should be returned without rendering it again
+    """
+
+    # Given
+    renderer = WaitingListRenderer()
+    first_body, first_etag = renderer.render(waiting_list)
+
+    # When
+    body, etag = renderer.render(waiting_list)
+
+    # Then
+    assert body is first_body
+    assert etag == first_etag
+
+
+def test_should_reuse_rendering_of_an_unchanged_board_reloaded_into_a_new_list(
+    mocker: MockerFixture,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list rendered once
+    When an equal board reloaded into a new list is rendered
+    Then the same body and ETag should be returned without serializing it again
+    """
+
+    # Given
+    renderer = WaitingListRenderer()
+    first_body, first_etag = renderer.render(waiting_list)
+    dump = mocker.patch(
+        "preparation_api.adapters.inbound.rest.v1.serialization"
+        ".dump_preparation_list_json"
+    )
+
+    # When
+    body, etag = renderer.render([item.model_copy() for item in waiting_list])
+
+    # Then
+    assert body is first_body
+    assert etag == first_etag
+    dump.assert_not_called()
+
+
+def test_should_render_again_when_waiting_list_changes(
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list rendered once
+    When a new list with a changed preparation is rendered
+    Then a new body and ETag should be returned
+    """
+
+    # Given
+    renderer = WaitingListRenderer()
+    first_body, first_etag = renderer.render(waiting_list)
+    changed_waiting_list = [
+        waiting_list[0].model_copy(
+            update={
+                "preparation_status": PreparationStatus.READY,
+                "timestamp": datetime(2024, 1, 1, 10, 12, 0),
+            }
+        ),
+        waiting_list[1],
+    ]
+
+    # When
+    body, etag = renderer.render(changed_waiting_list)
+
+    # Then
+    assert body != first_body
+    assert etag != first_etag
+    assert json.loads(body)["items"][0]["preparation_status"] == "READY"
+
+
+def test_should_compress_waiting_list_once_per_board_and_coding(
+    mocker: MockerFixture,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list rendered with a coding once
+    When the same board is rendered with the same coding again, and then changes
+    Then it should only be compressed again once the board changes
+    """
+
+    # Given
+    compress = mocker.Mock(side_effect=lambda body, encoding: encoding.encode() + body)
+    renderer = WaitingListRenderer()
+    first_body = renderer.render_encoded(waiting_list, "gzip", compress)
+
+    # When
+    body = renderer.render_encoded(list(waiting_list), "gzip", compress)
+    other_coding_body = renderer.render_encoded(waiting_list, "deflate", compress)
+    changed_body = renderer.render_encoded(
+        [
+            waiting_list[0].model_copy(
+                update={"timestamp": datetime(2024, 1, 1, 10, 12, 0)}
+            ),
+            waiting_list[1],
+        ],
+        "gzip",
+        compress,
+    )
+
+    # Then
+    assert body is first_body
+    assert other_coding_body.startswith(b"deflate")
+    assert changed_body is not first_body
+    assert compress.call_count == 3
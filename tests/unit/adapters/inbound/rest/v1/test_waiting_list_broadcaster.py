@@ -0,0 +1,221 @@
+# pylint: disable=W0621
+
+"""Unit tests for WaitingListBroadcaster"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.inbound.rest.v1.waiting_list_broadcaster import (
+    WaitingListBroadcaster,
+)
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+
+
+def _preparation(
+    preparation_id: str,
+    status: PreparationStatus = PreparationStatus.RECEIVED,
+    position: int | None = 1,
+) -> PreparationOut:
+    return PreparationOut(
+        id=preparation_id,
+        preparation_position=position,
+        preparation_time=10,
+        preparation_status=status,
+        created_at=datetime(2024, 1, 1, 10, 0, 0),
+        timestamp=datetime(2024, 1, 1, 10, 0, 0),
+    )
+
+
+@pytest.fixture
+def settings(mocker: MockerFixture) -> MagicMock:
+    """Fixture to create a mock WaitingListStreamSettings for testing"""
+    mock_settings = mocker.Mock()
+    mock_settings.MAX_PENDING_CHANGES = 2
+    mock_settings.HEARTBEAT_SECONDS = 15.0
+    return mock_settings
+
+
+async def _publish(broadcaster: WaitingListBroadcaster):
+    task = asyncio.create_task(broadcaster.run())
+    broadcaster.notify_changed()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    task.cancel()
+
+
+async def test_should_send_snapshot_when_subscribing(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given a waiting list with a preparation
+    When a stream subscribes to the broadcaster
+    Then it should get a snapshot event with the whole waiting list
+    """
+
+    # Given
+    load_waiting_list = mocker.AsyncMock(return_value=[_preparation("A001")])
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=load_waiting_list, settings=settings
+    )
+
+    # When
+    async with broadcaster.subscribe() as (snapshot, changes):
+        # Then
+        assert snapshot.startswith(b'event: snapshot\ndata: {"items":[')
+        assert b'"id":"A001"' in snapshot
+        assert changes.empty()
+        assert broadcaster.subscriber_count == 1
+
+    assert broadcaster.subscriber_count == 0
+
+
+async def test_should_send_one_event_per_changed_preparation(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given a stream subscribed to the broadcaster
+    When preparations are created, started, moved and completed
+    Then the stream should get the matching event for each of them
+    """
+
+    # Given
+    load_waiting_list = mocker.AsyncMock(
+        side_effect=[
+            [
+                _preparation("A001", PreparationStatus.READY, None),
+                _preparation("A002", position=1),
+                _preparation("A003", position=2),
+            ],
+            [
+                _preparation("A002", PreparationStatus.IN_PREPARATION, None),
+                _preparation("A003", position=1),
+                _preparation("A004", position=2),
+            ],
+        ]
+    )
+
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=load_waiting_list, settings=settings
+    )
+
+    async with broadcaster.subscribe() as (_, changes):
+        # When
+        await _publish(broadcaster)
+
+        # Then
+        events = changes.get_nowait().decode()
+
+    assert 'event: started\ndata: {"id":"A002"' in events
+    assert 'event: updated\ndata: {"id":"A003"' in events
+    assert 'event: created\ndata: {"id":"A004"' in events
+    assert 'event: completed\ndata: {"id": "A001"}' in events
+
+
+async def test_should_load_waiting_list_once_per_change_for_all_streams(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given several streams subscribed to the broadcaster
+    When the preparations change
+    Then the waiting list should be loaded once and every stream should get the
+    same rendered change
+    """
+
+    # Given
+    load_waiting_list = mocker.AsyncMock(
+        side_effect=[[_preparation("A001")], [_preparation("A002")]]
+    )
+
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=load_waiting_list, settings=settings
+    )
+
+    async with broadcaster.subscribe() as (_, first_changes):
+        async with broadcaster.subscribe() as (_, second_changes):
+            # When
+            await _publish(broadcaster)
+
+            # Then
+            assert load_waiting_list.await_count == 2
+            assert first_changes.get_nowait() is second_changes.get_nowait()
+
+
+async def test_should_drop_stream_that_falls_behind(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given a stream that does not read its changes
+    When more changes happen than its buffer holds
+    Then it should be dropped with an empty change instead of buffering more
+    """
+
+    # Given
+    load_waiting_list = mocker.AsyncMock(
+        side_effect=[[_preparation(f"A{index:03d}")] for index in range(4)]
+    )
+
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=load_waiting_list, settings=settings
+    )
+
+    async with broadcaster.subscribe() as (_, changes):
+        # When
+        for _ in range(3):
+            await _publish(broadcaster)
+
+        # Then
+        assert broadcaster.subscriber_count == 0
+        assert changes.qsize() == 3
+        received = [changes.get_nowait() for _ in range(3)]
+        assert received[-1] == b""
+
+
+async def test_should_not_load_waiting_list_without_streams(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given a broadcaster without streams
+    When the preparations change
+    Then the waiting list should not be loaded
+    """
+
+    # Given
+    load_waiting_list = mocker.AsyncMock(return_value=[])
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=load_waiting_list, settings=settings
+    )
+
+    # When
+    await _publish(broadcaster)
+
+    # Then
+    load_waiting_list.assert_not_awaited()
+
+
+async def test_should_set_next_change_event_when_preparations_change(
+    mocker: MockerFixture,
+    settings: MagicMock,
+):
+    """Given a poll waiting for the next change of the preparations
+    When the preparations change
+    Then its event should be set and a new one handed to the polls that follow
+    """
+
+    # Given
+    broadcaster = WaitingListBroadcaster(
+        load_waiting_list=mocker.AsyncMock(return_value=[]), settings=settings
+    )
+    next_change = broadcaster.next_change()
+
+    # When
+    broadcaster.notify_changed()
+
+    # Then
+    assert next_change.is_set()
+    assert broadcaster.next_change() is not next_change
+    assert not broadcaster.next_change().is_set()
@@ -7,7 +7,7 @@ from httpx import HTTPStatusError, Request
 from pytest_mock import MockerFixture
 
 from preparation_api.adapters.out import APIOrderInfoProvider
-from preparation_api.domain.exceptions import OrderInfoProviderError
+from preparation_api.domain.exceptions import OrderInfoNotFound, OrderInfoProviderError
 from preparation_api.domain.value_objects import OrderInfo
 
 
@@ -16,7 +16,6 @@ def order_api_settings(mocker: MockerFixture):
     """Fixture to create a mock OrderAPISettings for testing"""
     mock_settings = mocker.Mock()
     mock_settings.BASE_URL = "http://order-api.service.local"
-    mock_settings.TIMEOUT = 15.0
     return mock_settings
 
 
@@ -61,7 +60,7 @@ async def test_should_get_order_info_when_order_api_responds_successfully(
     expected_order_info = OrderInfo(order_id=order_id, preparation_time=10)
     assert order_info == expected_order_info
     client.http_client.get.assert_awaited_once_with(
-        f"{client.base_url}/order/{order_id}", timeout=15.0
+        f"{client.base_url}/order/{order_id}"
     )
 
 
@@ -91,5 +90,37 @@ async def test_should_raise_order_info_provider_error_when_order_api_responds_wi
 
     assert "Failed to make GET request to Order API" in str(exc_info.value)
     client.http_client.get.assert_awaited_once_with(
-        f"{client.base_url}/order/{order_id}", timeout=15.0
+        f"{client.base_url}/order/{order_id}"
     )
+
+
+@pytest.mark.parametrize(
+    "status_code, expected_error",
+    [(404, OrderInfoNotFound), (500, OrderInfoProviderError)],
+)
+async def test_should_raise_order_info_not_found_only_when_order_api_responds_404(
+    mocker: MockerFixture,
+    client: APIOrderInfoProvider,
+    status_code: int,
+    expected_error: type[OrderInfoProviderError],
+):
+    """Given the Order API responds with an error status
+    When fetching order info
+    Then OrderInfoNotFound should be raised for a 404 only
+    """
+
+    # Given
+    mock_request = Request("GET", f"{client.base_url}/order/A002")
+    client.http_client.get = mocker.AsyncMock(
+        side_effect=HTTPStatusError(
+            message="Error",
+            request=mock_request,
+            response=mocker.Mock(status_code=status_code),
+        )
+    )
+
+    # When / Then
+    with pytest.raises(OrderInfoProviderError) as exc_info:
+        await client.get("A002")
+
+    assert type(exc_info.value) is expected_error
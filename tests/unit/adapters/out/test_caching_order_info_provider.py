@@ -0,0 +1,215 @@
+# pylint: disable=W0621
+
+"""Unit tests for CachingOrderInfoProvider adapter"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.out import CachingOrderInfoProvider
+from preparation_api.domain.exceptions import OrderInfoNotFound, OrderInfoProviderError
+from preparation_api.domain.value_objects import OrderInfo
+
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fixture to provide a controllable clock"""
+    return FakeClock()
+
+
+@pytest.fixture
+def provider(mocker: MockerFixture) -> MagicMock:
+    """Fixture to create a mock OrderInfoProvider answering every order"""
+    mock_provider = mocker.Mock()
+    mock_provider.get = mocker.AsyncMock(
+        side_effect=lambda order_id: OrderInfo(order_id=order_id, preparation_time=10)
+    )
+    return mock_provider
+
+
+@pytest.fixture
+def cache(provider: MagicMock, clock: FakeClock) -> CachingOrderInfoProvider:
+    """Fixture to create a CachingOrderInfoProvider holding two orders"""
+    return CachingOrderInfoProvider(
+        provider=provider,
+        max_size=2,
+        ttl_seconds=60.0,
+        not_found_ttl_seconds=5.0,
+        clock=clock,
+    )
+
+
+async def test_should_serve_order_info_from_cache_within_ttl(
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+    clock: FakeClock,
+):
+    """Given an order fetched once
+    When it is read again before the TTL expires
+    Then it should be served without fetching it again
+    """
+
+    # Given
+    await cache.get(order_id="A001")
+    clock.now = 59.0
+
+    # When
+    order_info = await cache.get(order_id="A001")
+
+    # Then
+    assert order_info == OrderInfo(order_id="A001", preparation_time=10)
+    provider.get.assert_awaited_once_with(order_id="A001")
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+    assert cache.stats().hit_rate == 0.5
+
+
+async def test_should_fetch_order_info_again_once_ttl_expires(
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+    clock: FakeClock,
+):
+    """Given an order fetched once
+    When it is read again after the TTL expires
+    Then it should be fetched again
+    """
+
+    # Given
+    await cache.get(order_id="A001")
+    clock.now = 60.0
+
+    # When
+    await cache.get(order_id="A001")
+
+    # Then
+    assert provider.get.await_count == 2
+
+
+async def test_should_evict_least_recently_used_order_when_full(
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+):
+    """Given a full cache whose oldest order was read recently
+    When a new order is fetched
+    Then the least recently used order should be evicted
+    """
+
+    # Given
+    await cache.get(order_id="A001")
+    await cache.get(order_id="A002")
+    await cache.get(order_id="A001")
+
+    # When
+    await cache.get(order_id="A003")
+
+    # Then
+    provider.get.reset_mock()
+    await cache.get(order_id="A001")
+    await cache.get(order_id="A003")
+    provider.get.assert_not_awaited()
+
+    await cache.get(order_id="A002")
+    provider.get.assert_awaited_once_with(order_id="A002")
+
+
+async def test_should_remember_orders_not_found_for_a_short_time(
+    mocker: MockerFixture,
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+    clock: FakeClock,
+):
+    """Given an order the provider does not find
+    When it is read again within and after the not found TTL
+    Then the not found should be served from the cache and then fetched again
+    """
+
+    # Given
+    provider.get = mocker.AsyncMock(side_effect=OrderInfoNotFound("Not found A404"))
+    with pytest.raises(OrderInfoNotFound):
+        await cache.get(order_id="A404")
+
+    # When / Then
+    clock.now = 4.0
+    with pytest.raises(OrderInfoNotFound) as exc_info:
+        await cache.get(order_id="A404")
+
+    assert "Not found A404" in str(exc_info.value)
+    provider.get.assert_awaited_once_with(order_id="A404")
+
+    clock.now = 5.0
+    with pytest.raises(OrderInfoNotFound):
+        await cache.get(order_id="A404")
+
+    assert provider.get.await_count == 2
+
+
+async def test_should_not_cache_other_provider_errors(
+    mocker: MockerFixture,
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+):
+    """Given an Order API failing once with an error other than not found
+    When the order is read again
+    Then it should be fetched again
+    """
+
+    # Given
+    provider.get = mocker.AsyncMock(
+        side_effect=[
+            OrderInfoProviderError("Order API unavailable"),
+            OrderInfo(order_id="A001", preparation_time=10),
+        ]
+    )
+
+    with pytest.raises(OrderInfoProviderError):
+        await cache.get(order_id="A001")
+
+    # When
+    order_info = await cache.get(order_id="A001")
+
+    # Then
+    assert order_info.preparation_time == 10
+    assert provider.get.await_count == 2
+
+
+async def test_should_share_a_single_fetch_between_concurrent_reads(
+    mocker: MockerFixture,
+    provider: MagicMock,
+    cache: CachingOrderInfoProvider,
+):
+    """Given an order not cached yet
+    When it is read concurrently, as duplicated messages would
+    Then it should be fetched only once
+    """
+
+    # Given
+    fetched = asyncio.Event()
+
+    async def fetch(order_id: str) -> OrderInfo:
+        await fetched.wait()
+        return OrderInfo(order_id=order_id, preparation_time=10)
+
+    provider.get = mocker.AsyncMock(side_effect=fetch)
+
+    # When
+    reads = asyncio.gather(*(cache.get(order_id="A001") for _ in range(3)))
+    await asyncio.sleep(0)
+    fetched.set()
+    orders = await reads
+
+    # Then
+    assert orders == [OrderInfo(order_id="A001", preparation_time=10)] * 3
+    provider.get.assert_awaited_once_with(order_id="A001")
+    assert cache.stats().coalesced == 2
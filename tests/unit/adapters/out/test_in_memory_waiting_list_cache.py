@@ -0,0 +1,215 @@
+# pylint: disable=W0621
+
+"""Unit tests for InMemoryWaitingListCache adapter"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.adapters.out import InMemoryWaitingListCache
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.exceptions import PersistenceError
+from preparation_api.domain.value_objects import PreparationStatus
+
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fixture to provide a controllable clock"""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> InMemoryWaitingListCache:
+    """Fixture to create an InMemoryWaitingListCache with a one second TTL"""
+    return InMemoryWaitingListCache(ttl_seconds=1.0, clock=clock)
+
+
+@pytest.fixture
+def waiting_list() -> list[PreparationOut]:
+    """Fixture to create a sample waiting list"""
+    return [
+        PreparationOut(
+            id="A001",
+            preparation_position=1,
+            preparation_time=10,
+            preparation_status=PreparationStatus.RECEIVED,
+            created_at=datetime(2024, 1, 1, 10, 0, 0),
+            timestamp=datetime(2024, 1, 1, 10, 0, 0),
+        )
+    ]
+
+
+async def test_should_serve_waiting_list_from_cache_within_ttl(
+    mocker: MockerFixture,
+    cache: InMemoryWaitingListCache,
+    clock: FakeClock,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list loaded into the cache
+    When it is read again before the TTL expires
+    Then it should be served without loading it again
+    """
+
+    # Given
+    loader = mocker.AsyncMock(return_value=waiting_list)
+    await cache.get_or_load(loader)
+    clock.now = 0.5
+
+    # When
+    result = await cache.get_or_load(loader)
+
+    # Then
+    assert result == waiting_list
+    loader.assert_awaited_once()
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+async def test_should_load_waiting_list_again_after_ttl_expires(
+    mocker: MockerFixture,
+    cache: InMemoryWaitingListCache,
+    clock: FakeClock,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list loaded into the cache
+    When it is read again after the TTL expires
+    Then it should be loaded again
+    """
+
+    # Given
+    loader = mocker.AsyncMock(return_value=waiting_list)
+    await cache.get_or_load(loader)
+    clock.now = 1.0
+
+    # When
+    await cache.get_or_load(loader)
+
+    # Then
+    assert loader.await_count == 2
+    assert cache.stats().hits == 0
+    assert cache.stats().misses == 2
+
+
+async def test_should_load_waiting_list_again_after_invalidation(
+    mocker: MockerFixture,
+    cache: InMemoryWaitingListCache,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list loaded into the cache
+    When the cache is invalidated and the waiting list read again
+    Then it should be loaded again
+    """
+
+    # Given
+    loader = mocker.AsyncMock(return_value=waiting_list)
+    await cache.get_or_load(loader)
+
+    # When
+    cache.invalidate()
+    await cache.get_or_load(loader)
+
+    # Then
+    assert loader.await_count == 2
+
+
+async def test_should_coalesce_concurrent_reads_into_one_load(
+    cache: InMemoryWaitingListCache,
+    waiting_list: list[PreparationOut],
+):
+    """Given an empty cache
+    When the waiting list is read concurrently while it is being loaded
+    Then it should be loaded once and every read should get it
+    """
+
+    # Given
+    release = asyncio.Event()
+    load_count = 0
+
+    async def loader() -> list[PreparationOut]:
+        nonlocal load_count
+        load_count += 1
+        await release.wait()
+        return waiting_list
+
+    # When
+    reads = [asyncio.create_task(cache.get_or_load(loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*reads)
+
+    # Then
+    assert load_count == 1
+    assert all(result == waiting_list for result in results)
+    assert cache.stats().misses == 1
+    assert cache.stats().coalesced == 4
+
+
+async def test_should_not_keep_waiting_list_loaded_across_invalidation(
+    mocker: MockerFixture,
+    cache: InMemoryWaitingListCache,
+    waiting_list: list[PreparationOut],
+):
+    """Given a waiting list being loaded
+    When the cache is invalidated before the load finishes
+    Then the loaded waiting list should be returned but not kept
+    """
+
+    # Given
+    release = asyncio.Event()
+
+    async def stale_loader() -> list[PreparationOut]:
+        await release.wait()
+        return waiting_list
+
+    read = asyncio.create_task(cache.get_or_load(stale_loader))
+    await asyncio.sleep(0)
+
+    # When
+    cache.invalidate()
+    release.set()
+    result = await read
+
+    # Then
+    assert result == waiting_list
+    loader = mocker.AsyncMock(return_value=[])
+    assert await cache.get_or_load(loader) == []
+    loader.assert_awaited_once()
+
+
+async def test_should_propagate_load_error_to_coalesced_reads(
+    cache: InMemoryWaitingListCache,
+):
+    """Given concurrent reads of an empty cache
+    When the load fails
+    Then every read should get the error and nothing should be cached
+    """
+
+    # Given
+    release = asyncio.Event()
+
+    async def loader() -> list[PreparationOut]:
+        await release.wait()
+        raise PersistenceError("Database unavailable")
+
+    # When
+    reads = [asyncio.create_task(cache.get_or_load(loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*reads, return_exceptions=True)
+
+    # Then
+    assert all(isinstance(result, PersistenceError) for result in results)
+    assert cache.stats().misses == 1
+    assert cache.stats().coalesced == 2
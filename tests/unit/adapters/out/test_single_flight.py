@@ -0,0 +1,130 @@
+"""Unit tests for the SingleFlight helper of the out adapters"""
+
+import asyncio
+
+from preparation_api.adapters.out.single_flight import SingleFlight
+
+
+async def test_should_share_a_call_between_concurrent_reads_of_a_key():
+    """Given concurrent reads of two keys missing their lookup
+    When the calls are in progress
+    Then a single call should be made per key and shared by its reads
+    """
+
+    # Given
+    single_flight: SingleFlight[str, str] = SingleFlight()
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def call(key: str) -> str:
+        calls.append(key)
+        await release.wait()
+        return key.lower()
+
+    # When
+    reads = [
+        asyncio.create_task(
+            single_flight.run(key, lookup=lambda: None, call=lambda k=key: call(k))
+        )
+        for key in ("A", "A", "B", "A")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*reads)
+
+    # Then
+    assert results == ["a", "a", "b", "a"]
+    assert calls == ["A", "B"]
+    assert single_flight.calls == 2
+    assert single_flight.coalesced == 2
+
+
+async def test_should_not_call_when_lookup_finds_the_result():
+    """Given a lookup that finds the result of the key
+    When reading the key
+    Then the result should be returned without calling
+    """
+
+    # Given
+    single_flight: SingleFlight[str, str] = SingleFlight()
+
+    async def call() -> str:
+        raise AssertionError("Should not be called")
+
+    # When
+    result = await single_flight.run("A", lookup=lambda: "kept", call=call)
+
+    # Then
+    assert result == "kept"
+    assert single_flight.calls == 0
+
+
+async def test_should_let_waiting_reads_retry_when_the_starting_read_is_cancelled():
+    """Given reads waiting for the call started by another read
+    When the read that started the call is cancelled
+    Then the waiting reads should make a new call instead of being cancelled
+    """
+
+    # Given
+    single_flight: SingleFlight[str, str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def call() -> str:
+        await release.wait()
+        return "a"
+
+    starting_read = asyncio.create_task(
+        single_flight.run("A", lookup=lambda: None, call=call)
+    )
+    await asyncio.sleep(0)
+    waiting_read = asyncio.create_task(
+        single_flight.run("A", lookup=lambda: None, call=call)
+    )
+    await asyncio.sleep(0)
+
+    # When
+    starting_read.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    # Then
+    assert await waiting_read == "a"
+    assert starting_read.cancelled()
+    assert single_flight.calls == 2
+
+
+async def test_should_start_a_new_call_once_the_key_is_forgotten():
+    """Given a read waiting for a call in progress
+    When the key is forgotten and read again
+    Then the new read should make its own call while the first one still gets the
+    result of the call it waited for
+    """
+
+    # Given
+    single_flight: SingleFlight[str, str] = SingleFlight()
+    release = asyncio.Event()
+    results = iter(["stale", "fresh"])
+
+    async def call() -> str:
+        result = next(results)
+        await release.wait()
+        return result
+
+    first_read = asyncio.create_task(
+        single_flight.run("A", lookup=lambda: None, call=call)
+    )
+    await asyncio.sleep(0)
+
+    # When
+    single_flight.forget("A")
+    second_read = asyncio.create_task(
+        single_flight.run("A", lookup=lambda: None, call=call)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    # Then
+    assert await first_read == "stale"
+    assert await second_read == "fresh"
+    assert single_flight.calls == 2
+    assert single_flight.coalesced == 0
@@ -0,0 +1,86 @@
+# pylint: disable=W0621
+
+"""Unit tests for ArchiveCompletedPreparationsUseCase"""
+
+from datetime import timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.application.use_cases import ArchiveCompletedPreparationsUseCase
+from preparation_api.domain.exceptions import PersistenceError
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> ArchiveCompletedPreparationsUseCase:
+    """Fixture for ArchiveCompletedPreparationsUseCase with mocked dependencies"""
+    preparation_repository = mocker.Mock()
+    return ArchiveCompletedPreparationsUseCase(
+        preparation_repository=preparation_repository,
+        retention=timedelta(days=30),
+        batch_size=100,
+    )
+
+
+async def test_should_archive_batches_until_one_comes_back_short(
+    mocker: MockerFixture,
+    use_case: ArchiveCompletedPreparationsUseCase,
+):
+    """Given more completed preparations past the retention window than a batch
+    When executing the use case
+    Then batches should be archived until one comes back short
+    """
+
+    # Given
+    use_case.preparation_repository.archive_completed = mocker.AsyncMock(
+        side_effect=[100, 100, 42]
+    )
+
+    # When
+    archived_count = await use_case.execute()
+
+    # Then
+    assert archived_count == 242
+    assert use_case.preparation_repository.archive_completed.await_count == 3
+    use_case.preparation_repository.archive_completed.assert_awaited_with(
+        retention=timedelta(days=30), limit=100
+    )
+
+
+async def test_should_stop_when_nothing_is_left_to_archive(
+    mocker: MockerFixture,
+    use_case: ArchiveCompletedPreparationsUseCase,
+):
+    """Given no completed preparation past the retention window
+    When executing the use case
+    Then a single batch should be attempted and nothing should be archived
+    """
+
+    # Given
+    use_case.preparation_repository.archive_completed = mocker.AsyncMock(return_value=0)
+
+    # When
+    archived_count = await use_case.execute()
+
+    # Then
+    assert archived_count == 0
+    use_case.preparation_repository.archive_completed.assert_awaited_once()
+
+
+async def test_should_propagate_persistence_error_when_archiving_fails(
+    mocker: MockerFixture,
+    use_case: ArchiveCompletedPreparationsUseCase,
+):
+    """Given a repository failing to archive a batch
+    When executing the use case
+    Then the PersistenceError should be propagated
+    """
+
+    # Given
+    use_case.preparation_repository.archive_completed = mocker.AsyncMock(
+        side_effect=PersistenceError("Database error")
+    )
+
+    # When / Then
+    with pytest.raises(PersistenceError):
+        await use_case.execute()
@@ -10,6 +10,7 @@ from pytest_mock import MockerFixture
 from preparation_api.application.commands import CreatePreparationFromPaymentCommand
 from preparation_api.application.use_cases import CreatePreparationFromPaymentUseCase
 from preparation_api.domain.entities import PreparationIn, PreparationOut
+from preparation_api.domain.exceptions import AlreadyExists
 from preparation_api.domain.value_objects import OrderInfo, PreparationStatus
 
 
@@ -48,11 +49,9 @@ async def test_should_create_preparation_from_payment_when_it_does_not_exist(
     """
 
     # Given
-    max_position = 5
     expected_position = 6
     preparation_in_mock = PreparationIn(
         id="A001",
-        preparation_position=expected_position,
         preparation_time=15,
         preparation_status=PreparationStatus.RECEIVED,
     )
@@ -60,18 +59,15 @@ async def test_should_create_preparation_from_payment_when_it_does_not_exist(
     preparation_out_mock = PreparationOut.model_validate(
         {
             **preparation_in_mock.model_dump(),
+            "preparation_position": expected_position,
             "created_at": datetime(2024, 1, 1, 12, 0, 0),
             "timestamp": datetime(2024, 1, 1, 12, 0, 0),
         }
     )
 
-    use_case.preparation_repository.exists_by_id = mocker.AsyncMock(return_value=False)
+    use_case.preparation_repository.exists_by_id = mocker.AsyncMock()
     use_case.order_info_provider.get = mocker.AsyncMock(return_value=order_info)
-    use_case.preparation_repository.find_max_position = mocker.AsyncMock(
-        return_value=max_position
-    )
-
-    use_case.preparation_repository.save = mocker.AsyncMock(
+    use_case.preparation_repository.enqueue = mocker.AsyncMock(
         return_value=preparation_out_mock
     )
 
@@ -86,16 +82,12 @@ async def test_should_create_preparation_from_payment_when_it_does_not_exist(
     assert isinstance(created_preparation.created_at, datetime)
     assert isinstance(created_preparation.timestamp, datetime)
 
-    use_case.preparation_repository.exists_by_id.assert_awaited_once_with(
-        command.payment_id
-    )
-
+    use_case.preparation_repository.exists_by_id.assert_not_awaited()
     use_case.order_info_provider.get.assert_awaited_once_with(
         order_id=command.payment_id
     )
 
-    use_case.preparation_repository.find_max_position.assert_awaited_once_with()
-    use_case.preparation_repository.save.assert_awaited_once_with(
+    use_case.preparation_repository.enqueue.assert_awaited_once_with(
         preparation=preparation_in_mock
     )
 
@@ -104,20 +96,21 @@ async def test_should_not_create_preparation_when_it_already_exists(
     mocker: MockerFixture,
     use_case: CreatePreparationFromPaymentUseCase,
     command: CreatePreparationFromPaymentCommand,
+    order_info: OrderInfo,
 ):
     """Given a valid command to create a preparation from a payment
     When executing the use case and the preparation already exists
-    Then a ValueError should be raised
+    Then an AlreadyExists error should be raised
     """
 
     # Given
-    use_case.preparation_repository.exists_by_id = mocker.AsyncMock(return_value=True)
-    use_case.order_info_provider.get = mocker.AsyncMock()
-    use_case.preparation_repository.find_max_position = mocker.AsyncMock()
-    use_case.preparation_repository.save = mocker.AsyncMock()
+    use_case.order_info_provider.get = mocker.AsyncMock(return_value=order_info)
+    use_case.preparation_repository.enqueue = mocker.AsyncMock(
+        side_effect=AlreadyExists("Preparation with ID A001 already exists")
+    )
 
     # When / Then
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(AlreadyExists) as exc_info:
         await use_case.execute(command=command)
 
     assert (
@@ -125,10 +118,4 @@ async def test_should_not_create_preparation_when_it_already_exists(
         == f"Preparation for payment ID {command.payment_id} already exists"
     )
 
-    use_case.preparation_repository.exists_by_id.assert_awaited_once_with(
-        command.payment_id
-    )
-
-    use_case.order_info_provider.get.assert_not_awaited()
-    use_case.preparation_repository.find_max_position.assert_not_awaited()
-    use_case.preparation_repository.save.assert_not_awaited()
+    use_case.preparation_repository.enqueue.assert_awaited_once()
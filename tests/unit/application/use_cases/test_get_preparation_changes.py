@@ -0,0 +1,132 @@
+# pylint: disable=W0621
+
+"""Unit tests for GetPreparationChangesUseCase"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.application.queries import GetPreparationChangesQuery
+from preparation_api.application.use_cases import GetPreparationChangesUseCase
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> GetPreparationChangesUseCase:
+    """Fixture for GetPreparationChangesUseCase with mocked dependencies"""
+    preparation_repository = mocker.Mock()
+    return GetPreparationChangesUseCase(
+        preparation_repository=preparation_repository,
+        settle_time=timedelta(seconds=5),
+    )
+
+
+def _preparation(preparation_id: str, timestamp: datetime) -> PreparationOut:
+    return PreparationOut(
+        id=preparation_id,
+        preparation_time=10,
+        preparation_status=PreparationStatus.COMPLETED,
+        created_at=datetime(2025, 11, 26, 14, 0, 0),
+        timestamp=timestamp,
+    )
+
+
+async def test_should_return_changes_and_settled_next_since(
+    mocker: MockerFixture,
+    use_case: GetPreparationChangesUseCase,
+):
+    """Given preparations changed since the given time
+    When executing the use case
+    Then the changes should be returned with a next since before the settle time
+    """
+
+    # Given
+    changed = _preparation("A001", datetime(2025, 11, 26, 14, 0, 30))
+    use_case.preparation_repository.get_changed_since = mocker.AsyncMock(
+        return_value=([changed], datetime(2025, 11, 26, 14, 1, 0))
+    )
+
+    query = GetPreparationChangesQuery(since=datetime(2025, 11, 26, 14, 0, 0), limit=2)
+
+    # When
+    preparations, next_since, resync = await use_case.execute(query=query)
+
+    # Then
+    assert preparations == [changed]
+    assert next_since == datetime(2025, 11, 26, 14, 0, 55)
+    assert not resync
+    use_case.preparation_repository.get_changed_since.assert_awaited_once_with(
+        since=datetime(2025, 11, 26, 14, 0, 0), limit=3
+    )
+
+
+async def test_should_not_move_next_since_back_when_polled_within_settle_time(
+    mocker: MockerFixture,
+    use_case: GetPreparationChangesUseCase,
+):
+    """Given a time to list the changes since within the settle time
+    When executing the use case
+    Then the next since should stay at the given time
+    """
+
+    # Given
+    use_case.preparation_repository.get_changed_since = mocker.AsyncMock(
+        return_value=([], datetime(2025, 11, 26, 14, 1, 0))
+    )
+
+    query = GetPreparationChangesQuery(since=datetime(2025, 11, 26, 14, 0, 58), limit=2)
+
+    # When
+    _, next_since, _ = await use_case.execute(query=query)
+
+    # Then
+    assert next_since == datetime(2025, 11, 26, 14, 0, 58)
+
+
+async def test_should_ask_for_resync_when_there_are_too_many_changes(
+    mocker: MockerFixture,
+    use_case: GetPreparationChangesUseCase,
+):
+    """Given more preparations changed since the given time than the limit
+    When executing the use case
+    Then no change should be returned and a resync should be asked
+    """
+
+    # Given
+    use_case.preparation_repository.get_changed_since = mocker.AsyncMock(
+        return_value=(
+            [
+                _preparation(f"A00{index}", datetime(2025, 11, 26, 14, 0, index))
+                for index in range(1, 4)
+            ],
+            datetime(2025, 11, 26, 14, 1, 0),
+        )
+    )
+
+    query = GetPreparationChangesQuery(since=datetime(2025, 11, 26, 14, 0, 0), limit=2)
+
+    # When
+    preparations, next_since, resync = await use_case.execute(query=query)
+
+    # Then
+    assert preparations == []
+    assert next_since == datetime(2025, 11, 26, 14, 0, 55)
+    assert resync
+
+
+def test_should_convert_aware_since_to_naive_utc():
+    """Given a time to list the changes since with a timezone
+    When building the query
+    Then it should be converted to the naive UTC time the timestamps are stored in
+    """
+
+    # When
+    query = GetPreparationChangesQuery(
+        since=datetime(2025, 11, 26, 11, 0, 0, tzinfo=timezone(timedelta(hours=-3))),
+        limit=1,
+    )
+
+    # Then
+    assert query.since == datetime(2025, 11, 26, 14, 0, 0)
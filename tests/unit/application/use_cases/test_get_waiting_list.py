@@ -25,7 +25,7 @@ async def test_should_return_complete_waiting_list_combining_all_statuses(
 ):
     """Given that there are preparations in different statuses
     When executing the use case to get the waiting list
-    Then all preparations should be returned in a combined list
+    Then all preparations should be returned in a combined list read at once
     """
 
     # Given
@@ -63,13 +63,10 @@ async def test_should_return_complete_waiting_list_combining_all_statuses(
         )
     ]
 
-    repository.get_ready_waiting_list = mocker.AsyncMock(return_value=ready_list)
-    repository.get_in_preparation_waiting_list = mocker.AsyncMock(
-        return_value=in_preparation_list
+    repository.get_waiting_list = mocker.AsyncMock(
+        return_value=ready_list + in_preparation_list + received_list
     )
 
-    repository.get_received_waiting_list = mocker.AsyncMock(return_value=received_list)
-
     # When
     waiting_list = await use_case.execute()
 
@@ -78,6 +75,32 @@ async def test_should_return_complete_waiting_list_combining_all_statuses(
     assert waiting_list[0].id == "A001"
     assert waiting_list[1].id == "A002"
     assert waiting_list[2].id == "A003"
-    repository.get_ready_waiting_list.assert_awaited_once_with()
-    repository.get_in_preparation_waiting_list.assert_awaited_once_with()
-    repository.get_received_waiting_list.assert_awaited_once_with()
+    repository.get_waiting_list.assert_awaited_once_with()
+
+
+async def test_should_read_waiting_list_through_cache_when_one_is_set(
+    mocker: MockerFixture,
+):
+    """Given a use case with a waiting list cache
+    When executing the use case to get the waiting list
+    Then the waiting list should be read through the cache, loading it from the
+    repository
+    """
+
+    # Given
+    preparation_repository = mocker.Mock()
+    waiting_list_cache = mocker.Mock()
+    waiting_list_cache.get_or_load = mocker.AsyncMock(return_value=[])
+    use_case = GetWaitingListUseCase(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
+
+    # When
+    waiting_list = await use_case.execute()
+
+    # Then
+    assert waiting_list == []
+    waiting_list_cache.get_or_load.assert_awaited_once_with(
+        preparation_repository.get_waiting_list
+    )
@@ -0,0 +1,113 @@
+# pylint: disable=W0621
+
+"""Unit tests for GetWaitingListPageUseCase"""
+
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.application.queries import GetWaitingListPageQuery
+from preparation_api.application.use_cases import GetWaitingListPageUseCase
+from preparation_api.domain.entities import PreparationOut
+from preparation_api.domain.value_objects import PreparationStatus, WaitingListCursor
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> GetWaitingListPageUseCase:
+    """Fixture for GetWaitingListPageUseCase with mocked dependencies"""
+    preparation_repository = mocker.Mock()
+    return GetWaitingListPageUseCase(preparation_repository=preparation_repository)
+
+
+async def test_should_return_page_and_next_cursor_from_repository(
+    mocker: MockerFixture,
+    use_case: GetWaitingListPageUseCase,
+):
+    """Given a query for the ready preparations resuming from a cursor
+    When executing the use case
+    Then the page and the next cursor read by the repository should be returned
+    """
+
+    # Given
+    after = WaitingListCursor(
+        preparation_status=PreparationStatus.READY,
+        sort_key=datetime(2025, 11, 26, 14, 10, 0),
+        id="A001",
+    )
+
+    preparation = PreparationOut(
+        id="A002",
+        preparation_position=None,
+        preparation_time=10,
+        estimated_ready_time=None,
+        preparation_status=PreparationStatus.READY,
+        created_at=datetime(2025, 11, 26, 14, 0, 0),
+        timestamp=datetime(2025, 11, 26, 14, 20, 0),
+    )
+
+    next_cursor = WaitingListCursor(
+        preparation_status=PreparationStatus.READY,
+        sort_key=datetime(2025, 11, 26, 14, 20, 0),
+        id="A002",
+    )
+
+    use_case.preparation_repository.get_waiting_list_page = mocker.AsyncMock(
+        return_value=([preparation], next_cursor)
+    )
+
+    # When
+    page = await use_case.execute(
+        query=GetWaitingListPageQuery(
+            limit=1, preparation_status=PreparationStatus.READY, after=after
+        )
+    )
+
+    # Then
+    assert page == ([preparation], next_cursor)
+    use_case.preparation_repository.get_waiting_list_page.assert_awaited_once_with(
+        limit=1, preparation_status=PreparationStatus.READY, after=after
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        GetWaitingListPageQuery(
+            limit=10, preparation_status=PreparationStatus.COMPLETED
+        ),
+        GetWaitingListPageQuery(
+            limit=10,
+            preparation_status=PreparationStatus.READY,
+            after=WaitingListCursor(
+                preparation_status=PreparationStatus.RECEIVED, sort_key=3, id="A003"
+            ),
+        ),
+        GetWaitingListPageQuery(
+            limit=10,
+            after=WaitingListCursor(
+                preparation_status=PreparationStatus.COMPLETED,
+                sort_key=datetime(2025, 11, 26, 14, 0, 0),
+                id="A001",
+            ),
+        ),
+    ],
+)
+async def test_should_raise_value_error_when_query_is_outside_waiting_list(
+    query: GetWaitingListPageQuery,
+    mocker: MockerFixture,
+    use_case: GetWaitingListPageUseCase,
+):
+    """Given a query for completed preparations or with a cursor of another listing
+    When executing the use case
+    Then a ValueError should be raised without reading the repository
+    """
+
+    # Given
+    use_case.preparation_repository.get_waiting_list_page = mocker.AsyncMock()
+
+    # When / Then
+    with pytest.raises(ValueError):
+        await use_case.execute(query=query)
+
+    use_case.preparation_repository.get_waiting_list_page.assert_not_awaited()
@@ -0,0 +1,135 @@
+# pylint: disable=W0621
+
+"""Unit tests for ImportPreparationsFromPaymentsUseCase"""
+
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from preparation_api.application.commands import ImportPreparationsFromPaymentsCommand
+from preparation_api.application.use_cases import ImportPreparationsFromPaymentsUseCase
+from preparation_api.domain.entities import PreparationIn
+from preparation_api.domain.exceptions import OrderInfoProviderError
+from preparation_api.domain.value_objects import OrderInfo, PreparationStatus
+
+
+@pytest.fixture
+def use_case(mocker: MockerFixture) -> ImportPreparationsFromPaymentsUseCase:
+    """Fixture for ImportPreparationsFromPaymentsUseCase with mocked dependencies"""
+    preparation_repository = mocker.Mock()
+    order_info_provider = mocker.Mock()
+    return ImportPreparationsFromPaymentsUseCase(
+        preparation_repository=preparation_repository,
+        order_info_provider=order_info_provider,
+        max_concurrency=2,
+    )
+
+
+async def test_should_import_preparations_in_payment_order(
+    mocker: MockerFixture,
+    use_case: ImportPreparationsFromPaymentsUseCase,
+):
+    """Given a command with repeated payment IDs
+    When executing the use case
+    Then each payment order info should be fetched once and the preparations
+    should be saved at once in the order of the payments
+    """
+
+    # Given
+    command = ImportPreparationsFromPaymentsCommand(
+        payment_ids=["A003", "A001", "A003", "A002"]
+    )
+
+    async def get_order_info(order_id: str) -> OrderInfo:
+        # The first payments answer last, so the order cannot come from completion
+        await asyncio.sleep({"A003": 0.02, "A001": 0.01}.get(order_id, 0))
+        return OrderInfo(order_id=order_id, preparation_time=10)
+
+    use_case.order_info_provider.get = mocker.AsyncMock(side_effect=get_order_info)
+    use_case.preparation_repository.save_many = mocker.AsyncMock(
+        return_value=["A003", "A002"]
+    )
+
+    # When
+    imported_ids = await use_case.execute(command=command)
+
+    # Then
+    assert imported_ids == ["A003", "A002"]
+    assert use_case.order_info_provider.get.await_count == 3
+    use_case.preparation_repository.save_many.assert_awaited_once_with(
+        preparations=[
+            PreparationIn(
+                id=payment_id,
+                preparation_time=10,
+                preparation_status=PreparationStatus.RECEIVED,
+            )
+            for payment_id in ["A003", "A001", "A002"]
+        ]
+    )
+
+
+async def test_should_limit_concurrent_order_info_requests(
+    mocker: MockerFixture,
+    use_case: ImportPreparationsFromPaymentsUseCase,
+):
+    """Given a command with more payments than the maximum concurrency
+    When executing the use case
+    Then no more than the maximum concurrency of order info requests should run
+    at the same time
+    """
+
+    # Given
+    command = ImportPreparationsFromPaymentsCommand(
+        payment_ids=[f"A{index:03d}" for index in range(10)]
+    )
+
+    running = 0
+    max_running = 0
+
+    async def get_order_info(order_id: str) -> OrderInfo:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return OrderInfo(order_id=order_id, preparation_time=10)
+
+    use_case.order_info_provider.get = mocker.AsyncMock(side_effect=get_order_info)
+    use_case.preparation_repository.save_many = mocker.AsyncMock(
+        return_value=command.payment_ids
+    )
+
+    # When
+    await use_case.execute(command=command)
+
+    # Then
+    assert max_running == 2
+
+
+async def test_should_not_save_preparations_when_order_info_fails(
+    mocker: MockerFixture,
+    use_case: ImportPreparationsFromPaymentsUseCase,
+):
+    """Given a command where one payment order info cannot be fetched
+    When executing the use case
+    Then the OrderInfoProviderError should be raised and nothing should be saved
+    """
+
+    # Given
+    command = ImportPreparationsFromPaymentsCommand(payment_ids=["A001", "A002"])
+
+    async def get_order_info(order_id: str) -> OrderInfo:
+        if order_id == "A002":
+            raise OrderInfoProviderError("Order API unavailable")
+        return OrderInfo(order_id=order_id, preparation_time=10)
+
+    use_case.order_info_provider.get = mocker.AsyncMock(side_effect=get_order_info)
+    use_case.preparation_repository.save_many = mocker.AsyncMock()
+
+    # When / Then
+    with pytest.raises(OrderInfoProviderError) as exc_info:
+        await use_case.execute(command=command)
+
+    assert str(exc_info.value) == "Order API unavailable"
+    use_case.preparation_repository.save_many.assert_not_awaited()
@@ -116,3 +116,38 @@ async def test_should_raise_value_error_when_preparation_not_found(
     )
 
     use_case.preparation_repository.save.assert_not_awaited()
+
+
+async def test_should_invalidate_waiting_list_cache_when_preparation_is_ready(
+    mocker: MockerFixture,
+    command: MarkPreparationAsReadyCommand,
+):
+    """Given a use case with a waiting list cache
+    When a preparation is marked as ready
+    Then the cached waiting list should be invalidated
+    """
+
+    # Given
+    preparation_repository = mocker.Mock()
+    preparation_repository.find_by_id = mocker.AsyncMock(
+        return_value=PreparationOut(
+            id="A123",
+            preparation_position=1,
+            preparation_time=15,
+            preparation_status=PreparationStatus.IN_PREPARATION,
+            created_at=datetime(2024, 1, 1, 12, 0, 0),
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+        )
+    )
+    preparation_repository.save = mocker.AsyncMock()
+    waiting_list_cache = mocker.Mock()
+    use_case = MarkPreparationAsReadyUseCase(
+        preparation_repository=preparation_repository,
+        waiting_list_cache=waiting_list_cache,
+    )
+
+    # When
+    await use_case.execute(command=command)
+
+    # Then
+    waiting_list_cache.invalidate.assert_called_once_with()
@@ -5,11 +5,10 @@
 from datetime import datetime
 
 import pytest
-from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
 from preparation_api.application.use_cases import StartNextPreparationUseCase
-from preparation_api.domain.entities import PreparationIn, PreparationOut
+from preparation_api.domain.entities import PreparationOut
 from preparation_api.domain.exceptions import NotFound
 from preparation_api.domain.value_objects import PreparationStatus
 
@@ -21,27 +20,17 @@ def use_case(mocker: MockerFixture) -> StartNextPreparationUseCase:
     return StartNextPreparationUseCase(preparation_repository=preparation_repository)
 
 
-@freeze_time("2024-01-01T12:00:00Z")
 async def test_should_start_next_preparation_when_received_preparation_exists(
     mocker: MockerFixture,
     use_case: StartNextPreparationUseCase,
 ):
     """Given that there is a received preparation with minimum position
     When executing the use case to start the next preparation
-    Then the preparation should be started and positions should be decremented
+    Then the preparation should be claimed and started in a single repository call
     """
 
     # Given
-    found_preparation = PreparationOut(
-        id="A123",
-        preparation_position=1,
-        preparation_time=15,
-        preparation_status=PreparationStatus.RECEIVED,
-        created_at=datetime(2024, 1, 1, 12, 0, 0),
-        timestamp=datetime(2024, 1, 1, 12, 0, 0),
-    )
-
-    updated_preparation = PreparationOut(
+    started_preparation = PreparationOut(
         id="A123",
         preparation_position=None,
         preparation_time=15,
@@ -51,21 +40,10 @@ async def test_should_start_next_preparation_when_received_preparation_exists(
         timestamp=datetime(2024, 1, 1, 12, 5, 0),
     )
 
-    preparation_in_mock = PreparationIn(
-        id="A123",
-        preparation_position=None,
-        preparation_time=15,
-        estimated_ready_time=datetime(2024, 1, 1, 12, 15, 0),
-        preparation_status=PreparationStatus.IN_PREPARATION,
-    )
-
     repository = use_case.preparation_repository
-    repository.find_received_with_min_position = mocker.AsyncMock(
-        return_value=found_preparation
-    )
+    repository.start_next_received = mocker.AsyncMock(return_value=started_preparation)
 
-    repository.save = mocker.AsyncMock(return_value=updated_preparation)
-    repository.decrement_received_positions_greater_than = mocker.AsyncMock()
+    repository.save = mocker.AsyncMock()
 
     # When
     result_preparation = await use_case.execute()
@@ -74,11 +52,9 @@ async def test_should_start_next_preparation_when_received_preparation_exists(
     assert result_preparation.id == "A123"
     assert result_preparation.preparation_status == PreparationStatus.IN_PREPARATION
     assert result_preparation.preparation_position is None
-    repository.find_received_with_min_position.assert_awaited_once_with()
-    repository.save.assert_awaited_once_with(preparation=preparation_in_mock)
-    repository.decrement_received_positions_greater_than.assert_awaited_once_with(
-        preparation_position=1
-    )
+    repository.start_next_received.assert_awaited_once_with()
+
+    repository.save.assert_not_awaited()
 
 
 async def test_should_raise_value_error_when_no_received_preparation_found(
@@ -93,19 +69,14 @@ async def test_should_raise_value_error_when_no_received_preparation_found(
     # Given
     repository = use_case.preparation_repository
 
-    repository.find_received_with_min_position = mocker.AsyncMock(
+    repository.start_next_received = mocker.AsyncMock(
         side_effect=NotFound("No received preparation found")
     )
 
-    repository.save = mocker.AsyncMock()
-    repository.decrement_received_positions_greater_than = mocker.AsyncMock()
-
     # When / Then
     with pytest.raises(ValueError) as exc_info:
         await use_case.execute()
 
     assert str(exc_info.value) == "No received preparation found to start"
 
-    repository.find_received_with_min_position.assert_awaited_once_with()
-    repository.save.assert_not_awaited()
-    repository.decrement_received_positions_greater_than.assert_not_awaited()
+    repository.start_next_received.assert_awaited_once()
@@ -0,0 +1,149 @@
+# pylint: disable=W0621
+
+"""Unit tests for the HTTP client transport instrumentation and counters logging"""
+
+import asyncio
+import logging
+
+import httpcore
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from preparation_api.domain.value_objects import CacheStats
+from preparation_api.infrastructure.http import (
+    InstrumentedTransport,
+    log_order_api_stats,
+)
+
+
+class FakePool:
+    """Fake connection pool tracing the events a real pool would"""
+
+    def __init__(self, events: list[list[str]], pool_wait_seconds: float = 0.0):
+        self.events = events
+        self.pool_wait_seconds = pool_wait_seconds
+
+    async def handle_async_request(self, request: httpcore.Request):
+        await asyncio.sleep(self.pool_wait_seconds)
+        trace = request.extensions["trace"]
+        for event_name in self.events.pop(0):
+            await trace(event_name, {})
+
+        return httpcore.Response(200, content=b"{}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def transport() -> InstrumentedTransport:
+    """Fixture to create an InstrumentedTransport"""
+    return InstrumentedTransport()
+
+
+async def test_should_count_opened_and_reused_connections(
+    transport: InstrumentedTransport,
+):
+    """Given a pool opening a connection for the first request only
+    When two requests are sent
+    Then one opened and one reused connection should be counted
+    """
+
+    # Given
+    transport._pool = FakePool(  # pylint: disable=W0212
+        events=[
+            ["connection.connect_tcp.started", "http11.send_request_headers.started"],
+            ["http11.send_request_headers.started"],
+        ]
+    )
+
+    # When
+    async with AsyncClient(transport=transport) as client:
+        await client.get("http://order-api.service.local/order/A001")
+        await client.get("http://order-api.service.local/order/A002")
+
+    # Then
+    stats = transport.stats()
+    assert stats.requests == 2
+    assert stats.connections_opened == 1
+    assert stats.connections_reused == 1
+    assert stats.reuse_rate == 0.5
+
+
+async def test_should_measure_time_waiting_for_the_pool(
+    transport: InstrumentedTransport,
+):
+    """Given a pool making a request wait before handing it a connection
+    When the request is sent
+    Then the wait should be counted as pool wait and not as response time
+    """
+
+    # Given
+    transport._pool = FakePool(  # pylint: disable=W0212
+        events=[["http11.send_request_headers.started"]], pool_wait_seconds=0.05
+    )
+
+    # When
+    async with AsyncClient(transport=transport) as client:
+        await client.get("http://order-api.service.local/order/A001")
+
+    # Then
+    stats = transport.stats()
+    assert stats.pool_wait_seconds_max >= 0.05
+    assert stats.pool_wait_seconds_mean == stats.pool_wait_seconds_total
+    assert stats.response_seconds_total < 0.05
+
+
+async def test_should_keep_calling_the_trace_of_the_request(
+    transport: InstrumentedTransport,
+):
+    """Given a request with a trace extension of its own
+    When it is sent through the transport
+    Then its trace should still receive the pool events
+    """
+
+    # Given
+    transport._pool = FakePool(  # pylint: disable=W0212
+        events=[["http11.send_request_headers.started"]]
+    )
+    traced = []
+
+    async def trace(event_name, _info):
+        traced.append(event_name)
+
+    # When
+    async with AsyncClient(transport=transport) as client:
+        await client.get(
+            "http://order-api.service.local/order/A001",
+            extensions={"trace": trace},
+        )
+
+    # Then
+    assert traced == ["http11.send_request_headers.started"]
+
+
+def test_should_log_the_order_info_cache_and_order_api_pool_counters(
+    mocker: MockerFixture,
+    transport: InstrumentedTransport,
+    caplog: pytest.LogCaptureFixture,
+):
+    """Given an order info cache and an Order API transport
+    When logging the Order API counters
+    Then the counters of both should be logged
+    """
+
+    # Given
+    order_info_provider = mocker.Mock()
+    order_info_provider.stats.return_value = CacheStats(hits=3, misses=1, coalesced=0)
+
+    # When
+    with caplog.at_level(logging.INFO):
+        log_order_api_stats(order_info_provider, transport)
+
+    # Then
+    assert "Order info cache hits=3 misses=1 coalesced=0 hit_rate=0.75" in caplog.text
+    assert "Order API pool requests=0 reuse_rate=0.00" in caplog.text